@@ -0,0 +1,140 @@
+import io
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import pygame
+from audio import EFFECTS, SOUND_DIR, load_sound
+
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+
+# decode_ms is spent on a worker thread, finish_ms on the main thread
+Timing = namedtuple("Timing", "name kind size decode_ms finish_ms")
+
+class AssetLoader:
+    """Loads assets on a thread pool while the main thread shows progress.
+
+    Each asset has a decode step, run on the pool, and an optional finish
+    step, run on the main thread as soon as its decode is done. Decoding
+    does the file reading, image decompression and sound synthesis. Anything
+    that needs the display or SDL_ttf, which isn't thread safe, waits for
+    the finish step: convert() to the screen's pixel format, or opening a
+    font from the bytes a worker read. Between assets the main thread
+    redraws the loading screen and pumps events, so the window stays
+    responsive however long loading takes.
+    """
+
+    def __init__(self, workers=4):
+        self.workers = workers
+        self.tasks = []  # (name, kind, decode, finish)
+        self.assets = {}
+        self.timings = []
+
+    def add(self, name, kind, decode, finish=None):
+        """Queue an asset: decode() runs on the pool, finish(decoded) on the main thread"""
+        self.tasks.append((name, kind, decode, finish))
+
+    def image(self, name, path, alpha=False):
+        def finish(surface):
+            return surface.convert_alpha() if alpha else surface.convert()
+        self.add(name, "image", lambda: pygame.image.load(path), finish)
+
+    def sound(self, name, build, sound_dir=SOUND_DIR):
+        self.add(name, "sound", lambda: load_sound(name, build, sound_dir))
+
+    def font(self, name, path, size):
+        def decode():
+            with open(path, "rb") as file:
+                return file.read()
+        self.add(name, "font", decode, lambda data: pygame.font.Font(io.BytesIO(data), size))
+
+    def load(self, screen=None):
+        """Load every queued asset, updating the loading screen as they
+        arrive, and return them by name"""
+        if not self.tasks:
+            return self.assets
+        with ThreadPoolExecutor(self.workers) as pool:
+            pending = {pool.submit(timed, decode): (name, kind, finish)
+                       for name, kind, decode, finish in self.tasks}
+            while pending:
+                if screen:
+                    screen.draw(len(self.assets), len(self.tasks))
+                done, _ = wait(pending, timeout=1 / 60, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, kind, finish = pending.pop(future)
+                    value, decode_ms = future.result()
+                    start = time.perf_counter()
+                    if finish:
+                        value = finish(value)
+                    finish_ms = (time.perf_counter() - start) * 1000
+                    self.assets[name] = value
+                    self.timings.append(Timing(name, kind, size_of(value), decode_ms, finish_ms))
+        self.tasks = []
+        return self.assets
+
+    def report(self, output=sys.stdout):
+        """Write each asset's load times, slowest first"""
+        for timing in sorted(self.timings, key=lambda t: t.decode_ms + t.finish_ms, reverse=True):
+            output.write(f"{timing.name:<20} {timing.kind:<6} {timing.size / 1024:8.1f} KiB  "
+                         f"decode {timing.decode_ms:7.2f} ms  main thread {timing.finish_ms:6.2f} ms\n")
+        total = sum(t.decode_ms for t in self.timings)
+        output.write(f"{len(self.timings)} assets, {total:.1f} ms of decoding on {self.workers} workers\n")
+
+def timed(decode):
+    start = time.perf_counter()
+    value = decode()
+    return value, (time.perf_counter() - start) * 1000
+
+def size_of(value):
+    """Rough memory size of a loaded asset in bytes"""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, pygame.mixer.Sound):
+        return len(value.get_raw())
+    return 0
+
+class LoadingScreen:
+    """Progress bar shown while assets load. Closing the window stops the
+    game once loading is done."""
+
+    def __init__(self, game):
+        self.game = game
+
+    def draw(self, loaded, total):
+        game = self.game
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                game.running = False
+
+        surface = game.screen
+        surface.fill(game.BLACK)
+        text = game.font.render(f"Loading {loaded}/{total}", True, game.WHITE)
+        surface.blit(text, text.get_rect(center=(game.width // 2, game.height // 2 - 30)))
+        bar = pygame.Rect(0, 0, game.width // 2, 20)
+        bar.center = (game.width // 2, game.height // 2 + 10)
+        pygame.draw.rect(surface, game.WHITE, bar, 1)
+        pygame.draw.rect(surface, game.WHITE, (bar.x, bar.y, bar.width * loaded // total, bar.height))
+        game.display.present()
+
+def game_assets(audio_enabled, image_dir=IMAGE_DIR, font_dir=FONT_DIR):
+    """Loader for the game's sound effects, any images in images/ and the
+    HUD font.
+
+    images/background.png, if present, is drawn behind everything else, and
+    fonts/hud.ttf replaces the default HUD font.
+    """
+    loader = AssetLoader()
+    hud_font = os.path.join(font_dir, "hud.ttf")
+    if os.path.exists(hud_font):
+        loader.font("hud", hud_font, 36)
+    if audio_enabled:
+        for name, (_, build) in EFFECTS.items():
+            loader.sound(name, build)
+    if os.path.isdir(image_dir):
+        for filename in sorted(os.listdir(image_dir)):
+            name, extension = os.path.splitext(filename)
+            if extension.lower() == ".png":
+                loader.image(name, os.path.join(image_dir, filename), alpha=name != "background")
+    return loader
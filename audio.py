@@ -0,0 +1,114 @@
+import math
+import os
+import random
+from array import array
+import pygame
+from metrics import REGISTRY
+
+SOUNDS_PLAYED = REGISTRY.counter("sounds_played_total", "Sound effects started")
+SOUNDS_COALESCED = REGISTRY.counter("sounds_coalesced_total", "Sound triggers merged into one already due this tick")
+VOICES_STOLEN = REGISTRY.counter("voices_stolen_total", "Sounds cut short to stay within an effect's voice budget")
+
+SOUND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds")
+
+def tone(rate, seconds, start_hz, end_hz, volume=0.3):
+    """Square wave sweeping between two pitches, fading out"""
+    count = int(rate * seconds)
+    samples = []
+    phase = 0.0
+    for i in range(count):
+        progress = i / count
+        phase += (start_hz + (end_hz - start_hz) * progress) / rate
+        level = volume * (1 - progress)
+        samples.append(level if phase % 1 < 0.5 else -level)
+    return samples
+
+def noise(rate, seconds, volume=0.4):
+    """White noise with an exponential decay, like a small explosion"""
+    count = int(rate * seconds)
+    # Own generator, so sounds don't disturb the game's seeded random state
+    generator = random.Random(0)
+    return [volume * math.exp(-5 * i / count) * generator.uniform(-1, 1) for i in range(count)]
+
+# Effect name -> (maximum simultaneous voices, built-in sound)
+EFFECTS = {
+    "shoot": (4, lambda rate: tone(rate, 0.08, 880, 440)),
+    "explosion": (6, lambda rate: noise(rate, 0.25)),
+    "game_over": (1, lambda rate: tone(rate, 0.8, 440, 110)),
+}
+
+def load_sound(name, build, sound_dir=SOUND_DIR):
+    """Decode sounds/<name>.wav, or synthesise the effect if there's no file"""
+    path = os.path.join(sound_dir, name + ".wav")
+    if os.path.exists(path):
+        return pygame.mixer.Sound(path)
+    rate, size, channels = pygame.mixer.get_init()
+    if size != -16:
+        raise ValueError(f"can't synthesise {name!r} for a {size}-bit mixer")
+    # Mono samples to signed 16-bit, repeated for each output channel
+    pcm = array("h")
+    for sample in build(rate):
+        pcm.extend([int(sample * 32767)] * channels)
+    return pygame.mixer.Sound(buffer=pcm.tobytes())
+
+class Audio:
+    """Sound effects decoded once at startup and played on budgeted channels.
+
+    Each effect is loaded from sounds/<name>.wav if present, otherwise
+    synthesised, so nothing touches the disk during play. Every effect gets
+    its own channels, as many as its voice budget; when all are busy the one
+    that started longest ago is cut off. Effects triggered several times in a
+    tick, such as a volley of kills, are played once when flush() runs after
+    the tick.
+
+    Audio is off when the mixer didn't initialise. SDL_AUDIODRIVER=dummy
+    keeps it on but silent, for headless runs. Sounds already decoded, e.g.
+    by the AssetLoader, can be passed in by name.
+    """
+
+    def __init__(self, enabled=True, effects=EFFECTS, sound_dir=SOUND_DIR, sounds=None):
+        self.enabled = enabled and pygame.mixer.get_init() is not None
+        self.pending = []
+        self.sounds = {}
+        self.channels = {}  # Effect name -> its channels, least recently started first
+        if not self.enabled:
+            return
+
+        pygame.mixer.set_num_channels(sum(voices for voices, _ in effects.values()))
+        first = 0
+        for name, (voices, build) in effects.items():
+            if sounds and name in sounds:
+                self.sounds[name] = sounds[name]
+            else:
+                self.sounds[name] = load_sound(name, build, sound_dir)
+            self.channels[name] = [pygame.mixer.Channel(i) for i in range(first, first + voices)]
+            first += voices
+        # Keep Sound.play() and other users off the effect channels
+        pygame.mixer.set_reserved(first)
+
+    def play(self, name):
+        """Ask for an effect to play after the current tick"""
+        if not self.enabled:
+            return
+        if name in self.pending:
+            SOUNDS_COALESCED.inc()
+        else:
+            self.pending.append(name)
+
+    def flush(self):
+        """Start the effects triggered since the last flush"""
+        for name in self.pending:
+            channels = self.channels[name]
+            channel = next((c for c in channels if not c.get_busy()), None)
+            if channel is None:
+                channel = channels[0]
+                VOICES_STOLEN.inc()
+            channel.play(self.sounds[name])
+            channels.remove(channel)
+            channels.append(channel)
+            SOUNDS_PLAYED.inc()
+        self.pending.clear()
+
+    def discard(self):
+        """Drop triggered effects without playing them, e.g. after a replay seek"""
+        self.pending.clear()
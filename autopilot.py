@@ -0,0 +1,158 @@
+import random
+from abc import ABC, abstractmethod
+from controls import DOWN, FIRE, LEFT, RESTART, RIGHT, UP, Controls
+from enemy import Enemy
+from player import Player
+
+KEY_NAMES = {"up": UP, "down": DOWN, "left": LEFT, "right": RIGHT, "fire": FIRE}
+
+class Bot(ABC):
+    """Plays the game in place of the keyboard, for unattended load runs.
+
+    Game.handle_events asks the bot for each tick's controls, so everything
+    downstream (recording, replays, hashes) sees ordinary input. Bots use
+    their own random generator, never the game's, so a recorded bot session
+    replays exactly. They restart straight away after a game over, and stop
+    the game once it reaches `ticks` if given.
+    """
+
+    def __init__(self, seed=0, ticks=None):
+        self.random = random.Random(seed)
+        self.ticks = ticks
+
+    def controls(self, game):
+        if self.ticks is not None and game.tick >= self.ticks:
+            game.running = False
+        if game.game_over:
+            return Controls(RESTART)
+        return Controls(self.mask(game))
+
+    @abstractmethod
+    def mask(self, game):
+        """Input bits for this tick"""
+
+class RandomBot(Bot):
+    """Holds a random direction for a while and fires at random"""
+
+    def __init__(self, seed=0, ticks=None, hold=15, fire_chance=0.2):
+        super().__init__(seed, ticks)
+        self.hold = hold
+        self.fire_chance = fire_chance
+        self.direction = 0
+
+    def mask(self, game):
+        if game.tick % self.hold == 0:
+            self.direction = self.random.choice((0, UP, DOWN, LEFT, RIGHT, UP | LEFT, DOWN | RIGHT))
+        if self.random.random() < self.fire_chance:
+            return self.direction | FIRE
+        return self.direction
+
+class GreedyBot(Bot):
+    """Dodges the nearest enemy about to hit it, otherwise lines up with the
+    nearest enemy ahead and shoots it, at most every `fire_interval` ticks"""
+
+    def __init__(self, seed=0, ticks=None, danger=120, margin=10, fire_interval=8):
+        super().__init__(seed, ticks)
+        self.danger = danger  # Pixels ahead of the player an enemy is a threat
+        self.margin = margin  # Extra clearance kept above and below
+        self.fire_interval = fire_interval
+        self.last_fire = None
+
+    def mask(self, game):
+        player = game.player
+        front = player.x + Player.width
+        top, bottom = player.y - self.margin, player.y + Player.height + self.margin
+        threat = target = None
+        table = game.world.tables.get(Enemy.archetype)
+        if table is not None:
+            for x, y in zip(table.columns["x"], table.columns["y"]):
+                if x + Enemy.width < player.x:
+                    continue  # Already past
+                if x - front < self.danger and y < bottom and y + Enemy.height > top:
+                    if threat is None or x < threat[0]:
+                        threat = (x, y)
+                if target is None or x < target[0]:
+                    target = (x, y)
+
+        centre = player.y + Player.height // 2  # Where shots leave from
+        if threat:
+            # Move away from the threat, or through it if against an edge
+            away = UP if threat[1] + Enemy.height / 2 > centre else DOWN
+            if (away == UP and player.y <= 0) or (away == DOWN and player.y >= game.height - Player.height):
+                away ^= UP | DOWN
+            return away
+        if target is None:
+            return 0
+
+        offset = target[1] + Enemy.height / 2 - centre
+        mask = 0
+        if offset < -Player.speed:
+            mask = UP
+        elif offset > Player.speed:
+            mask = DOWN
+        if abs(offset) < Enemy.height / 2 and (
+                self.last_fire is None or game.tick - self.last_fire >= self.fire_interval):
+            self.last_fire = game.tick
+            mask |= FIRE
+        return mask
+
+class ScriptedBot(Bot):
+    """Plays a fixed list of (ticks, mask) steps, looping"""
+
+    SWEEP = [(40, UP | FIRE), (80, DOWN | FIRE), (40, UP | FIRE)]
+
+    def __init__(self, steps=None, seed=0, ticks=None):
+        super().__init__(seed, ticks)
+        self.steps = steps or self.SWEEP
+        self.length = sum(duration for duration, _ in self.steps)
+
+    def mask(self, game):
+        position = game.tick % self.length
+        for duration, mask in self.steps:
+            if position < duration:
+                return mask
+            position -= duration
+        return 0
+
+class StressBot(Bot):
+    """Fires every tick while sweeping the screen top to bottom, for the most
+    projectiles in flight across the whole play field"""
+
+    def __init__(self, seed=0, ticks=None):
+        super().__init__(seed, ticks)
+        self.direction = DOWN
+
+    def mask(self, game):
+        player = game.player
+        if player.y <= 0:
+            self.direction = DOWN
+        elif player.y >= game.height - Player.height:
+            self.direction = UP
+        return self.direction | FIRE
+
+BOTS = {
+    "random": RandomBot,
+    "greedy": GreedyBot,
+    "script": ScriptedBot,
+    "stress": StressBot,
+}
+
+def parse_script(text):
+    """Steps for ScriptedBot from "TICKS:KEYS ...", keys joined by +, e.g.
+    "30:up+fire 30:down+fire 10:none"
+    """
+    steps = []
+    for step in text.split():
+        duration, _, keys = step.partition(":")
+        mask = 0
+        for key in keys.split("+"):
+            if key != "none":
+                if key not in KEY_NAMES:
+                    raise ValueError(f"unknown key in script: {key}")
+                mask |= KEY_NAMES[key]
+        if int(duration) <= 0:
+            raise ValueError(f"script step must last at least a tick: {step}")
+        steps.append((int(duration), mask))
+    if not steps:
+        raise ValueError("empty script")
+    return steps
@@ -0,0 +1,101 @@
+import random
+import sys
+import time
+import pygame
+from controls import FIRE, FIRE_HELD, Controls
+from enemy import Enemy
+from projectile import Projectile
+from systems import SYSTEMS, render
+
+def top_up(game, enemies, projectiles):
+    """Spawn entities across the screen until the world holds the given counts"""
+    world = game.world
+    missing = enemies - len(game.enemies)
+    if missing > 0:
+        xs = [random.uniform(0, game.width) for _ in range(missing)]
+        world.spawn_many(
+            Enemy.archetype, x=xs, prev_x=list(xs),
+            y=[random.randint(50, game.height - 50) for _ in range(missing)],
+            vx=[-random.uniform(1.5, 3.0) for _ in range(missing)],
+        )
+    missing = projectiles - len(game.projectiles)
+    if missing > 0:
+        xs = [random.uniform(0, game.width) for _ in range(missing)]
+        ys = [random.randint(0, game.height) for _ in range(missing)]
+        world.spawn_many(
+            Projectile.archetype, x=xs, prev_x=list(xs), y=ys, prev_y=list(ys), vy=[0] * missing,
+        )
+
+def run_benchmark(game, enemies=1000, projectiles=1000, ticks=300, output=sys.stdout):
+    """Time the timer wheel and each system over a number of ticks with a crowded world.
+
+    The world is topped back up to the requested counts before every tick,
+    outside the timed region, so every tick measures the same load. Returns
+    the mean microseconds per tick for timers, each system, event dispatch
+    and rendering.
+    """
+    random.seed(0)
+    game.lives = ticks + 1  # Collisions with the player must not end the run
+    game.controls = Controls()
+    surface = pygame.Surface((game.width, game.height))
+    names = ["timers"] + [system.__name__ for system in SYSTEMS] + ["events", "render"]
+    totals = dict.fromkeys(names, 0.0)
+
+    for _ in range(ticks):
+        top_up(game, enemies, projectiles)
+        start = time.perf_counter()
+        game.timers.advance()
+        totals["timers"] += time.perf_counter() - start
+        for system in SYSTEMS:
+            start = time.perf_counter()
+            system(game)
+            totals[system.__name__] += time.perf_counter() - start
+        start = time.perf_counter()
+        game.events.dispatch()
+        totals["events"] += time.perf_counter() - start
+        start = time.perf_counter()
+        surface.fill(game.BLACK)
+        render(game.world, surface)
+        totals["render"] += time.perf_counter() - start
+
+    results = {name: total / ticks * 1e6 for name, total in totals.items()}
+    overall = sum(results.values())
+    output.write(f"{enemies} enemies, {projectiles} projectiles, {ticks} ticks\n")
+    for name, micros in results.items():
+        output.write(f"{name:<20} {micros:10.1f} us/tick {micros / overall:6.1%}\n")
+    output.write(f"{'total':<20} {overall:10.1f} us/tick\n")
+    return results
+
+def run_fire_stress(game, weapon="laser", enemies=100, ticks=600, output=sys.stdout):
+    """Hold the trigger of a weapon for a number of ticks and check frame times.
+
+    The player fires at the weapon's maximum rate into a steady stream of
+    enemies. Each tick is a full Game.step plus a draw to an offscreen
+    surface, timed together and compared with the frame budget. Returns the
+    frame times in milliseconds.
+    """
+    random.seed(0)
+    game.lives = ticks + 1  # Collisions with the player must not end the run
+    game.player.weapon = weapon
+    controls = Controls(FIRE | FIRE_HELD)
+    surface = pygame.Surface((game.width, game.height))
+    budget_ms = 1000 / game.FPS
+    frame_ms = []
+    peak_projectiles = 0
+
+    for _ in range(ticks):
+        top_up(game, enemies, 0)
+        start = time.perf_counter()
+        game.step(controls)
+        game.draw(surface)
+        frame_ms.append((time.perf_counter() - start) * 1000)
+        peak_projectiles = max(peak_projectiles, len(game.projectiles))
+
+    ordered = sorted(frame_ms)
+    over = sum(ms > budget_ms for ms in frame_ms)
+    output.write(f"{weapon} at full rate, {enemies} enemies, {ticks} ticks, "
+                 f"up to {peak_projectiles} projectiles\n")
+    output.write(f"frame time p50 {ordered[len(ordered) // 2]:.2f} ms, "
+                 f"p99 {ordered[int(len(ordered) * 0.99)]:.2f} ms, max {ordered[-1]:.2f} ms "
+                 f"against a {budget_ms:.1f} ms budget; {over} frames over\n")
+    return frame_ms
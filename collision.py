@@ -0,0 +1,162 @@
+import heapq
+from operator import itemgetter
+
+class SweepAndPrune:
+    """Projectile-enemy collision detection using sweep and prune.
+
+    Projectile and enemy ids are kept in a single list sorted by the left edge
+    of the area they covered during the last tick. Everything moves mostly
+    horizontally, so the order barely changes between frames and an insertion
+    sort puts it back in near-linear time. Newly spawned entities are sorted
+    on their own and merged in, so a burst of spawns doesn't make the
+    insertion sort walk them across the whole list.
+
+    The sweep keeps the entities it has passed whose right edge is still
+    ahead of it, in heaps ordered by right edge so finished ones are popped
+    as the sweep moves on. Those active entities are split into horizontal
+    bands by y, and each entity is only paired with the active entities in
+    the bands it covers.
+
+    In swept mode every entity is tested over the whole segment it travelled
+    this tick (from prev_x, prev_y to x, y), so fast or angled projectiles
+    can't tunnel through enemies. Entities without a prev_y column only move
+    horizontally. With swept=False only the current positions are compared.
+    """
+
+    BAND_HEIGHT = 32
+
+    def __init__(self, swept=True):
+        self.swept = swept
+        self.entries = []
+        self.tests = 0  # Pairs that reached the narrow phase in the last call
+
+    def find_hits(self, world):
+        """Return (projectile id, enemy id) pairs that collided this tick"""
+        boxes = {}
+        self.gather(world, "enemy", True, boxes)
+        self.gather(world, "projectile", False, boxes)
+        new = self.sync(boxes)
+        lefts = self.sort(boxes, new)
+
+        hits = []
+        hit_entities = set()
+        tests = 0
+        bands = {}  # Band index -> ([(right, enemy)], [(right, projectile)]) heaps
+        for entity, left in zip(self.entries, lefts):
+            box = boxes[entity]
+            is_enemy = box[6]
+            first, last = self.band_range(box)
+            candidates = []
+            for band in range(first, last + 1):
+                active = bands.get(band)
+                if active is None:
+                    active = bands[band] = ([], [])
+                # Drop entities that end before this one starts
+                for heap in active:
+                    while heap and heap[0][0] <= left:
+                        heapq.heappop(heap)
+                candidates.extend(other for _, other in active[is_enemy])
+                heapq.heappush(active[not is_enemy], (self.right_edge(box), entity))
+            if first != last:
+                # Entities spanning several bands are only tested once
+                candidates = dict.fromkeys(candidates)
+
+            tests += len(candidates)
+            if is_enemy:
+                for projectile in candidates:
+                    self.add_hit(hits, hit_entities, boxes, projectile, entity)
+            else:
+                for enemy in candidates:
+                    self.add_hit(hits, hit_entities, boxes, entity, enemy)
+        self.tests = tests
+        return hits
+
+    def gather(self, world, tag, is_enemy, boxes):
+        """Collect (x, prev_x, y, prev_y, width, height, is_enemy) boxes for tagged entities"""
+        for table in world.query(tag, "x", "y", "prev_x"):
+            width = table.shared["width"]
+            height = table.shared["height"]
+            columns = table.columns
+            ys = columns["y"]
+            for entity, x, prev_x, y, prev_y in zip(table.ids, columns["x"], columns["prev_x"], ys,
+                                                    columns.get("prev_y", ys)):
+                boxes[entity] = (x, prev_x, y, prev_y, width, height, is_enemy)
+
+    def sync(self, boxes):
+        """Drop despawned entities and return newly spawned ones"""
+        self.entries = [e for e in self.entries if e in boxes]
+        known = set(self.entries)
+        return [e for e in boxes if e not in known]
+
+    def sort(self, boxes, new=()):
+        """Sort entries by left edge, merging in new ones, and return the sorted edges"""
+        entries = self.entries
+        lefts = [self.left_edge(boxes[e]) for e in entries]
+        for i in range(1, len(entries)):
+            entity = entries[i]
+            left = lefts[i]
+            j = i - 1
+            while j >= 0 and lefts[j] > left:
+                entries[j + 1] = entries[j]
+                lefts[j + 1] = lefts[j]
+                j -= 1
+            entries[j + 1] = entity
+            lefts[j + 1] = left
+
+        if new:
+            # Stable, so ties keep their order and new entities go after old ones
+            arrivals = sorted(((self.left_edge(boxes[e]), e) for e in new), key=itemgetter(0))
+            merged = list(heapq.merge(zip(lefts, entries), arrivals, key=itemgetter(0)))
+            lefts = [left for left, _ in merged]
+            self.entries = [entity for _, entity in merged]
+        return lefts
+
+    def left_edge(self, box):
+        if self.swept:
+            return min(box[0], box[1])
+        return box[0]
+
+    def right_edge(self, box):
+        if self.swept:
+            return max(box[0], box[1]) + box[4]
+        return box[0] + box[4]
+
+    def band_range(self, box):
+        """First and last band covered by a box"""
+        top = bottom = box[2]
+        if self.swept:
+            top, bottom = min(top, box[3]), max(bottom, box[3])
+        return int(top // self.BAND_HEIGHT), int((bottom + box[5]) // self.BAND_HEIGHT)
+
+    def add_hit(self, hits, hit_entities, boxes, projectile, enemy):
+        """Record a hit unless either entity was already destroyed this tick"""
+        if projectile in hit_entities or enemy in hit_entities:
+            return
+        if self.overlaps(boxes[projectile], boxes[enemy]):
+            hits.append((projectile, enemy))
+            hit_entities.add(projectile)
+            hit_entities.add(enemy)
+
+    def overlaps(self, a, b):
+        """Swept AABB test between two moving boxes"""
+        a_x, a_prev_x, a_y, a_prev_y, a_width, a_height, _ = a
+        b_x, b_prev_x, b_y, b_prev_y, b_width, b_height, _ = b
+
+        # Offset of a relative to b at the start and end of the tick. It
+        # changes linearly, so on each axis the boxes overlap during a span of
+        # the tick, and they collide if the spans for both axes intersect.
+        enter, leave = 0.0, 1.0
+        for end, start, low, high in (
+                (a_x - b_x, a_prev_x - b_prev_x, -a_width, b_width),
+                (a_y - b_y, a_prev_y - b_prev_y, -a_height, b_height)):
+            if not self.swept or start == end:
+                if not low < end < high:
+                    return False
+                continue
+            first = (low - start) / (end - start)
+            second = (high - start) / (end - start)
+            enter = max(enter, min(first, second))
+            leave = min(leave, max(first, second))
+            if enter >= leave:
+                return False
+        return True
@@ -0,0 +1,58 @@
+import pygame
+
+# Input bits for one tick
+UP = 1
+DOWN = 2
+LEFT = 4
+RIGHT = 8
+FIRE = 16
+RESTART = 32
+FIRE_HELD = 64  # Fire button down, whether or not it was pressed this tick
+
+KEY_BITS = {
+    pygame.K_UP: UP,
+    pygame.K_DOWN: DOWN,
+    pygame.K_LEFT: LEFT,
+    pygame.K_RIGHT: RIGHT,
+    pygame.K_SPACE: FIRE_HELD,
+}
+
+class Controls:
+    """Player input for a single tick, packed into a bitmask.
+
+    Indexing with a pygame key constant works like the result of
+    pygame.key.get_pressed(), so Player.update can read either.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    @classmethod
+    def from_keyboard(cls, pressed, fire=False, restart=False):
+        """Build controls from pygame.key.get_pressed() and this tick's key presses"""
+        mask = 0
+        for key, bit in KEY_BITS.items():
+            if pressed[key]:
+                mask |= bit
+        if fire:
+            mask |= FIRE
+        if restart:
+            mask |= RESTART
+        return cls(mask)
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+    @property
+    def fire(self):
+        return bool(self.mask & FIRE)
+
+    @property
+    def fire_held(self):
+        return bool(self.mask & FIRE_HELD)
+
+    @property
+    def restart(self):
+        return bool(self.mask & RESTART)
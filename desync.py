@@ -0,0 +1,127 @@
+import argparse
+import json
+import os
+import sys
+from game_state import snapshot
+from replay import ReplayReader, ReplayViewer
+
+def first_divergence(hashes_a, hashes_b):
+    """Earliest tick present in both hash streams where they differ, or None"""
+    for tick in sorted(hashes_a.keys() & hashes_b.keys()):
+        if hashes_a[tick] != hashes_b[tick]:
+            return tick
+    return None
+
+def plain_snapshot(game):
+    """Snapshot with tuples as lists, so it compares equal to a stored keyframe"""
+    return json.loads(json.dumps(snapshot(game)))
+
+def state_at(game, reader, tick):
+    """Rebuild a recording's state at a tick from its keyframes and inputs"""
+    ReplayViewer(game, reader).seek(tick)
+    return plain_snapshot(game)
+
+def entities(state):
+    """Entity id -> (archetype name, components) from a snapshot"""
+    found = {}
+    for name, ids, columns in state["world"]["tables"]:
+        for row, entity in enumerate(ids):
+            found[entity] = (name, {column: values[row] for column, values in columns.items()})
+    return found
+
+def diff_states(a, b):
+    """Describe how two snapshots differ, game fields first, then by entity"""
+    differences = []
+    for name, value in a["game"].items():
+        if b["game"].get(name) != value:
+            differences.append(f"game.{name}: {value!r} != {b['game'].get(name)!r}")
+    for section in ("random", "timers", "level"):
+        if a.get(section) != b.get(section):
+            differences.append(f"{section} state differs")
+
+    entities_a, entities_b = entities(a), entities(b)
+    for entity in sorted(entities_a.keys() | entities_b.keys()):
+        if entity not in entities_b:
+            differences.append(f"entity {entity} ({entities_a[entity][0]}) only in the first")
+        elif entity not in entities_a:
+            differences.append(f"entity {entity} ({entities_b[entity][0]}) only in the second")
+        else:
+            name, components_a = entities_a[entity]
+            components_b = entities_b[entity][1]
+            for column, value in components_a.items():
+                if components_b.get(column) != value:
+                    differences.append(f"entity {entity} ({name}) {column}: {value!r} != {components_b.get(column)!r}")
+    return differences
+
+def compare(game, reader_a, reader_b):
+    """Find where two recordings' hash streams part and what differs there.
+
+    Returns (tick, differences), with tick None if the streams agree. The
+    states are rebuilt from each recording's keyframes and inputs, so if the
+    divergence itself isn't reproducible the differences may be empty.
+    """
+    tick = first_divergence(reader_a.hashes, reader_b.hashes)
+    if tick is None:
+        return None, []
+    return tick, diff_states(state_at(game, reader_a, tick), state_at(game, reader_b, tick))
+
+def verify(game, reader):
+    """Play a recording back and check it reproduces its own state hashes.
+
+    Returns (tick, differences) for the first tick that doesn't match, with
+    the differences found at the next keyframe, or (None, []).
+    """
+    viewer = ReplayViewer(game, reader)
+    viewer.seek(reader.start_tick)
+    while game.tick < reader.end_tick and viewer.desync_tick is None:
+        viewer.step()
+    if viewer.desync_tick is None:
+        return None, []
+
+    later = [tick for tick in reader.keyframe_ticks if tick >= viewer.desync_tick]
+    if not later:
+        return viewer.desync_tick, []
+    while game.tick < later[0]:
+        viewer.step()
+    _, recorded = reader.keyframe_before(later[0])
+    return viewer.desync_tick, diff_states(recorded, plain_snapshot(game))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report the first tick where recordings made with --hash diverge")
+    parser.add_argument("first", help="replay file; on its own, it is played back and checked against itself")
+    parser.add_argument("second", nargs="?", help="replay file to compare against the first")
+    parser.add_argument("--level", metavar="FILE", help="level file the sessions were played on")
+    parser.add_argument("--limit", type=int, default=20, help="most differences to list")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from game import Game
+    from level import Level
+
+    readers = [ReplayReader(path) for path in (args.first, args.second) if path]
+    for path, reader in zip((args.first, args.second), readers):
+        if not reader.hashes:
+            parser.error(f"{path} has no state hashes; record it with --hash")
+
+    game = Game()
+    if args.level:
+        game.load_level(Level(args.level))
+    if len(readers) == 2:
+        tick, differences = compare(game, *readers)
+    else:
+        tick, differences = verify(game, readers[0])
+
+    if tick is None:
+        print("no divergence")
+        return 0
+    print(f"first divergent tick: {tick}")
+    for line in differences[:args.limit]:
+        print(f"  {line}")
+    if not differences:
+        print("  the rebuilt states match, so the divergence isn't reproducible from the recordings")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
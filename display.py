@@ -0,0 +1,45 @@
+import pygame
+
+class Display:
+    """Presents a fixed logical-resolution surface in a window of any size.
+
+    The game always draws at the logical size, so fill, draw and blit costs
+    don't depend on the window or monitor resolution.
+
+    By default the window uses pygame.SCALED: the display surface is the
+    logical size and SDL scales it on the GPU when presenting, with whole
+    pixel multiples in a window and a stretch that keeps the aspect ratio in
+    fullscreen. For whole-pixel scaling in fullscreen, the logical surface is
+    instead scaled into the desktop-sized window with one transform per frame
+    and centred with black borders.
+    """
+
+    def __init__(self, size, fullscreen=False, integer_scaling=False):
+        self.size = size
+        self.transform = fullscreen and integer_scaling
+
+        if self.transform:
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.surface = pygame.Surface(size)
+            self.target = self.window.subsurface(self.target_rect(self.window.get_size()))
+        else:
+            flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE)
+            self.window = pygame.display.set_mode(size, flags)
+            self.surface = self.window
+
+    def target_rect(self, window_size):
+        """Largest whole multiple of the logical size that fits, centred"""
+        width, height = self.size
+        scale = max(min(window_size[0] // width, window_size[1] // height), 1)
+        rect = pygame.Rect(0, 0, width * scale, height * scale)
+        rect.center = (window_size[0] // 2, window_size[1] // 2)
+        return rect.clip(pygame.Rect((0, 0), window_size))
+
+    def present(self):
+        """Show the logical surface in the window"""
+        if self.transform:
+            if self.target.get_size() == self.size:
+                self.target.blit(self.surface, (0, 0))
+            else:
+                pygame.transform.scale(self.surface, self.target.get_size(), self.target)
+        pygame.display.flip()
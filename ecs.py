@@ -0,0 +1,216 @@
+import pygame
+
+# Archetypes by name, so snapshots can be restored into a fresh world
+ARCHETYPES = {}
+
+class Archetype:
+    """A kind of entity: its data columns, tag components and shared values.
+
+    Tags mark an archetype for queries without storing anything per entity.
+    Shared values such as size and colour are the same for every entity of
+    the archetype, so they are stored once here.
+    """
+
+    def __init__(self, name, columns, tags=(), **shared):
+        self.name = name
+        self.columns = tuple(columns)
+        self.components = frozenset(self.columns) | frozenset(tags)
+        self.shared = shared
+        ARCHETYPES[name] = self
+
+    def __repr__(self):
+        return f"Archetype({self.name!r})"
+
+class Table:
+    """Column storage for the entities of one archetype in a world"""
+
+    def __init__(self, archetype):
+        self.archetype = archetype
+        self.shared = archetype.shared
+        self.ids = []
+        self.columns = {name: [] for name in archetype.columns}
+
+    def __len__(self):
+        return len(self.ids)
+
+class World:
+    """Entity-component storage.
+
+    Entities are integer ids. Each belongs to an archetype, which fixes its
+    set of components, and is stored as a row in that archetype's table of
+    parallel columns. Systems query the tables that have the components they
+    need and loop over plain lists, never touching unrelated entities.
+    """
+
+    def __init__(self):
+        self.next_id = 0
+        self.tables = {}  # Archetype -> Table, in creation order
+        self.locations = {}  # Entity id -> (table, row)
+        self.query_cache = {}
+
+    def table(self, archetype):
+        """The table for an archetype, created on first use"""
+        table = self.tables.get(archetype)
+        if table is None:
+            table = self.tables[archetype] = Table(archetype)
+            self.query_cache.clear()
+        return table
+
+    def spawn(self, archetype, **values):
+        """Create an entity and return its id"""
+        return self.spawn_many(archetype, **{name: [value] for name, value in values.items()})[0]
+
+    def spawn_many(self, archetype, **columns):
+        """Create several entities from per-column value lists in one insertion"""
+        table = self.table(archetype)
+        if set(columns) != set(archetype.columns):
+            raise ValueError(f"{archetype.name} needs columns {sorted(archetype.columns)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"{archetype.name} columns have different lengths: "
+                             + ", ".join(f"{name}={len(values)}" for name, values in columns.items()))
+        count = lengths.pop() if lengths else 0
+
+        first_row = len(table.ids)
+        ids = list(range(self.next_id, self.next_id + count))
+        self.next_id += count
+        table.ids.extend(ids)
+        for name, values in columns.items():
+            table.columns[name].extend(values)
+        for row, entity in enumerate(ids, first_row):
+            self.locations[entity] = (table, row)
+        return ids
+
+    def despawn(self, entity):
+        """Remove an entity, moving the table's last row into its place"""
+        table, row = self.locations.pop(entity)
+        last = len(table.ids) - 1
+        if row != last:
+            moved = table.ids[last]
+            table.ids[row] = moved
+            for column in table.columns.values():
+                column[row] = column[last]
+            self.locations[moved] = (table, row)
+        table.ids.pop()
+        for column in table.columns.values():
+            column.pop()
+
+    def alive(self, entity):
+        return entity in self.locations
+
+    def get(self, entity, name):
+        table, row = self.locations[entity]
+        return table.columns[name][row]
+
+    def set(self, entity, name, value):
+        table, row = self.locations[entity]
+        table.columns[name][row] = value
+
+    def query(self, *components):
+        """Tables whose archetype has all the given components"""
+        key = frozenset(components)
+        tables = self.query_cache.get(key)
+        if tables is None:
+            tables = self.query_cache[key] = [
+                table for archetype, table in self.tables.items() if key <= archetype.components
+            ]
+        return tables
+
+    def snapshot(self):
+        """Plain-data copy of every table, for keyframes"""
+        return {
+            "next_id": self.next_id,
+            "tables": [
+                [table.archetype.name, list(table.ids),
+                 {name: list(column) for name, column in table.columns.items()}]
+                for table in self.tables.values()
+            ],
+        }
+
+    def restore(self, state):
+        """Replace all entities with those from a snapshot, keeping their ids"""
+        self.next_id = state["next_id"]
+        self.tables = {}
+        self.locations = {}
+        self.query_cache = {}
+        for name, ids, columns in state["tables"]:
+            table = self.table(ARCHETYPES[name])
+            table.ids = list(ids)
+            table.columns = {column: list(values) for column, values in columns.items()}
+            for row, entity in enumerate(table.ids):
+                self.locations[entity] = (table, row)
+
+class Entity:
+    """Handle to one entity, with its components readable as attributes.
+
+    Subclasses set `archetype`. Handles are cheap, compare equal when they
+    refer to the same entity, and can be created for existing ids with
+    attach().
+    """
+
+    __slots__ = ("world", "id")
+    archetype = None
+
+    @classmethod
+    def attach(cls, world, entity):
+        handle = cls.__new__(cls)
+        handle.world = world
+        handle.id = entity
+        return handle
+
+    def __getattr__(self, name):
+        try:
+            table, row = self.world.locations[self.id]
+            return table.columns[name][row]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no component {name!r}") from None
+
+    def __setattr__(self, name, value):
+        if name in self.archetype.columns:
+            self.world.set(self.id, name, value)
+        else:
+            object.__setattr__(self, name, value)
+
+    @property
+    def rect(self):
+        """Bounding rectangle built from the current position and the class's size"""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def __eq__(self, other):
+        return isinstance(other, Entity) and self.id == other.id and self.world is other.world
+
+    def __hash__(self):
+        return hash(self.id)
+
+class EntityView:
+    """List-like view of the live entities of one archetype as handles"""
+
+    def __init__(self, world, handle_class):
+        self.world = world
+        self.handle_class = handle_class
+
+    def ids(self):
+        table = self.world.tables.get(self.handle_class.archetype)
+        return list(table.ids) if table else []
+
+    def __len__(self):
+        table = self.world.tables.get(self.handle_class.archetype)
+        return len(table.ids) if table else 0
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __getitem__(self, index):
+        ids = self.ids()
+        if isinstance(index, slice):
+            return [self.handle_class.attach(self.world, entity) for entity in ids[index]]
+        return self.handle_class.attach(self.world, ids[index])
+
+    def __contains__(self, handle):
+        return (isinstance(handle, self.handle_class) and handle.world is self.world
+                and self.world.alive(handle.id))
+
+    def remove(self, handle):
+        if handle not in self:
+            raise ValueError(f"{handle!r} is not in the list")
+        self.world.despawn(handle.id)
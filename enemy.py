@@ -1,27 +1,28 @@
-import pygame
 import random
+from ecs import Archetype, Entity
+from metrics import REGISTRY
+
+ENEMIES_ESCAPED = REGISTRY.counter("enemies_escaped_total", "Enemies that left the screen")
+
+class Enemy(Entity):
+    # Shared by every enemy, so they live on the class rather than each entity
+    width = 30
+    height = 30
+    color = (255, 0, 0)  # Red color for enemies
+
+    archetype = Archetype(
+        "enemy", ("x", "y", "prev_x", "vx"), tags=("enemy", "expires_offscreen"),
+        width=width, height=height, color=color, expired_counter=ENEMIES_ESCAPED,
+    )
+
+    __slots__ = ()
 
-class Enemy:
     def __init__(self, x, y, game):
-        self.game = game
-        self.x = x
-        self.y = y
-        self.width = 30
-        self.height = 30
-        self.speed = random.uniform(1.5, 3.0)  # Random speed for variety
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.color = (255, 0, 0)  # Red color for enemies
-    
-    def update(self):
-        """Update enemy position"""
-        self.x -= self.speed
-        self.rect.x = self.x
-        self.rect.y = self.y
-        
-        # Remove enemy if it goes off screen
-        if self.x + self.width < 0:
-            self.game.enemies.remove(self)
-    
-    def draw(self, screen):
-        """Draw the enemy on the screen"""
-        pygame.draw.rect(screen, self.color, self.rect)
+        # prev_x is the position at the start of the tick, for swept collisions
+        speed = random.uniform(1.5, 3.0)  # Random speed for variety
+        self.world = game.world
+        self.id = game.world.spawn(self.archetype, x=x, y=y, prev_x=x, vx=-speed)
+
+    @property
+    def speed(self):
+        return -self.vx
@@ -0,0 +1,41 @@
+from collections import namedtuple
+
+# Gameplay events. Small tuples, so emitting one inside a hot loop is just an
+# allocation and a list append.
+EnemyKilled = namedtuple("EnemyKilled", "x y")
+PlayerHit = namedtuple("PlayerHit", "cause")  # "enemy" or "terrain"
+WaveCompleted = namedtuple("WaveCompleted", "wave")
+ShotFired = namedtuple("ShotFired", "x y")
+PowerUpCollected = namedtuple("PowerUpCollected", "weapon")
+
+class EventBus:
+    """Buffers the events of a tick and hands them to subscribers in batches.
+
+    The simulation only appends to a list while it runs. dispatch(), called
+    once the tick is over, gives each subscriber every event of its type
+    from that tick in a single call, as handler(target, events).
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self.pending = []
+        self.subscribers = []  # (event type, handler), called in subscription order
+
+    def subscribe(self, event_type, handler):
+        self.subscribers.append((event_type, handler))
+
+    def emit(self, event):
+        self.pending.append(event)
+
+    def dispatch(self):
+        """Deliver the events emitted since the last dispatch"""
+        if not self.pending:
+            return
+        events, self.pending = self.pending, []
+        batches = {}
+        for event in events:
+            batches.setdefault(type(event), []).append(event)
+        for event_type, handler in self.subscribers:
+            batch = batches.get(event_type)
+            if batch:
+                handler(self.target, batch)
@@ -0,0 +1,86 @@
+import os
+import queue
+import threading
+import pygame
+
+class FrameExporter:
+    """Writes rendered frames to disk on background worker threads.
+
+    Each submitted surface is copied once into an RGB byte string, which is
+    the only copy made; PNG workers wrap it straight back into a surface with
+    pygame.image.frombuffer. Frames go through a bounded queue, so the
+    producer only waits when the workers fall queue_size frames behind.
+
+    Formats:
+      png  one numbered PNG per frame in the output directory, using `workers` threads
+      raw  a single stream of packed RGB24 frames written to the output path,
+           which can be a named pipe feeding an encoder. Written by one thread
+           so frames stay in order.
+    """
+
+    def __init__(self, output, size, fmt="png", workers=4, queue_size=32):
+        if fmt not in ("png", "raw"):
+            raise ValueError(f"unknown export format: {fmt}")
+        self.output = output
+        self.size = size
+        self.format = fmt
+        self.frame_count = 0
+        self.errors = []
+        self.queue = queue.Queue(maxsize=queue_size)
+
+        if fmt == "png":
+            os.makedirs(output, exist_ok=True)
+            self.stream = None
+        else:
+            workers = 1
+            self.stream = open(output, "wb")
+
+        self.workers = [threading.Thread(target=self.work, daemon=True) for _ in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, surface):
+        """Queue a copy of the surface's pixels, blocking only if the queue is full"""
+        self.queue.put((self.frame_count, pygame.image.tobytes(surface, "RGB")))
+        self.frame_count += 1
+
+    def work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.errors:
+                continue  # Drain the queue so the producer never blocks forever
+            index, data = item
+            try:
+                if self.stream:
+                    self.stream.write(data)
+                else:
+                    frame = pygame.image.frombuffer(data, self.size, "RGB")
+                    pygame.image.save(frame, os.path.join(self.output, f"frame_{index:06d}.png"))
+            except Exception as error:
+                self.errors.append(error)
+
+    def close(self):
+        """Wait for every queued frame to be written"""
+        for _ in self.workers:
+            self.queue.put(None)
+        for worker in self.workers:
+            worker.join()
+        if self.stream:
+            self.stream.close()
+        if self.errors:
+            raise self.errors[0]
+
+def export_replay(viewer, exporter, start_tick=0):
+    """Render a replay from start_tick to its end as fast as possible"""
+    game = viewer.game
+    surface = pygame.Surface((game.width, game.height))
+    viewer.seek(start_tick)
+    try:
+        while game.tick < viewer.reader.end_tick:
+            viewer.step()
+            game.draw(surface)
+            exporter.submit(surface)
+    finally:
+        exporter.close()
@@ -3,234 +3,214 @@ import sys
 from player import Player
 from enemy import Enemy
 from projectile import Projectile
-import random
+from collision import SweepAndPrune
+from controls import Controls
+from assets import LoadingScreen, game_assets
+from audio import Audio
+from display import Display
+from events import EventBus
+from governor import FrameGovernor
+from loop import FrameLoop
+from hud import Hud
+from level_stream import LevelStream
+from metrics import REGISTRY
+from ecs import EntityView, World
+from subscribers import subscribe_all
+from systems import SYSTEMS, TIMER_HANDLERS, render
+from timers import TimerWheel
+from waves import complete_wave, reset_waves, start_wave, wave_cleared
+
+LIVE_ENEMIES = REGISTRY.gauge("live_enemies", "Enemies currently alive")
+LIVE_PROJECTILES = REGISTRY.gauge("live_projectiles", "Projectiles currently alive")
+WAVE = REGISTRY.gauge("wave", "Current wave")
 
 class Game:
-    def __init__(self):
-        # Initialize pygame
+    def __init__(self, fullscreen=False, integer_scaling=False):
+        # Initialize pygame, with a small mixer buffer so effects play promptly
+        pygame.mixer.pre_init(44100, -16, 2, 512)
         pygame.init()
         pygame.display.set_caption("Side-Scrolling Shooter")
         
         # Game settings
         self.width = 800
         self.height = 600
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        # Logical resolution; the display scales it to the window
+        self.display = Display((self.width, self.height), fullscreen, integer_scaling)
+        self.screen = self.display.surface
         self.clock = pygame.time.Clock()
         self.FPS = 60
         self.running = True
         self.game_over = False
+        self.tick = 0  # Frames stepped since start, never reset
+        self.paused = False
+        
+        # Font and colors, also used by the loading screen
+        self.font = pygame.font.SysFont(None, 36)
+        self.BLACK = (0, 0, 0)
+        self.WHITE = (255, 255, 255)
+        self.RED = (255, 0, 0)
+        
+        # Decode sounds and images on worker threads behind a loading screen
+        self.assets = game_assets(pygame.mixer.get_init() is not None)
+        loaded = self.assets.load(LoadingScreen(self))
+        self.font = loaded.get("hud", self.font)
+        self.background = loaded.get("background")
         
         # Game elements
+        self.world = World()
+        self.timers = TimerWheel(self, TIMER_HANDLERS, self.FPS)
         self.player = Player(50, self.height // 2, self)
-        self.enemies = []
-        self.projectiles = []
+        self.controls = None  # Controls for the tick being updated
+        self.autopilot = None  # Optional Bot that plays instead of the keyboard
+        self.collisions = SweepAndPrune(swept=True)
+        self.memory_report = None  # Optional MemoryReport sampled every tick
+        self.recorder = None  # Optional ReplayWriter fed every tick
+        self.publisher = None  # Optional SharedFrameWriter fed every rendered frame
+        self.latency = None  # Optional LatencyMonitor timing input to display
+        self.governor = FrameGovernor(self.FPS)
+        self.audio = Audio(sounds=loaded)
+        self.events = EventBus(self)
+        subscribe_all(self.events)
+        self.level = None  # Optional LevelStream scrolled by the systems
         
         # Game variables
         self.score = 0
         self.lives = 3
         self.enemy_spawn_rate = 60  # frames between enemy spawns
-        self.spawn_counter = 0
-        
-        # Wave variables
-        self.current_wave = 1
-        self.wave_enemies_spawned = 0
-        self.wave_enemies_required = self.calculate_wave_enemies(self.current_wave)
-        self.wave_completed = False
-        self.wave_transition = False
-        self.wave_message_timer = 0
         self.wave_message_duration = 1000  # 1 second in milliseconds
+        reset_waves(self)
+        self.hud = Hud(self)
         
-        # Font for text display
-        self.font = pygame.font.SysFont(None, 36)
-        
-        # Colors
-        self.BLACK = (0, 0, 0)
-        self.WHITE = (255, 255, 255)
-        self.RED = (255, 0, 0)
-        
-    def run(self):
-        """Main game loop"""
-        while self.running:
-            self.handle_events()
-            
-            if not self.game_over:
-                self.update()
-            
-            self.render()
-            self.clock.tick(self.FPS)
-        
+    def run(self, idle=True, **options):
+        """Main game loop; options are passed on to the FrameLoop"""
+        FrameLoop(self, idle, **options).run()
         pygame.quit()
         sys.exit()
     
     def handle_events(self):
-        """Handle player input"""
-        for event in pygame.event.get():
+        """Handle player input and return the controls for this tick"""
+        fire = False
+        restart = False
+        events = pygame.event.get()
+        if self.latency:
+            self.latency.polled(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
+            # Pause and resume
+            if not self.game_over and event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                self.paused = not self.paused
+            
             # Restart game if it's game over
             if self.game_over and event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
-                    self.reset_game()
+                    restart = True
                 elif event.key == pygame.K_q:
                     self.running = False
             
             # Shooting
-            if not self.game_over and event.type == pygame.KEYDOWN:
+            if not self.game_over and not self.paused and event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    self.player.shoot()
+                    fire = True
         
-    def update(self):
+        if self.autopilot:
+            return self.autopilot.controls(self)
+        return Controls.from_keyboard(pygame.key.get_pressed(), fire, restart)
+    
+    def step(self, controls):
+        """Advance the game by one tick using the given controls"""
+        if self.recorder:
+            self.recorder.record(self, controls)
+        
+        if controls.restart and self.game_over:
+            self.reset_game()
+        
+        if not self.game_over:
+            self.update(controls)
+        # Scoring, stats and sounds for what happened this tick
+        self.events.dispatch()
+        
+        self.tick += 1
+        LIVE_ENEMIES.set(len(self.enemies))
+        LIVE_PROJECTILES.set(len(self.projectiles))
+        WAVE.set(self.current_wave)
+    
+    @property
+    def enemies(self):
+        return EntityView(self.world, Enemy)
+    
+    @property
+    def projectiles(self):
+        return EntityView(self.world, Projectile)
+    
+    def is_static(self):
+        """Whether nothing on screen changes until input arrives or a timer fires"""
+        return self.paused or self.game_over or self.wave_transition
+        
+    def update(self, controls=None):
         """Update game state"""
-        # Check for wave transition
-        if self.wave_transition:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.wave_message_timer >= self.wave_message_duration:
-                self.start_next_wave()
+        if self.memory_report:
+            self.memory_report.sample(self)
+        
+        # Shooting
+        if controls is not None:
+            self.player.trigger(controls)
+        
+        # Fire the timers due this tick. Nothing else runs during a wave
+        # transition, including the tick whose timer ends it
+        in_transition = self.wave_transition
+        self.timers.advance()
+        if in_transition:
             return
         
-        # Check if wave is completed
-        if self.wave_enemies_spawned >= self.wave_enemies_required and len(self.enemies) == 0:
-            self.complete_wave()
+        if wave_cleared(self):
+            complete_wave(self)
             return
         
-        # Update player
-        self.player.update()
-        
-        # Spawn enemies - only if we haven't reached the wave limit
-        if self.wave_enemies_spawned < self.wave_enemies_required:
-            self.spawn_counter += 1
-            if self.spawn_counter >= self.enemy_spawn_rate:
-                y_pos = random.randint(50, self.height - 50)
-                self.enemies.append(Enemy(self.width, y_pos, self))
-                self.wave_enemies_spawned += 1
-                self.spawn_counter = 0
-        
-        # Update enemies
-        for enemy in self.enemies[:]: 
-            enemy.update()
-            
-            # Check for collisions with player
-            if self.check_collision(enemy.rect, self.player.rect):
-                # Only destroy the enemy and affect player if not in ghost state
-                if not self.player.is_ghost:
-                    self.enemies.remove(enemy)
-                    self.lives -= 1
-                    # Enter ghost state when hit
-                    self.player.enter_ghost_state()
-                    if self.lives <= 0:
-                        self.game_over = True
-        
-        # Update projectiles
-        for projectile in self.projectiles[:]:
-            projectile.update()
-            
-            # Check for collisions with enemies
-            for enemy in self.enemies[:]:
-                if self.check_collision(projectile.rect, enemy.rect):
-                    self.projectiles.remove(projectile)
-                    self.enemies.remove(enemy)
-                    self.score += 10
-                    break
+        # Run the systems
+        self.controls = controls
+        for system in SYSTEMS:
+            system(self)
     
     def render(self):
-        """Render game elements"""
-        self.screen.fill(self.BLACK)
+        """Render game elements to the window"""
+        self.draw(self.screen)
+        self.display.present()
+    
+    def draw(self, surface):
+        """Draw the current frame onto a surface"""
+        if self.background:
+            surface.blit(self.background, (0, 0))
+        else:
+            surface.fill(self.BLACK)
         
         # Draw game elements
-        self.player.draw(self.screen)
-        
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
-        
-        for projectile in self.projectiles:
-            projectile.draw(self.screen)
-        
-        # Draw HUD
-        self.draw_hud()
-        
-        # Draw game over screen
-        if self.game_over:
-            self.draw_game_over()
-        
-        # Draw wave transition message
-        if self.wave_transition:
-            self.draw_wave_message()
+        if self.level:
+            self.level.draw(surface)
+        render(self.world, surface)
         
-        pygame.display.flip()
+        # Draw HUD, and the game over, wave transition or pause message
+        self.hud.draw(surface)
+        self.hud.draw_overlays(surface)
     
-    def draw_hud(self):
-        """Draw score, lives, and wave info"""
-        score_text = self.font.render(f"Score: {self.score}", True, self.WHITE)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, self.WHITE)
-        wave_text = self.font.render(f"Wave: {self.current_wave}", True, self.WHITE)
-        
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(lives_text, (10, 50))
-        self.screen.blit(wave_text, (10, 90))
-    
-    def draw_game_over(self):
-        """Draw game over screen"""
-        game_over_text = self.font.render("GAME OVER", True, self.RED)
-        restart_text = self.font.render("Press R to Restart or Q to Quit", True, self.WHITE)
-        
-        self.screen.blit(game_over_text, (self.width // 2 - game_over_text.get_width() // 2, 
-                                        self.height // 2 - game_over_text.get_height() // 2))
-        self.screen.blit(restart_text, (self.width // 2 - restart_text.get_width() // 2, 
-                                      self.height // 2 + 50))
-    
-    def check_collision(self, rect1, rect2):
-        """Check if two rectangles collide"""
-        return rect1.colliderect(rect2)
-    
-    def calculate_wave_enemies(self, wave_number):
-        """Calculate number of enemies for a given wave"""
-        return 30 + (wave_number - 1) * 10
-    
-    def complete_wave(self):
-        """Handle wave completion"""
-        self.wave_completed = True
-        self.wave_transition = True
-        self.wave_message_timer = pygame.time.get_ticks()
-    
-    def start_next_wave(self):
-        """Start the next wave"""
-        self.current_wave += 1
-        self.wave_enemies_spawned = 0
-        self.wave_enemies_required = self.calculate_wave_enemies(self.current_wave)
-        self.wave_completed = False
-        self.wave_transition = False
-    
-    def draw_wave_message(self):
-        """Draw wave transition message"""
-        message = f"Wave {self.current_wave} Cleared!"
-        next_wave_message = f"Get Ready, Wave {self.current_wave + 1}!"
-        
-        wave_text = self.font.render(message, True, self.WHITE)
-        next_wave_text = self.font.render(next_wave_message, True, self.WHITE)
-        
-        # Center the messages on screen
-        wave_text_rect = wave_text.get_rect(center=(self.width // 2, self.height // 2 - 30))
-        next_wave_text_rect = next_wave_text.get_rect(center=(self.width // 2, self.height // 2 + 30))
-        
-        self.screen.blit(wave_text, wave_text_rect)
-        self.screen.blit(next_wave_text, next_wave_text_rect)
+    def load_level(self, level):
+        """Play through a Level instead of endless waves"""
+        self.level = LevelStream(level, self.width, self.height)
+        start_wave(self)
     
     def reset_game(self):
         """Reset the game state"""
+        self.world = World()
+        self.timers = TimerWheel(self, TIMER_HANDLERS, self.FPS)
+        self.collisions = SweepAndPrune(swept=True)
         self.player = Player(50, self.height // 2, self)
-        self.enemies = []
-        self.projectiles = []
         self.score = 0
         self.lives = 3
         self.game_over = False
-        self.spawn_counter = 0
-        # Reset wave variables
-        self.current_wave = 1
-        self.wave_enemies_spawned = 0
-        self.wave_enemies_required = self.calculate_wave_enemies(self.current_wave)
-        self.wave_completed = False
-        self.wave_transition = False
+        if self.level:
+            self.level.restore({"camera": 0})
+        reset_waves(self)
         # Ensure player is not in ghost state after reset
         self.player.is_ghost = False
         self.player.visible = True
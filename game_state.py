@@ -0,0 +1,39 @@
+import random
+from player import Player
+
+# Game attributes that are plain values and can be copied as they are
+GAME_FIELDS = (
+    "tick", "score", "lives", "game_over", "spawn_timer",
+    "current_wave", "wave_enemies_spawned", "wave_enemies_required",
+    "wave_completed", "wave_transition", "wave_message_timer",
+)
+
+def snapshot(game):
+    """Capture the full simulation state of a game as JSON-friendly data"""
+    return {
+        "game": {name: getattr(game, name) for name in GAME_FIELDS},
+        "world": game.world.snapshot(),
+        "timers": game.timers.snapshot(),
+        "level": game.level.snapshot() if game.level else None,
+        "player": game.player.id,
+        # The sweep order decides which projectile wins when several overlap
+        # one enemy, so it has to be restored exactly for replays to stay in step
+        "sweep_order": list(game.collisions.entries),
+        "random": random.getstate(),
+    }
+
+def restore(game, state):
+    """Put a game back into a state captured by snapshot()"""
+    for name, value in state["game"].items():
+        setattr(game, name, value)
+
+    game.world.restore(state["world"])
+    game.timers.restore(state["timers"])
+    if game.level and state["level"]:
+        game.level.restore(state["level"])
+    game.player = Player.attach(game.world, state["player"])
+    game.player.game = game
+    game.collisions.entries = list(state["sweep_order"])
+
+    version, internal_state, gauss_next = state["random"]
+    random.setstate((version, tuple(internal_state), gauss_next))
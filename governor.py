@@ -0,0 +1,75 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+class FrameGovernor:
+    """Keeps the frame loop within its time budget by degrading presentation.
+
+    Update and render times are smoothed and compared with the budget for one
+    frame at the target FPS. When the estimated frame cost overruns, the
+    governor moves to the next level in LEVELS; when the previous level would
+    fit comfortably again, it moves back. Simulation ticks are never skipped.
+    """
+
+    # (HUD refresh interval, render interval) in ticks, cheapest last
+    LEVELS = [
+        (1, 1),   # Full quality
+        (10, 1),  # Refresh HUD text six times a second
+        (10, 2),  # Also render every other tick
+        (10, 3),  # Render every third tick
+    ]
+
+    SMOOTHING = 0.1  # Weight of the newest sample in the moving averages
+    OVERRUN = 0.95   # Degrade when the estimated cost exceeds this share of the budget
+    HEADROOM = 0.7   # Restore when the better level would cost less than this share
+    HOLD_TICKS = 30  # Minimum ticks between level changes
+
+    def __init__(self, fps):
+        self.budget_ms = 1000 / fps
+        self.level = 0
+        self.update_ms = 0.0
+        self.render_ms = 0.0
+        self.ticks_since_change = 0
+
+    @property
+    def hud_interval(self):
+        return self.LEVELS[self.level][0]
+
+    @property
+    def render_interval(self):
+        return self.LEVELS[self.level][1]
+
+    def should_render(self, tick):
+        """Whether the frame for this tick should be drawn"""
+        return tick % self.render_interval == 0
+
+    def estimated_cost(self, level):
+        """Average per-tick time if the given level were in effect"""
+        return self.update_ms + self.render_ms / self.LEVELS[level][1]
+
+    def record(self, update_ms, render_ms=None):
+        """Feed the timings of one tick; render_ms is None for skipped frames"""
+        self.update_ms += (update_ms - self.update_ms) * self.SMOOTHING
+        if render_ms is not None:
+            self.render_ms += (render_ms - self.render_ms) * self.SMOOTHING
+
+        self.ticks_since_change += 1
+        if self.ticks_since_change < self.HOLD_TICKS:
+            return
+
+        cost = self.estimated_cost(self.level)
+        if cost > self.budget_ms * self.OVERRUN and self.level < len(self.LEVELS) - 1:
+            self.set_level(self.level + 1, cost)
+        elif self.level > 0 and self.estimated_cost(self.level - 1) < self.budget_ms * self.HEADROOM:
+            self.set_level(self.level - 1, cost)
+
+    def set_level(self, level, cost):
+        action = "degrading" if level > self.level else "restoring"
+        hud_interval, render_interval = self.LEVELS[level]
+        logger.info(
+            "%s to level %d (HUD every %d ticks, render every %d ticks): "
+            "%.2f ms per tick against %.2f ms budget",
+            action, level, hud_interval, render_interval, cost, self.budget_ms,
+        )
+        self.level = level
+        self.ticks_since_change = 0
@@ -0,0 +1,90 @@
+from metrics import REGISTRY
+
+SURFACES_CREATED = REGISTRY.counter("text_surfaces_created_total", "Text surfaces rendered by the HUD")
+
+class Hud:
+    """Draws the score panel and the game over and wave transition messages"""
+
+    def __init__(self, game):
+        self.game = game
+        self.values = None  # (score, lives, wave) the cached text shows
+        self.surfaces = []
+        self.rendered_tick = 0
+        self.messages = {}  # Rendered message text, keyed by (text, color)
+
+    def draw(self, screen):
+        """Draw score, lives, and wave info"""
+        game = self.game
+
+        # Text is only re-rendered when it changes, and no more often than
+        # the governor's HUD refresh interval allows. Static screens are
+        # drawn once and then left up, so they always show current values
+        values = (game.score, game.lives, game.current_wave)
+        if values != self.values and (
+                self.values is None or game.is_static()
+                or game.tick - self.rendered_tick >= game.governor.hud_interval):
+            self.values = values
+            self.rendered_tick = game.tick
+            self.surfaces = [
+                game.font.render(f"Score: {game.score}", True, game.WHITE),
+                game.font.render(f"Lives: {game.lives}", True, game.WHITE),
+                game.font.render(f"Wave: {game.current_wave}", True, game.WHITE),
+            ]
+            SURFACES_CREATED.inc(len(self.surfaces))
+
+        for i, text in enumerate(self.surfaces):
+            screen.blit(text, (10, 10 + i * 40))
+
+    def draw_overlays(self, screen):
+        """Draw the message for whichever static screen is showing"""
+        game = self.game
+        if game.game_over:
+            self.draw_game_over(screen)
+        if game.wave_transition:
+            self.draw_wave_message(screen)
+        if game.paused:
+            self.draw_paused(screen)
+
+    def draw_game_over(self, screen):
+        """Draw game over screen"""
+        game = self.game
+        game_over_text = self.message("GAME OVER", game.RED)
+        restart_text = self.message("Press R to Restart or Q to Quit", game.WHITE)
+
+        screen.blit(game_over_text, (game.width // 2 - game_over_text.get_width() // 2,
+                                     game.height // 2 - game_over_text.get_height() // 2))
+        screen.blit(restart_text, (game.width // 2 - restart_text.get_width() // 2,
+                                   game.height // 2 + 50))
+
+    def draw_wave_message(self, screen):
+        """Draw wave transition message"""
+        game = self.game
+        message = f"Wave {game.current_wave} Cleared!"
+        next_wave_message = f"Get Ready, Wave {game.current_wave + 1}!"
+
+        wave_text = self.message(message, game.WHITE)
+        next_wave_text = self.message(next_wave_message, game.WHITE)
+
+        # Center the messages on screen
+        wave_text_rect = wave_text.get_rect(center=(game.width // 2, game.height // 2 - 30))
+        next_wave_text_rect = next_wave_text.get_rect(center=(game.width // 2, game.height // 2 + 30))
+
+        screen.blit(wave_text, wave_text_rect)
+        screen.blit(next_wave_text, next_wave_text_rect)
+
+    def draw_paused(self, screen):
+        """Draw pause message"""
+        game = self.game
+        paused_text = self.message("PAUSED - Press P to Resume", game.WHITE)
+        screen.blit(paused_text, paused_text.get_rect(center=(game.width // 2, game.height // 2)))
+
+    def message(self, text, color):
+        """Render message text once and reuse it while it stays on screen"""
+        key = (text, color)
+        surface = self.messages.get(key)
+        if surface is None:
+            if len(self.messages) >= 16:
+                self.messages.clear()  # Old wave numbers are never shown again
+            surface = self.messages[key] = self.game.font.render(text, True, color)
+            SURFACES_CREATED.inc()
+        return surface
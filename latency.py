@@ -0,0 +1,91 @@
+import math
+import random
+import sys
+import threading
+import time
+from array import array
+import pygame
+from metrics import REGISTRY
+
+INPUT_LATENCY_MS = REGISTRY.histogram(
+    "input_latency_ms", "Time from input to the present of the first frame showing it")
+
+# Synthetic input posted by LatencyProbe. The game ignores it; only its
+# latency is measured
+PROBE = pygame.event.custom_type()
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.JOYBUTTONDOWN, PROBE)
+
+def percentile(ordered, point):
+    """Nearest-rank percentile of sorted samples"""
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(point / 100 * len(ordered)) - 1, 0)]
+
+class LatencyMonitor:
+    """Times each input from when the loop receives it until the flip of
+    the first frame drawn after the tick that used it.
+
+    pygame doesn't expose SDL's event timestamps, so keyboard input is timed
+    from the poll that picked it up; the time it sat in the queue before that
+    is missed. Probe events carry the time they were posted, which covers the
+    whole path.
+    """
+
+    POINTS = (50, 90, 99)
+
+    def __init__(self, output=sys.stdout):
+        self.output = output
+        self.pending = []  # perf_counter times of input not yet on screen
+        self.samples = array("d")
+
+    def polled(self, events):
+        """Note the input among the events just taken off the queue"""
+        now = time.perf_counter()
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                self.pending.append(getattr(event, "sent", now))
+
+    def presented(self):
+        """A frame reflecting all the input polled so far has been flipped"""
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        for sent in self.pending:
+            latency_ms = (now - sent) * 1000
+            INPUT_LATENCY_MS.observe(latency_ms)
+            self.samples.append(latency_ms)
+        self.pending = []
+
+    def percentiles(self):
+        ordered = sorted(self.samples)
+        return {point: percentile(ordered, point) for point in self.POINTS + (100,)}
+
+    def close(self):
+        """Write the latency percentiles for the session"""
+        if not self.samples:
+            self.output.write("input latency: no input measured\n")
+            return
+        values = self.percentiles()
+        points = ", ".join(f"p{point} {values[point]:.1f} ms" for point in self.POINTS)
+        self.output.write(
+            f"input latency over {len(self.samples)} inputs: {points}, max {values[100]:.1f} ms\n")
+        self.output.flush()
+
+class LatencyProbe:
+    """Posts PROBE events at random intervals from a background thread, so
+    latency can be measured without anyone at the keyboard"""
+
+    def __init__(self, interval=0.1, seed=0):
+        self.interval = interval  # Mean seconds between probes
+        self.random = random.Random(seed)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.stopped.wait(self.random.uniform(0.5, 1.5) * self.interval):
+            pygame.event.post(pygame.event.Event(PROBE, sent=time.perf_counter()))
+
+    def close(self):
+        self.stopped.set()
+        self.thread.join()
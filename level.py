@@ -0,0 +1,141 @@
+import argparse
+import mmap
+import random
+import struct
+
+# Level file: header, then fixed-size chunks. Each chunk is a strip of tile
+# columns (one byte per tile, top to bottom, 0 = empty) followed by a fixed
+# number of encounter slots, so chunk N is at a computable offset and can be
+# read straight from a memory map.
+HEADER = struct.Struct("<4sBBHHI")  # magic, version, tile size, columns per chunk, rows, chunks
+MAGIC = b"SSLV"
+VERSION = 1
+ENCOUNTER = struct.Struct("<HBBHH")  # column in chunk, formation, count, y, spacing
+ENCOUNTERS_PER_CHUNK = 8
+EMPTY_SLOT = 0xFFFF
+
+# Encounter formations
+LINE = 0  # One behind another, flying in along a row
+COLUMN = 1  # Stacked vertically, arriving together
+
+class Encounter:
+    """Enemies that enter together when the camera reaches a column"""
+
+    __slots__ = ("x", "formation", "count", "y", "spacing")
+
+    def __init__(self, x, formation, count, y, spacing):
+        self.x = x  # In level pixels
+        self.formation = formation
+        self.count = count
+        self.y = y
+        self.spacing = spacing
+
+class Level:
+    """A level file mapped into memory, read one chunk at a time.
+
+    Nothing is read until a chunk is asked for, and chunk terrain is a
+    memoryview into the mapping rather than a copy, so opening a level costs
+    the same however long it is.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.tile, self.columns, self.rows, self.chunks = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} level file")
+        self.terrain_size = self.columns * self.rows
+        self.chunk_size = self.terrain_size + ENCOUNTER.size * ENCOUNTERS_PER_CHUNK
+        self.chunk_width = self.columns * self.tile
+        self.width = self.chunks * self.chunk_width
+        if len(self.map) < HEADER.size + self.chunks * self.chunk_size:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def offset(self, index):
+        return HEADER.size + index * self.chunk_size
+
+    def terrain(self, index):
+        """Tiles of a chunk, column by column, as a view into the file"""
+        start = self.offset(index)
+        return memoryview(self.map)[start:start + self.terrain_size]
+
+    def encounters(self, index):
+        """Encounters in a chunk, ordered by position"""
+        start = self.offset(index) + self.terrain_size
+        encounters = []
+        for column, formation, count, y, spacing in ENCOUNTER.iter_unpack(
+                self.map[start:start + ENCOUNTER.size * ENCOUNTERS_PER_CHUNK]):
+            if column != EMPTY_SLOT:
+                x = index * self.chunk_width + column * self.tile
+                encounters.append(Encounter(x, formation, count, y, spacing))
+        encounters.sort(key=lambda encounter: encounter.x)
+        return encounters
+
+    def advise(self, index, advice):
+        """Pass a paging hint for a chunk to the OS, where supported"""
+        if not hasattr(self.map, "madvise"):
+            return
+        start = self.offset(index)
+        aligned = start - start % mmap.PAGESIZE
+        self.map.madvise(advice, aligned, start + self.chunk_size - aligned)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+def write_level(path, chunks, tile=20, columns=40, rows=30):
+    """Write a level from (terrain bytes, [(column, formation, count, y, spacing)]) pairs.
+
+    chunks can be any iterable, so long levels can be generated as they are
+    written.
+    """
+    count = 0
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, tile, columns, rows, 0))
+        for terrain, encounters in chunks:
+            if len(terrain) != columns * rows:
+                raise ValueError(f"chunk terrain must be {columns * rows} bytes")
+            if len(encounters) > ENCOUNTERS_PER_CHUNK:
+                raise ValueError(f"at most {ENCOUNTERS_PER_CHUNK} encounters per chunk")
+            file.write(terrain)
+            slots = list(encounters) + [(EMPTY_SLOT, 0, 0, 0, 0)] * (ENCOUNTERS_PER_CHUNK - len(encounters))
+            for slot in slots:
+                file.write(ENCOUNTER.pack(*slot))
+            count += 1
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, tile, columns, rows, count))
+
+def generate_level(path, chunks, seed=0, tile=20, columns=40, rows=30):
+    """Write a cave with a wandering ceiling and floor and an encounter per chunk"""
+    write_level(path, cave_chunks(chunks, random.Random(seed), tile, columns, rows), tile, columns, rows)
+
+def cave_chunks(chunks, generator, tile, columns, rows):
+    """Yield cave chunks one at a time"""
+    ceiling, floor = 2, 2
+    for index in range(chunks):
+        terrain = bytearray()
+        for _ in range(columns):
+            ceiling = min(max(ceiling + generator.choice((-1, 0, 1)), 0), 6)
+            floor = min(max(floor + generator.choice((-1, 0, 1)), 0), 6)
+            terrain += bytes([1] * ceiling + [0] * (rows - ceiling - floor) + [1] * floor)
+        # Leave the opening screen quiet
+        encounters = []
+        if index > 0:
+            formation = generator.choice((LINE, COLUMN))
+            count = generator.randint(3, 6)
+            spacing = 45 if formation == LINE else 40
+            top = 7 * tile
+            bottom = (rows - 7) * tile - (count * spacing if formation == COLUMN else 30)
+            y = generator.randint(top, max(top, bottom))
+            encounters.append((generator.randrange(columns), formation, count, y, spacing))
+        yield bytes(terrain), encounters
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a cave level file")
+    parser.add_argument("path")
+    parser.add_argument("--chunks", type=int, default=200, help="length in screens")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate_level(args.path, args.chunks, args.seed)
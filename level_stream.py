@@ -0,0 +1,108 @@
+import mmap
+import pygame
+
+class LevelStream:
+    """Scrolls a camera through a level, keeping only nearby chunks loaded.
+
+    Chunks are loaded as they come within `lookahead` pixels of the right
+    edge of the screen and released once the camera has passed them, so
+    memory use depends on the screen size, not the level length. Terrain is
+    read in place from the level's memory map; released chunks are handed
+    back to the OS.
+    """
+
+    def __init__(self, level, width, height, speed=2, lookahead=None):
+        self.level = level
+        self.width = width
+        self.height = height
+        self.speed = speed  # Pixels per tick
+        self.lookahead = level.chunk_width if lookahead is None else lookahead
+        self.camera = 0
+        self.chunks = {}  # Chunk index -> (terrain view, encounters)
+        self.color = (90, 70, 50)
+        self.stream()
+
+    @property
+    def end(self):
+        """Furthest camera position, with the last chunk filling the screen"""
+        return max(self.level.width - self.width, 0)
+
+    def advance(self):
+        """Scroll one tick and return the encounters the screen's edge reached"""
+        previous_edge = self.camera + self.width
+        self.camera = min(self.camera + self.speed, self.end)
+        self.stream()
+
+        edge = self.camera + self.width
+        reached = []
+        for index in range(previous_edge // self.level.chunk_width, edge // self.level.chunk_width + 1):
+            if index in self.chunks:
+                reached.extend(e for e in self.chunks[index][1] if previous_edge < e.x <= edge)
+        return reached
+
+    def stream(self):
+        """Load chunks about to come on screen and release those left behind"""
+        chunk_width = self.level.chunk_width
+        first = self.camera // chunk_width
+        last = min((self.camera + self.width + self.lookahead) // chunk_width, self.level.chunks - 1)
+        for index in [i for i in self.chunks if not first <= i <= last]:
+            self.release(index)
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                if hasattr(mmap, "MADV_WILLNEED"):
+                    self.level.advise(index, mmap.MADV_WILLNEED)
+                self.chunks[index] = (self.level.terrain(index), self.level.encounters(index))
+
+    def release(self, index):
+        terrain, _ = self.chunks.pop(index)
+        terrain.release()
+        if hasattr(mmap, "MADV_DONTNEED"):
+            self.level.advise(index, mmap.MADV_DONTNEED)
+
+    def solid(self, x, y):
+        """Whether the screen position is inside terrain"""
+        level = self.level
+        if not 0 <= y < level.rows * level.tile:
+            return False
+        x += self.camera
+        chunk = self.chunks.get(x // level.chunk_width)
+        if chunk is None:
+            return False
+        column = (x % level.chunk_width) // level.tile
+        return chunk[0][column * level.rows + y // level.tile] != 0
+
+    def draw(self, surface):
+        """Draw the terrain on screen, one rectangle per run of solid tiles"""
+        level = self.level
+        tile, rows = level.tile, level.rows
+        for index, (terrain, _) in self.chunks.items():
+            chunk_x = index * level.chunk_width - self.camera
+            for column in range(level.columns):
+                x = chunk_x + column * tile
+                if x + tile <= 0 or x >= self.width:
+                    continue
+                tiles = terrain[column * rows:(column + 1) * rows]
+                row = 0
+                while row < rows:
+                    if not tiles[row]:
+                        row += 1
+                        continue
+                    start = row
+                    while row < rows and tiles[row]:
+                        row += 1
+                    pygame.draw.rect(surface, self.color, (x, start * tile, tile, (row - start) * tile))
+
+    def snapshot(self):
+        return {"camera": self.camera}
+
+    def restore(self, state):
+        """Move the camera, streaming the chunks around it"""
+        for index in list(self.chunks):
+            self.release(index)
+        self.camera = state["camera"]
+        self.stream()
+
+    def close(self):
+        for index in list(self.chunks):
+            self.release(index)
+        self.level.close()
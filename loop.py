@@ -0,0 +1,149 @@
+import math
+import time
+import pygame
+from controls import Controls
+from metrics import REGISTRY
+
+FRAMES_RENDERED = REGISTRY.counter("frames_rendered_total", "Frames drawn to the window")
+FRAMES_SKIPPED = REGISTRY.counter("frames_skipped_total", "Frames the governor skipped to stay within budget")
+IDLE_WAITS = REGISTRY.counter("idle_waits_total", "Times the loop blocked on a static screen")
+UPDATE_MS = REGISTRY.histogram("update_ms", "Time spent stepping the simulation per tick")
+RENDER_MS = REGISTRY.histogram("render_ms", "Time spent rendering per drawn frame")
+
+class FrameLoop:
+    """Runs a game: input, simulation ticks, rendering and frame pacing.
+
+    In idle mode, once a static screen (paused, game over, wave transition)
+    has been drawn, the loop blocks in pygame.event.wait until input arrives
+    or the next timer is due instead of redrawing it every frame.
+
+    By default a frame polls input, updates, renders and then sleeps out the
+    rest of its period. In low-latency mode it sleeps first, until only the
+    time the governor expects the update and render to take (plus a margin)
+    is left, so input is polled as late as possible and the frame shows it
+    as soon as it can. With busy_loop the frame clock spins rather than
+    sleeps, for tighter pacing at the cost of a busy core.
+
+    A TelemetryWriter, if given, gets a row for every tick stepped.
+    """
+
+    LATE_POLL_MARGIN_MS = 2  # Slack left for the frame to overrun its estimate
+
+    def __init__(self, game, idle=True, low_latency=False, busy_loop=False, telemetry=None):
+        self.game = game
+        self.idle = idle
+        self.low_latency = low_latency
+        self.busy_loop = busy_loop
+        self.telemetry = telemetry
+        self.static_frame_drawn = False
+        self.woken = False  # An idle wait just ended, which starts the next frame
+
+    def run(self):
+        game = self.game
+        try:
+            while game.running:
+                if self.idle and self.static_frame_drawn and game.is_static():
+                    self.wait_while_idle()
+                self.run_frame()
+        finally:
+            # Also runs on Ctrl+C, so recordings and reports are complete
+            if game.memory_report:
+                game.memory_report.close()
+            if game.recorder:
+                game.recorder.close()
+            if game.latency:
+                game.latency.close()
+
+    def run_frame(self):
+        """Handle input, step the simulation and render one frame"""
+        game = self.game
+        if self.low_latency and not self.woken:
+            self.pace()
+            self.wait_to_poll()
+        self.woken = False
+        controls = game.handle_events()
+
+        start = time.perf_counter()
+        stepped = not game.paused
+        if stepped:
+            game.step(controls)
+            game.audio.flush()
+        update_ms = (time.perf_counter() - start) * 1000
+        UPDATE_MS.observe(update_ms)
+
+        render_ms = None
+        # Static screens are always drawn: the tick doesn't advance while
+        # paused, so it may never land on the governor's render interval
+        if game.is_static() or game.governor.should_render(game.tick):
+            start = time.perf_counter()
+            game.render()
+            render_ms = (time.perf_counter() - start) * 1000
+            RENDER_MS.observe(render_ms)
+            if game.latency:
+                game.latency.presented()
+            if game.publisher:
+                game.publisher.publish(game)
+            FRAMES_RENDERED.inc()
+            self.static_frame_drawn = game.is_static()
+        else:
+            FRAMES_SKIPPED.inc()
+
+        game.governor.record(update_ms, render_ms)
+        if self.telemetry and stepped:
+            self.telemetry.record(game, update_ms, render_ms)
+        if not self.low_latency:
+            self.pace()
+
+    def pace(self):
+        """Wait out the rest of the frame period since the last call"""
+        if self.busy_loop:
+            self.game.clock.tick_busy_loop(self.game.FPS)
+        else:
+            self.game.clock.tick(self.game.FPS)
+
+    def wait_to_poll(self):
+        """Hold off until just enough of the frame is left for its expected work"""
+        governor = self.game.governor
+        delay_ms = (governor.budget_ms - governor.estimated_cost(governor.level)
+                    - self.LATE_POLL_MARGIN_MS)
+        if delay_ms <= 0:
+            return
+        if self.busy_loop:
+            deadline = time.perf_counter() + delay_ms / 1000
+            while time.perf_counter() < deadline:
+                pass
+        else:
+            time.sleep(delay_ms / 1000)
+
+    def wait_while_idle(self):
+        """Block until input arrives or the wave transition is due"""
+        game = self.game
+        IDLE_WAITS.inc()
+
+        timer_running = game.wave_transition and not game.paused and not game.game_over
+        timeout = 0  # Wait for input indefinitely
+        if timer_running:
+            ticks = game.timers.remaining(game.wave_message_timer)
+            timeout = max(ticks * 1000 // game.FPS, 1)
+
+        start = pygame.time.get_ticks()
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)  # Leave it for handle_events
+
+        if timer_running:
+            # Run the ticks the simulation missed while blocked, keeping the
+            # timers and replays in step. The frame that follows runs the
+            # last one.
+            missed = (pygame.time.get_ticks() - start) * game.FPS // 1000
+            for _ in range(missed - 1):
+                if not game.wave_transition:
+                    break
+                game.step(Controls())
+                if self.telemetry:
+                    self.telemetry.record(game, math.nan)
+
+        # Reset the frame clock so the wait doesn't count as a slow frame
+        game.clock.tick()
+        self.static_frame_drawn = False
+        self.woken = True
@@ -1,11 +1,170 @@
 #!/usr/bin/env python3
 
+import argparse
+import logging
+import os
+
+# Keep pygame's import banner out of stdout, which may carry exported frames
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from autopilot import BOTS, ScriptedBot, parse_script
+from benchmark import run_benchmark, run_fire_stress
+from export import FrameExporter, export_replay
 from game import Game
+from latency import LatencyMonitor, LatencyProbe
+from level import Level
+from memory_report import MemoryReport
+from metrics import MetricsFlusher
+from replay import ReplayReader, ReplayViewer, ReplayWriter
+from shared_frames import SharedFrameWriter
+from telemetry import TelemetryWriter
+from weapons import WEAPONS
 
 def main():
+    parser = argparse.ArgumentParser(description="Side-Scrolling Shooter")
+    parser.add_argument("--level", metavar="FILE",
+                        help="play through a level file (make one with level.py) instead of endless waves")
+    parser.add_argument("--asset-report", action="store_true",
+                        help="print how long each asset took to load")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="print tracemalloc memory usage at the end of each wave")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the session to a replay file")
+    parser.add_argument("--hash", action="store_true",
+                        help="store a state hash for every tick in the --record file, for desync.py")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="watch a recorded replay file instead of playing")
+    parser.add_argument("--seek", type=int, default=0, metavar="TICK",
+                        help="tick to start watching a replay from")
+    parser.add_argument("--export", metavar="PATH",
+                        help="render the replay headlessly to PATH instead of showing it")
+    parser.add_argument("--export-format", choices=("png", "raw"), default="png",
+                        help="a directory of PNG frames, or raw RGB24 frames written to a file or pipe")
+    parser.add_argument("--share", metavar="NAME",
+                        help="publish each rendered frame and the game state to shared memory NAME for other processes")
+    parser.add_argument("--telemetry", metavar="DIR",
+                        help="log per-tick counts and frame times to .npy column files in DIR (summarise with telemetry.py)")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="periodically write gameplay and performance metrics to FILE")
+    parser.add_argument("--metrics-format", choices=("prometheus", "jsonl"), default="prometheus",
+                        help="Prometheus text (rewritten each flush) or JSON lines (appended)")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, metavar="SECONDS",
+                        help="how often metrics are written")
+    parser.add_argument("--fullscreen", action="store_true",
+                        help="scale the game to fill the screen")
+    parser.add_argument("--integer-scaling", action="store_true",
+                        help="only scale by whole pixel multiples in fullscreen")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=500, metavar="ENTITIES",
+                        help="time each system headlessly with this many enemies and projectiles")
+    parser.add_argument("--fire-stress", nargs="?", const="laser", choices=sorted(WEAPONS), metavar="WEAPON",
+                        help="hold the trigger of a weapon (default laser) headlessly and report frame times")
+    parser.add_argument("--autopilot", choices=sorted(BOTS),
+                        help="let a bot play: random input, greedy dodge-and-shoot, a scripted pattern or max fire rate")
+    parser.add_argument("--script", metavar="STEPS",
+                        help='pattern for --autopilot script, e.g. "30:up+fire 30:down+fire 10:none"')
+    parser.add_argument("--ticks", type=int, metavar="N",
+                        help="with --autopilot, quit after N ticks")
+    parser.add_argument("--latency", action="store_true",
+                        help="measure input-to-display latency and print its percentiles on exit")
+    parser.add_argument("--latency-probe", type=float, nargs="?", const=100, metavar="MS",
+                        help="with --latency, also post synthetic input about every MS milliseconds")
+    parser.add_argument("--low-latency", action="store_true",
+                        help="sleep before polling input instead of after presenting each frame")
+    parser.add_argument("--busy-loop", action="store_true",
+                        help="pace frames by spinning instead of sleeping, for tighter timing")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window or sound, e.g. for an --autopilot soak test")
+    parser.add_argument("--no-sound", action="store_true",
+                        help="run with a silent dummy audio driver")
+    parser.add_argument("--verbose", action="store_true",
+                        help="log frame governor decisions and other diagnostics")
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    headless = args.export or args.benchmark or args.fire_stress or args.headless
+    if headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    if headless or args.no_sound:
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if args.export:
+        if not args.replay:
+            parser.error("--export needs a --replay to render")
+    if args.hash and not args.record:
+        parser.error("--hash needs a --record file to store the hashes in")
+    if args.script:
+        if args.autopilot != "script":
+            parser.error("--script needs --autopilot script")
+        try:
+            args.script = parse_script(args.script)
+        except ValueError as error:
+            parser.error(str(error))
+    if args.latency_probe and not args.latency:
+        parser.error("--latency-probe needs --latency")
+    if args.ticks is not None and not args.autopilot:
+        parser.error("--ticks needs an --autopilot to play")
+
+    # Start tracing before the game exists so its allocations are counted
+    memory_report = MemoryReport() if args.memory_report else None
+
     # Create and run the game
-    game = Game()
-    game.run()
+    game = Game(args.fullscreen, args.integer_scaling)
+    game.memory_report = memory_report
+    if args.asset_report:
+        game.assets.report()
+    if args.level:
+        game.load_level(Level(args.level))
+
+    if args.benchmark:
+        run_benchmark(game, args.benchmark, args.benchmark)
+        return
+    if args.fire_stress:
+        run_fire_stress(game, args.fire_stress)
+        return
+
+    if args.share:
+        game.publisher = SharedFrameWriter(args.share, (game.width, game.height))
+    try:
+        if args.replay:
+            viewer = ReplayViewer(game, ReplayReader(args.replay))
+            if args.export:
+                exporter = FrameExporter(args.export, (game.width, game.height), args.export_format)
+                export_replay(viewer, exporter, args.seek)
+            else:
+                viewer.run(args.seek)
+            return
+        run(game, args)
+    finally:
+        if game.publisher:
+            game.publisher.close()
+
+def run(game, args):
+    """Play the game with the requested recording and metrics"""
+    if args.record:
+        game.recorder = ReplayWriter(args.record, game, hashes=args.hash)
+    if args.autopilot:
+        if args.script:
+            game.autopilot = ScriptedBot(args.script, ticks=args.ticks)
+        else:
+            game.autopilot = BOTS[args.autopilot](ticks=args.ticks)
+    if args.latency:
+        game.latency = LatencyMonitor()
+    probe = LatencyProbe(args.latency_probe / 1000) if args.latency_probe else None
+    telemetry = TelemetryWriter(args.telemetry) if args.telemetry else None
+    flusher = None
+    if args.metrics:
+        flusher = MetricsFlusher(args.metrics, args.metrics_format, args.metrics_interval)
+    try:
+        # A bot never sends the input an idle wait would block for
+        game.run(not game.autopilot, low_latency=args.low_latency, busy_loop=args.busy_loop,
+                 telemetry=telemetry)
+    finally:
+        if telemetry:
+            telemetry.close()
+        if probe:
+            probe.close()
+        if flusher:
+            flusher.close()
 
 if __name__ == "__main__":
     main()
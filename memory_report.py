@@ -0,0 +1,59 @@
+import sys
+import tracemalloc
+
+class MemoryReport:
+    """Per-wave memory accounting using tracemalloc.
+
+    Sampled once per tick. For each wave it records the memory in use when the
+    most entities were alive, which gives an estimate of bytes per live
+    entity, and the memory still in use when the wave ends. The end-of-wave
+    figure should stay flat across a long session.
+    """
+
+    def __init__(self, output=sys.stdout):
+        self.output = output
+        self.wave = None
+        self.rows = []
+        tracemalloc.start()
+
+    def sample(self, game):
+        """Record memory usage for the current tick"""
+        if game.current_wave != self.wave:
+            if self.wave is not None:
+                self.finish_wave()
+            self.start_wave(game.current_wave)
+
+        live = 1 + len(game.enemies) + len(game.projectiles)
+        if live > self.peak_entities:
+            self.peak_entities = live
+            self.peak_memory = tracemalloc.get_traced_memory()[0]
+
+    def start_wave(self, wave):
+        self.wave = wave
+        self.wave_start_memory = tracemalloc.get_traced_memory()[0]
+        self.peak_entities = 0
+        self.peak_memory = self.wave_start_memory
+
+    def finish_wave(self):
+        """Write the report line for the wave that just ended"""
+        end_memory = tracemalloc.get_traced_memory()[0]
+        growth = self.peak_memory - self.wave_start_memory
+        per_entity = growth / self.peak_entities if self.peak_entities else 0
+        row = (self.wave, self.peak_entities, per_entity, end_memory)
+        self.rows.append(row)
+        self.output.write(
+            f"wave {row[0]}: peak entities {row[1]}, "
+            f"~{row[2]:.0f} bytes/entity, {row[3] / 1024:.1f} KiB in use at wave end\n"
+        )
+        self.output.flush()
+
+    def close(self):
+        """Stop tracing and write the session summary"""
+        if self.rows:
+            first_end = self.rows[0][3]
+            last_end = self.rows[-1][3]
+            self.output.write(
+                f"{len(self.rows)} waves, end-of-wave memory changed by "
+                f"{(last_end - first_end) / 1024:+.1f} KiB\n"
+            )
+        tracemalloc.stop()
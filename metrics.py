@@ -0,0 +1,168 @@
+import bisect
+import json
+import logging
+import math
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class Counter:
+    """A value that only goes up, such as the number of shots fired"""
+
+    kind = "counter"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def sample(self):
+        return self.value
+
+class Gauge:
+    """A value that can go up and down, such as the number of live enemies"""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+    def sample(self):
+        return self.value
+
+class Histogram:
+    """Counts observations into cumulative buckets, Prometheus style"""
+
+    kind = "histogram"
+
+    # Upper bounds in milliseconds, around the 16.7 ms budget of a 60 FPS frame
+    DEFAULT_BUCKETS = (1, 2, 4, 8, 12, 16.7, 25, 33.3, 50, 100)
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets) + (math.inf,)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def sample(self):
+        """Cumulative bucket counts keyed by upper bound, plus sum and count"""
+        cumulative = []
+        total = 0
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return {
+            "buckets": {format_bound(b): c for b, c in zip(self.buckets, cumulative)},
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+def format_bound(bound):
+    return "+Inf" if bound == math.inf else f"{bound:g}"
+
+class Registry:
+    """Named metrics, created on first use so modules can declare their own"""
+
+    def __init__(self):
+        self.metrics = {}
+
+    def get(self, cls, name, help_text):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = cls(name, help_text)
+        return metric
+
+    def counter(self, name, help_text):
+        return self.get(Counter, name, help_text)
+
+    def gauge(self, name, help_text):
+        return self.get(Gauge, name, help_text)
+
+    def histogram(self, name, help_text):
+        return self.get(Histogram, name, help_text)
+
+    def to_prometheus(self):
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            sample = metric.sample()
+            if metric.kind == "histogram":
+                for bound, count in sample["buckets"].items():
+                    lines.append(f'{metric.name}_bucket{{le="{bound}"}} {count}')
+                lines.append(f"{metric.name}_sum {sample['sum']}")
+                lines.append(f"{metric.name}_count {sample['count']}")
+            else:
+                lines.append(f"{metric.name} {sample}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self):
+        """One JSON object with a timestamp and every metric's current value"""
+        record = {"time": time.time()}
+        for metric in self.metrics.values():
+            record[metric.name] = metric.sample()
+        return json.dumps(record)
+
+# Registry the game's modules report to
+REGISTRY = Registry()
+
+class MetricsFlusher:
+    """Writes a registry to a file every `interval` seconds from a background thread.
+
+    The prometheus format replaces the file on each flush, for a textfile
+    collector to scrape. The jsonl format appends one line per flush, which
+    keeps the history for charting trends over days.
+    """
+
+    def __init__(self, path, fmt="prometheus", interval=10.0, registry=REGISTRY):
+        if fmt not in ("prometheus", "jsonl"):
+            raise ValueError(f"unknown metrics format: {fmt}")
+        self.path = path
+        self.format = fmt
+        self.interval = interval
+        self.registry = registry
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.loop, daemon=True)
+        self.thread.start()
+
+    def loop(self):
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        try:
+            if self.format == "prometheus":
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, "w") as file:
+                    file.write(self.registry.to_prometheus())
+                os.replace(temp_path, self.path)
+            else:
+                with open(self.path, "a") as file:
+                    file.write(self.registry.to_json() + "\n")
+        except OSError as error:
+            # A full disk shouldn't take the game down with it
+            logger.warning("could not write metrics to %s: %s", self.path, error)
+
+    def close(self):
+        """Stop the thread and write a final flush"""
+        self.stopped.set()
+        self.thread.join()
+        self.flush()
@@ -1,26 +1,42 @@
 import pygame
-import time
-from projectile import Projectile
+from ecs import Archetype, Entity
+from weapons import DEFAULT_WEAPON, WEAPONS, spawn_volley
+
+class Player(Entity):
+    width = 40
+    height = 30
+    speed = 5
+    color = (0, 255, 0)  # Green color for player
+
+    archetype = Archetype(
+        "player",
+        ("x", "y", "is_ghost", "ghost_timer", "flash_timer", "ghost_duration", "visible", "flash_interval",
+         "weapon", "next_shot", "powerup_timer"),
+        tags=("player",), width=width, height=height, color=color,
+    )
+
+    __slots__ = ("game",)
 
-class Player:
     def __init__(self, x, y, game):
         self.game = game
-        self.x = x
-        self.y = y
-        self.width = 40
-        self.height = 30
-        self.speed = 5
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.color = (0, 255, 0)  # Green color for player
-        self.is_ghost = False
-        self.ghost_timer = 0
-        self.ghost_duration = 2000  # Duration in milliseconds (2 seconds)
-        self.visible = True  # For flashing effect during ghost state
-        self.flash_interval = 100  # Flash interval in milliseconds
+        self.world = game.world
+        self.id = game.world.spawn(
+            self.archetype, x=x, y=y,
+            is_ghost=False,
+            ghost_timer=None,  # Id of the timer that ends ghost state
+            flash_timer=None,  # Id of the repeating timer that flashes the player
+            ghost_duration=2000,  # Duration in milliseconds (2 seconds)
+            visible=True,  # For flashing effect during ghost state
+            flash_interval=100,  # Flash interval in milliseconds
+            weapon=DEFAULT_WEAPON,
+            next_shot=0,  # First tick the weapon can fire again
+            powerup_timer=None,  # Id of the timer that takes a power-up weapon away
+        )
     
-    def update(self):
-        """Update player position based on keypresses"""
-        keys = pygame.key.get_pressed()
+    def update(self, keys=None):
+        """Update player position based on keypresses or the given controls"""
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
         # Vertical movement
         if keys[pygame.K_UP] and self.y > 0:
@@ -33,44 +49,33 @@ class Player:
             self.x -= self.speed
         if keys[pygame.K_RIGHT] and self.x < self.game.width - self.width:
             self.x += self.speed
-        
-        # Update rectangle position
-        self.rect.x = self.x
-        self.rect.y = self.y
-        
-        # Update ghost state if active
-        if self.is_ghost:
-            current_time = pygame.time.get_ticks()
-            
-            # Update visibility for flashing effect
-            if current_time % (self.flash_interval * 2) < self.flash_interval:
-                self.visible = True
-            else:
-                self.visible = False
-                
-            # Check if ghost state should end
-            if current_time - self.ghost_timer >= self.ghost_duration:
-                self.exit_ghost_state()
-    
-    def draw(self, screen):
-        """Draw the player on the screen"""
-        if not self.is_ghost or self.visible:
-            pygame.draw.rect(screen, self.color, self.rect)
     
+    def trigger(self, controls):
+        """Fire the weapon if its trigger is down and it has cooled down"""
+        weapon = WEAPONS[self.weapon]
+        tick = self.game.tick
+        if (controls.fire or (weapon.automatic and controls.fire_held)) and tick >= self.next_shot:
+            self.shoot()
+            self.next_shot = tick + weapon.cooldown
+
     def shoot(self):
-        """Create a new projectile"""
-        projectile_x = self.x + self.width
-        projectile_y = self.y + self.height // 2
-        new_projectile = Projectile(projectile_x, projectile_y, self.game)
-        self.game.projectiles.append(new_projectile)
+        """Fire a volley from the current weapon, from the front of the ship"""
+        spawn_volley(self.game, WEAPONS[self.weapon], self.x + self.width, self.y + self.height // 2)
         
     def enter_ghost_state(self):
         """Enter ghost state where player is immune to collisions"""
+        timers = self.game.timers
+        timers.cancel(self.ghost_timer)
+        timers.cancel(self.flash_timer)
         self.is_ghost = True
-        self.ghost_timer = pygame.time.get_ticks()
         self.visible = True
+        self.ghost_timer = timers.schedule(timers.ticks(self.ghost_duration), "end_ghost", self.id)
+        flash_ticks = timers.ticks(self.flash_interval)
+        self.flash_timer = timers.schedule(flash_ticks, "flash", self.id, interval=flash_ticks)
     
     def exit_ghost_state(self):
         """Exit ghost state"""
+        self.game.timers.cancel(self.ghost_timer)
+        self.game.timers.cancel(self.flash_timer)
         self.is_ghost = False
         self.visible = True
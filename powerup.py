@@ -0,0 +1,23 @@
+from ecs import Archetype, Entity
+from metrics import REGISTRY
+
+POWERUPS_MISSED = REGISTRY.counter("powerups_missed_total", "Power-ups that drifted off screen")
+
+class PowerUp(Entity):
+    """A pickup that arms the player with a special weapon for a while"""
+
+    width = 20
+    height = 20
+    speed = 1.5
+    color = (0, 200, 255)  # Cyan color for power-ups
+
+    archetype = Archetype(
+        "powerup", ("x", "y", "prev_x", "vx", "weapon"), tags=("powerup", "expires_offscreen"),
+        width=width, height=height, color=color, expired_counter=POWERUPS_MISSED,
+    )
+
+    __slots__ = ()
+
+    def __init__(self, x, y, weapon, game):
+        self.world = game.world
+        self.id = game.world.spawn(self.archetype, x=x, y=y, prev_x=x, vx=-self.speed, weapon=weapon)
@@ -1,26 +1,24 @@
-import pygame
+from ecs import Archetype, Entity
+from metrics import REGISTRY
 
-class Projectile:
-    def __init__(self, x, y, game):
-        self.game = game
-        self.x = x
-        self.y = y
-        self.width = 10
-        self.height = 5
-        self.speed = 7
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.color = (255, 255, 0)  # Yellow color for projectiles
-    
-    def update(self):
-        """Update projectile position"""
-        self.x += self.speed
-        self.rect.x = self.x
-        self.rect.y = self.y
-        
-        # Remove projectile if it goes off screen
-        if self.x > self.game.width:
-            self.game.projectiles.remove(self)
-    
-    def draw(self, screen):
-        """Draw the projectile on the screen"""
-        pygame.draw.rect(screen, self.color, self.rect)
+PROJECTILES_EXPIRED = REGISTRY.counter("projectiles_expired_total", "Projectiles that left the screen")
+
+class Projectile(Entity):
+    # Shared by every projectile, so they live on the class rather than each entity
+    width = 10
+    height = 5
+    speed = 7
+    color = (255, 255, 0)  # Yellow color for projectiles
+
+    # vy is only non-zero for angled shots such as the spread weapon's
+    archetype = Archetype(
+        "projectile", ("x", "y", "prev_x", "prev_y", "vy"), tags=("projectile", "expires_offscreen"),
+        width=width, height=height, color=color, vx=speed, expired_counter=PROJECTILES_EXPIRED,
+    )
+
+    __slots__ = ()
+
+    def __init__(self, x, y, game, vy=0):
+        # prev_x and prev_y are the position at the start of the tick, for swept collisions
+        self.world = game.world
+        self.id = game.world.spawn(self.archetype, x=x, y=y, prev_x=x, prev_y=y, vy=vy)
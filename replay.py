@@ -0,0 +1,222 @@
+import bisect
+import json
+import logging
+import random
+import struct
+import zlib
+import pygame
+from controls import Controls
+from game_state import snapshot, restore
+from statehash import state_hash
+
+log = logging.getLogger("replay")
+
+# File layout: a header, then a stream of tagged records.
+#   I <tick delta> <mask>     controls changed (tick relative to the previous I record)
+#   K <tick> <length> <data>  keyframe: zlib-compressed JSON snapshot of the game
+#   H <tick> <hash>           64-bit state hash before the tick, little-endian
+#   E <tick>                  end of recording
+# Integers in records are unsigned LEB128 varints.
+MAGIC = b"SSRP"
+VERSION = 8
+HEADER = struct.Struct("<4sBQIH")  # magic, version, seed, keyframe interval, FPS
+HASH = struct.Struct("<Q")
+
+def write_varint(file, value):
+    while value >= 0x80:
+        file.write(bytes((value & 0x7F | 0x80,)))
+        value >>= 7
+    file.write(bytes((value,)))
+
+def read_varint(data, pos):
+    """Decode a varint at pos, returning (value, next position)"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+class ReplayWriter:
+    """Streams a session's inputs and periodic keyframes to a replay file.
+
+    Seeds the global random generator, so the recording can be played back
+    exactly. With hashes=True a
+    state hash is stored for every tick, so playback can detect exactly where
+    it stops matching the original run.
+    """
+
+    def __init__(self, path, game, seed=None, keyframe_interval=600, hashes=False):
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        random.seed(seed)
+
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, keyframe_interval, game.FPS))
+        self.keyframe_interval = keyframe_interval
+        self.hashes = hashes
+        self.next_keyframe = game.tick
+        self.last_input_tick = game.tick
+        self.last_mask = 0
+        self.end_tick = game.tick
+
+    def record(self, game, controls):
+        """Record the controls for the tick the game is about to step"""
+        if game.tick >= self.next_keyframe:
+            data = zlib.compress(json.dumps(snapshot(game)).encode())
+            self.file.write(b"K")
+            write_varint(self.file, game.tick)
+            write_varint(self.file, len(data))
+            self.file.write(data)
+            self.next_keyframe = game.tick + self.keyframe_interval
+
+        if controls.mask != self.last_mask:
+            self.file.write(b"I")
+            write_varint(self.file, game.tick - self.last_input_tick)
+            self.file.write(bytes((controls.mask,)))
+            self.last_input_tick = game.tick
+            self.last_mask = controls.mask
+
+        if self.hashes:
+            self.file.write(b"H")
+            write_varint(self.file, game.tick)
+            self.file.write(HASH.pack(state_hash(game)))
+
+        self.end_tick = game.tick + 1
+
+    def close(self):
+        self.file.write(b"E")
+        write_varint(self.file, self.end_tick)
+        self.file.close()
+
+class ReplayReader:
+    """Indexes a replay file so controls and keyframes can be looked up by tick"""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, self.seed, self.keyframe_interval, self.fps = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay file")
+
+        self.data = data
+        self.input_ticks = []
+        self.input_masks = []
+        self.keyframe_ticks = []
+        self.keyframe_spans = []
+        self.hashes = {}  # Tick -> state hash, if the recording has them
+        self.end_tick = 0
+
+        pos = HEADER.size
+        input_tick = 0
+        while pos < len(data):
+            tag = data[pos:pos + 1]
+            if tag == b"I":
+                delta, pos = read_varint(data, pos + 1)
+                input_tick += delta
+                self.input_ticks.append(input_tick)
+                self.input_masks.append(data[pos])
+                pos += 1
+                self.end_tick = max(self.end_tick, input_tick + 1)
+            elif tag == b"K":
+                tick, pos = read_varint(data, pos + 1)
+                length, pos = read_varint(data, pos)
+                if not self.keyframe_ticks:
+                    input_tick = tick  # Input deltas start from the first keyframe
+                self.keyframe_ticks.append(tick)
+                self.keyframe_spans.append((pos, pos + length))
+                pos += length
+                self.end_tick = max(self.end_tick, tick + 1)
+            elif tag == b"H":
+                tick, pos = read_varint(data, pos + 1)
+                if pos + HASH.size > len(data):
+                    break
+                self.hashes[tick] = HASH.unpack_from(data, pos)[0]
+                pos += HASH.size
+            elif tag == b"E":
+                self.end_tick, pos = read_varint(data, pos + 1)
+            else:
+                # A recording cut short by a crash ends mid-record
+                break
+
+        if not self.keyframe_ticks:
+            raise ValueError(f"{path} contains no keyframes")
+
+    @property
+    def start_tick(self):
+        return self.keyframe_ticks[0]
+
+    def controls_at(self, tick):
+        """Controls that were in effect at the given tick"""
+        i = bisect.bisect_right(self.input_ticks, tick) - 1
+        return Controls(self.input_masks[i] if i >= 0 else 0)
+
+    def keyframe_before(self, tick):
+        """Return (tick, state) for the latest keyframe at or before the given tick"""
+        i = max(bisect.bisect_right(self.keyframe_ticks, tick) - 1, 0)
+        start, end = self.keyframe_spans[i]
+        return self.keyframe_ticks[i], json.loads(zlib.decompress(self.data[start:end]))
+
+class ReplayViewer:
+    """Plays a replay back in real time, with seeking via keyframes.
+
+    Left and right arrows jump back and forward by SEEK_SECONDS.
+    """
+
+    SEEK_SECONDS = 10
+
+    def __init__(self, game, reader):
+        self.game = game
+        self.reader = reader
+        self.desync_tick = None  # First tick whose state hash didn't match the recording
+
+    def step(self):
+        """Step one recorded tick, checking the state against its recorded hash"""
+        game = self.game
+        expected = self.reader.hashes.get(game.tick)
+        if expected is not None and self.desync_tick is None and state_hash(game) != expected:
+            self.desync_tick = game.tick
+            log.warning("playback diverged from the recording at tick %d", game.tick)
+        game.step(self.reader.controls_at(game.tick))
+
+    def seek(self, tick):
+        """Restore the nearest keyframe and fast-forward to the tick without rendering"""
+        tick = min(max(tick, self.reader.start_tick), self.reader.end_tick)
+        _, state = self.reader.keyframe_before(tick)
+        restore(self.game, state)
+        while self.game.tick < tick:
+            self.step()
+        # Skipped ticks stay silent
+        self.game.audio.discard()
+
+    def run(self, start_tick=0):
+        """Play from start_tick until the window is closed"""
+        game = self.game
+        self.seek(start_tick)
+        seek_ticks = self.SEEK_SECONDS * self.reader.fps
+
+        while game.running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    game.running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key in (pygame.K_q, pygame.K_ESCAPE):
+                        game.running = False
+                    elif event.key == pygame.K_RIGHT:
+                        self.seek(game.tick + seek_ticks)
+                    elif event.key == pygame.K_LEFT:
+                        self.seek(game.tick - seek_ticks)
+
+            if game.tick < self.reader.end_tick:
+                self.step()
+                game.audio.flush()
+            game.render()
+            if game.publisher:
+                game.publisher.publish(game)
+            game.clock.tick(self.reader.fps)
+
+        pygame.quit()
@@ -0,0 +1,223 @@
+import argparse
+import struct
+import sys
+import time
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+import pygame
+from enemy import Enemy
+from metrics import REGISTRY
+from projectile import Projectile
+
+FRAMES_PUBLISHED = REGISTRY.counter("frames_published_total", "Frames written to shared memory")
+PUBLISH_MS = REGISTRY.histogram("publish_ms", "Time spent publishing a frame to shared memory")
+
+MAGIC = b"SSFR"
+VERSION = 1
+# magic, version, slot count, width, height, entity capacity, slot size.
+# The sequence number of the latest complete frame follows it.
+HEADER = struct.Struct("<4sBBHHHI")
+LATEST = struct.Struct("<Q")
+# Per slot: a sequence word that is odd while the slot is being written
+SEQUENCE = struct.Struct("<Q")
+# tick, score, lives, wave, game over, player visible, player x, player y,
+# enemy count, projectile count
+STATE = struct.Struct("<qiiiBBxxffII")
+ALIGN = 64
+PIXEL_FORMAT = "BGRA"  # Byte order of the screen's own 32-bit pixels, so the copy is a plain blit
+
+SharedFrame = namedtuple(
+    "SharedFrame", "sequence tick score lives wave game_over player enemies projectiles pixels")
+
+def aligned(size):
+    return -(-size // ALIGN) * ALIGN
+
+def layout(size, capacity):
+    """Offsets within a slot: (state, entity arrays, pixels, slot size)"""
+    state = SEQUENCE.size
+    arrays = state + STATE.size
+    pixels = aligned(arrays + 6 * 4 * capacity)  # ids, x and y for enemies and projectiles
+    return state, arrays, pixels, aligned(pixels + size[0] * size[1] * 4)
+
+class SharedFrameWriter:
+    """Publishes rendered frames and game state into a shared memory ring.
+
+    Each slot holds one frame: the screen's pixels as BGRA bytes and a
+    fixed-layout state block with the player, the score and the enemy and
+    projectile positions as packed id, x and y arrays. Slots are reused
+    round-robin. A slot's sequence word is odd while it is being written and
+    twice the frame's sequence number once complete, so readers can spot a
+    frame that was overwritten under them without any locking.
+
+    The pixels are copied with one blit straight into the shared memory and
+    the state with struct.pack_into, so publishing costs a fraction of a
+    millisecond and happens after Game.render, not inside it. Enemies and
+    projectiles beyond `capacity` are left out.
+    """
+
+    def __init__(self, name, size, slots=4, capacity=1024):
+        self.size = size
+        self.capacity = capacity
+        self.slot_count = slots
+        self.state_offset, self.arrays_offset, self.pixels_offset, self.slot_size = layout(size, capacity)
+        self.memory = shared_memory.SharedMemory(name, create=True, size=ALIGN + slots * self.slot_size)
+        self.buffer = self.memory.buf
+        HEADER.pack_into(self.buffer, 0, MAGIC, VERSION, slots, size[0], size[1], capacity, self.slot_size)
+        LATEST.pack_into(self.buffer, HEADER.size, 0)
+        self.sequence = 0
+
+        # Surfaces drawing straight into each slot's pixels
+        self.surfaces = []
+        for slot in range(slots):
+            start = self.slot_start(slot) + self.pixels_offset
+            pixels = self.buffer[start:start + size[0] * size[1] * 4]
+            self.surfaces.append(pygame.image.frombuffer(pixels, size, PIXEL_FORMAT))
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def slot_start(self, slot):
+        return ALIGN + slot * self.slot_size
+
+    def publish(self, game, surface=None):
+        """Write a rendered frame, by default the game's screen, and the game state"""
+        started = time.perf_counter()
+        self.sequence += 1
+        slot = self.sequence % self.slot_count
+        start = self.slot_start(slot)
+        buffer = self.buffer
+
+        SEQUENCE.pack_into(buffer, start, 2 * self.sequence - 1)
+        self.surfaces[slot].blit(game.screen if surface is None else surface, (0, 0))
+        player = game.player
+        enemies = self.pack(game.world, Enemy, start + self.arrays_offset)
+        projectiles = self.pack(game.world, Projectile, start + self.arrays_offset + 12 * self.capacity)
+        STATE.pack_into(buffer, start + self.state_offset, game.tick, game.score, game.lives,
+                        game.current_wave, game.game_over, player.visible, player.x, player.y,
+                        enemies, projectiles)
+        SEQUENCE.pack_into(buffer, start, 2 * self.sequence)
+        LATEST.pack_into(buffer, HEADER.size, self.sequence)
+
+        FRAMES_PUBLISHED.inc()
+        PUBLISH_MS.observe((time.perf_counter() - started) * 1000)
+
+    def pack(self, world, handle_class, offset):
+        """Write an archetype's ids, x and y as three arrays and return how many"""
+        table = world.tables.get(handle_class.archetype)
+        if table is None:
+            return 0
+        count = min(len(table), self.capacity)
+        step = 4 * self.capacity
+        struct.pack_into(f"<{count}I", self.buffer, offset, *table.ids[:count])
+        struct.pack_into(f"<{count}f", self.buffer, offset + step, *table.columns["x"][:count])
+        struct.pack_into(f"<{count}f", self.buffer, offset + 2 * step, *table.columns["y"][:count])
+        return count
+
+    def close(self):
+        """Release the shared memory; readers still attached keep their mapping"""
+        self.surfaces = []
+        self.buffer.release()
+        self.memory.close()
+        self.memory.unlink()
+
+class SharedFrameReader:
+    """Reads frames published by a SharedFrameWriter in another process.
+
+    read() returns the latest complete frame with its pixels and entity
+    arrays as memoryviews into the shared memory, so nothing is copied or
+    unpickled. The writer keeps going, though: once a consumer is done with
+    a frame, valid() says whether the slot still held it the whole time.
+    Drop every frame before calling close().
+    """
+
+    def __init__(self, name):
+        try:
+            self.memory = shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the segment with this
+            # process's resource tracker, which would unlink it on exit
+            self.memory = shared_memory.SharedMemory(name)
+            resource_tracker.unregister(self.memory._name, "shared_memory")
+        self.buffer = self.memory.buf
+        magic, version, self.slot_count, width, height, self.capacity, self.slot_size = \
+            HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{name} is not a version {VERSION} shared frame buffer")
+        self.size = (width, height)
+        self.state_offset, self.arrays_offset, self.pixels_offset, _ = layout(self.size, self.capacity)
+
+    def latest(self):
+        """Sequence number of the newest complete frame, 0 before the first"""
+        return LATEST.unpack_from(self.buffer, HEADER.size)[0]
+
+    def slot_start(self, sequence):
+        return ALIGN + (sequence % self.slot_count) * self.slot_size
+
+    def read(self, sequence=None):
+        """The frame with this sequence number (default the latest), or None
+        if it hasn't been published yet or its slot has since been reused"""
+        if sequence is None:
+            sequence = self.latest()
+        if not 0 < sequence <= self.latest():
+            return None
+        start = self.slot_start(sequence)
+        if SEQUENCE.unpack_from(self.buffer, start)[0] != 2 * sequence:
+            return None
+
+        tick, score, lives, wave, game_over, visible, x, y, enemies, projectiles = \
+            STATE.unpack_from(self.buffer, start + self.state_offset)
+        arrays = start + self.arrays_offset
+        frame = SharedFrame(
+            sequence, tick, score, lives, wave, bool(game_over), (x, y, bool(visible)),
+            self.entities(arrays, enemies),
+            self.entities(arrays + 12 * self.capacity, projectiles),
+            self.buffer[start + self.pixels_offset:start + self.pixels_offset + self.size[0] * self.size[1] * 4],
+        )
+        return frame if self.valid(frame) else None
+
+    def entities(self, offset, count):
+        """(ids, xs, ys) memoryviews for one archetype's packed arrays"""
+        step = 4 * self.capacity
+        return tuple(self.buffer[start:start + 4 * count].cast(code)
+                     for start, code in ((offset, "I"), (offset + step, "f"), (offset + 2 * step, "f")))
+
+    def valid(self, frame):
+        """Whether the frame's slot still holds it, i.e. nothing read from it was torn"""
+        return SEQUENCE.unpack_from(self.buffer, self.slot_start(frame.sequence))[0] == 2 * frame.sequence
+
+    def close(self):
+        self.buffer.release()
+        self.memory.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Follow the frames a game publishes with --share")
+    parser.add_argument("name", help="shared memory name given to --share")
+    parser.add_argument("--interval", type=float, default=0.005, metavar="SECONDS",
+                        help="how often to poll for a new frame")
+    args = parser.parse_args()
+
+    reader = SharedFrameReader(args.name)
+    last = reader.latest()
+    try:
+        while True:
+            latest = reader.latest()
+            if latest == last:
+                time.sleep(args.interval)
+                continue
+            frame = reader.read(latest)
+            if frame is not None:
+                print(f"frame {frame.sequence} tick {frame.tick} score {frame.score} lives {frame.lives} "
+                      f"wave {frame.wave} enemies {len(frame.enemies[0])} "
+                      f"projectiles {len(frame.projectiles[0])} missed {latest - last - 1}", flush=True)
+                del frame
+            last = latest
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
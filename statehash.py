@@ -0,0 +1,33 @@
+import hashlib
+import marshal
+import random
+from game_state import GAME_FIELDS
+
+# Marshal format 2 encodes floats bit for bit and, unlike later formats,
+# never depends on object identity, so equal states always serialise the same
+MARSHAL_VERSION = 2
+
+def digest(value):
+    """64-bit hash of plain data that is the same in every process"""
+    data = marshal.dumps(value, MARSHAL_VERSION)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+def section_hashes(game):
+    """Hash each part of the simulation state separately, by name"""
+    timers = game.timers
+    sections = {
+        "game": digest(tuple(getattr(game, name) for name in GAME_FIELDS)),
+        "random": digest(random.getstate()),
+        "timers": digest((timers.now,) + tuple(
+            (t.id, t.due, t.event, t.args, t.interval) for t in timers.timers.values())),
+    }
+    if game.level:
+        sections["level"] = digest(game.level.camera)
+    for table in game.world.tables.values():
+        sections[table.archetype.name] = digest(
+            (tuple(table.ids),) + tuple(tuple(column) for column in table.columns.values()))
+    return sections
+
+def state_hash(game):
+    """64-bit hash of the full simulation state, cheap enough to take every tick"""
+    return digest(tuple(section_hashes(game).values()))
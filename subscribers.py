@@ -0,0 +1,49 @@
+from events import EnemyKilled, PlayerHit, PowerUpCollected, ShotFired, WaveCompleted
+from metrics import REGISTRY
+from weapons import drop_powerups
+
+SHOTS_FIRED = REGISTRY.counter("shots_fired_total", "Projectiles fired by the player")
+ENEMIES_KILLED = REGISTRY.counter("enemies_killed_total", "Enemies destroyed by projectiles")
+PLAYER_HITS = REGISTRY.counter("player_hits_total", "Times the player was hit")
+WAVES_COMPLETED = REGISTRY.counter("waves_completed_total", "Waves cleared")
+POWERUPS_COLLECTED = REGISTRY.counter("powerups_collected_total", "Power-ups picked up by the player")
+
+# Counter for each event type
+STATS = {
+    ShotFired: SHOTS_FIRED,
+    EnemyKilled: ENEMIES_KILLED,
+    PlayerHit: PLAYER_HITS,
+    WaveCompleted: WAVES_COMPLETED,
+    PowerUpCollected: POWERUPS_COLLECTED,
+}
+
+# Sound effect for each event type
+SOUNDS = {
+    ShotFired: "shoot",
+    EnemyKilled: "explosion",
+}
+
+def score_kills(game, events):
+    game.score += 10 * len(events)
+
+def lose_lives(game, events):
+    game.lives -= len(events)
+    if game.lives <= 0 and not game.game_over:
+        game.game_over = True
+        game.audio.play("game_over")
+
+def count(game, events):
+    STATS[type(events[0])].inc(len(events))
+
+def play_sound(game, events):
+    game.audio.play(SOUNDS[type(events[0])])
+
+def subscribe_all(bus):
+    """Subscribe the game's scoring, power-up drop, stats and sound handlers to an event bus"""
+    bus.subscribe(EnemyKilled, score_kills)
+    bus.subscribe(EnemyKilled, drop_powerups)
+    bus.subscribe(PlayerHit, lose_lives)
+    for event_type in STATS:
+        bus.subscribe(event_type, count)
+    for event_type in SOUNDS:
+        bus.subscribe(event_type, play_sound)
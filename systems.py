@@ -0,0 +1,205 @@
+import random
+import pygame
+from enemy import Enemy
+from events import EnemyKilled, PlayerHit, PowerUpCollected
+from level import COLUMN
+from metrics import REGISTRY
+from player import Player
+from waves import start_next_wave
+from weapons import DEFAULT_WEAPON, arm
+
+ENEMIES_SPAWNED = REGISTRY.counter("enemies_spawned_total", "Enemies spawned")
+COLLISION_TESTS = REGISTRY.counter("collision_tests_total", "Projectile-enemy pairs tested for collision")
+
+def control_player(game):
+    """Move the player from this tick's controls"""
+    game.player.update(game.controls)
+
+def spawn_enemy(game):
+    """Spawn one enemy, stopping the spawn timer once the wave has all of them"""
+    spawn_enemy_at(game, random.randint(50, game.height - 50))
+    if game.wave_enemies_spawned >= game.wave_enemies_required:
+        game.timers.cancel(game.spawn_timer)
+
+def spawn_enemy_at(game, y):
+    """Spawn one of the current wave's enemies at the right edge"""
+    Enemy(game.width, y, game)
+    game.wave_enemies_spawned += 1
+    ENEMIES_SPAWNED.inc()
+
+def spawn_encounter(game, encounter):
+    """Add a level encounter's enemies to the current wave"""
+    game.wave_enemies_required += encounter.count
+    for i in range(encounter.count):
+        if encounter.formation == COLUMN:
+            spawn_enemy_at(game, encounter.y + i * encounter.spacing)
+        elif i == 0:
+            spawn_enemy_at(game, encounter.y)
+        else:
+            # A line enters one enemy at a time, spaced out at average speed
+            game.timers.schedule(i * encounter.spacing // 2, "spawn_enemy_at", encounter.y)
+
+def flash(game, entity):
+    """Toggle the visibility of an entity in ghost state"""
+    if game.world.alive(entity):
+        game.world.set(entity, "visible", not game.world.get(entity, "visible"))
+
+def end_ghost(game, entity):
+    """End the player's ghost state when its time is up"""
+    if game.world.alive(entity):
+        player = Player.attach(game.world, entity)
+        player.game = game
+        player.exit_ghost_state()
+
+def end_powerup(game, entity):
+    """Take a power-up weapon away when its time is up"""
+    world = game.world
+    if world.alive(entity):
+        world.set(entity, "weapon", DEFAULT_WEAPON)
+        world.set(entity, "powerup_timer", None)
+
+# Timer events, by the names they are scheduled with
+TIMER_HANDLERS = {
+    "spawn_enemy": spawn_enemy,
+    "spawn_enemy_at": spawn_enemy_at,
+    "flash": flash,
+    "end_ghost": end_ghost,
+    "end_powerup": end_powerup,
+    "next_wave": start_next_wave,  # Once the wave message has been shown
+}
+
+def move(game):
+    """Move entities, remembering where they started the tick"""
+    for table in game.world.query("x", "prev_x"):
+        columns = table.columns
+        xs = columns["x"]
+        columns["prev_x"] = xs
+        if "vx" in columns:
+            columns["x"] = [x + vx for x, vx in zip(xs, columns["vx"])]
+        else:
+            vx = table.shared["vx"]
+            columns["x"] = [x + vx for x in xs]
+        if "vy" in columns:
+            ys = columns["y"]
+            columns["prev_y"] = ys
+            columns["y"] = [y + vy for y, vy in zip(ys, columns["vy"])]
+
+def scroll_level(game):
+    """Scroll through the level, triggering the encounters that come into view"""
+    if game.level:
+        for encounter in game.level.advance():
+            spawn_encounter(game, encounter)
+
+def expire_offscreen(game):
+    """Despawn entities that have left the screen"""
+    world = game.world
+    for table in world.query("x", "y", "expires_offscreen"):
+        width = table.shared["width"]
+        height = table.shared["height"]
+        columns = table.columns
+        expired = [entity for entity, x, y in zip(table.ids, columns["x"], columns["y"])
+                   if x + width < 0 or x > game.width or y + height < 0 or y > game.height]
+        for entity in expired:
+            world.despawn(entity)
+        table.shared["expired_counter"].inc(len(expired))
+
+def hit_player(game, cause):
+    """Report a hit on the player and make it a ghost for a while"""
+    game.events.emit(PlayerHit(cause))
+    # Ghost state starts straight away, so nothing else can hit the player
+    # before the tick's events are handled
+    game.player.enter_ghost_state()
+
+def collide_player(game):
+    """Hit the player with any enemy touching it, unless it is a ghost"""
+    player = game.player
+    if player.is_ghost:
+        return
+
+    world = game.world
+    player_x, player_y = player.x, player.y
+    for table in world.query("enemy", "x", "y"):
+        width = table.shared["width"]
+        height = table.shared["height"]
+        columns = table.columns
+        for entity, x, y in zip(table.ids, columns["x"], columns["y"]):
+            if (x < player_x + player.width and player_x < x + width
+                    and y < player_y + player.height and player_y < y + height):
+                world.despawn(entity)
+                hit_player(game, "enemy")
+                # Ghosts can't be hit again
+                return
+
+def collect_powerups(game):
+    """Arm the player with the weapon of any power-up it touches"""
+    world = game.world
+    player = game.player
+    player_x, player_y = player.x, player.y
+    for table in world.query("powerup", "x", "y"):
+        width = table.shared["width"]
+        height = table.shared["height"]
+        columns = table.columns
+        collected = [(entity, weapon) for entity, x, y, weapon
+                     in zip(table.ids, columns["x"], columns["y"], columns["weapon"])
+                     if x < player_x + player.width and player_x < x + width
+                     and y < player_y + player.height and player_y < y + height]
+        for entity, weapon in collected:
+            world.despawn(entity)
+            arm(game, weapon)
+            game.events.emit(PowerUpCollected(weapon))
+
+def collide_terrain(game):
+    """Hit the player if it touches terrain, and stop projectiles that reach it"""
+    level = game.level
+    if not level:
+        return
+
+    player = game.player
+    if not player.is_ghost:
+        left, top = int(player.x), int(player.y)
+        right, bottom = left + player.width - 1, top + player.height - 1
+        if any(level.solid(x, y) for x in (left, right) for y in (top, bottom)):
+            hit_player(game, "terrain")
+
+    world = game.world
+    for table in world.query("projectile", "x", "y"):
+        front = table.shared["width"]
+        middle = table.shared["height"] // 2
+        blocked = [entity for entity, x, y in zip(table.ids, table.columns["x"], table.columns["y"])
+                   if level.solid(int(x) + front, int(y) + middle)]
+        for entity in blocked:
+            world.despawn(entity)
+
+def collide_projectiles(game):
+    """Destroy projectiles and the enemies they hit"""
+    world = game.world
+    events = game.events
+    for projectile, enemy in game.collisions.find_hits(world):
+        events.emit(EnemyKilled(world.get(enemy, "x"), world.get(enemy, "y")))
+        world.despawn(projectile)
+        world.despawn(enemy)
+    COLLISION_TESTS.inc(game.collisions.tests)
+
+# Run in this order by Game.update every tick
+SYSTEMS = [
+    control_player,
+    scroll_level,
+    move,
+    expire_offscreen,
+    collide_player,
+    collect_powerups,
+    collide_terrain,
+    collide_projectiles,
+]
+
+def render(world, surface):
+    """Draw every entity with a colour as a rectangle of its archetype's size"""
+    for table in world.query("x", "y"):
+        shared = table.shared
+        color = shared["color"]
+        size = (shared["width"], shared["height"])
+        columns = table.columns
+        visible = columns.get("visible")
+        for row, (x, y) in enumerate(zip(columns["x"], columns["y"])):
+            if visible is None or visible[row]:
+                pygame.draw.rect(surface, color, (x, y) + size)
@@ -0,0 +1,199 @@
+import argparse
+import ast
+import logging
+import math
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+from array import array
+
+logger = logging.getLogger(__name__)
+
+ENDIAN = "<" if sys.byteorder == "little" else ">"
+# Name, array typecode and NumPy dtype of each column
+COLUMNS = (
+    ("tick", "q", "i8"),
+    ("wave", "i", "i4"),
+    ("enemies", "i", "i4"),
+    ("projectiles", "i", "i4"),
+    ("score", "q", "i8"),
+    ("lives", "i", "i4"),
+    ("update_ms", "f", "f4"),
+    ("render_ms", "f", "f4"),  # NaN for ticks that weren't drawn
+)
+
+NPY_MAGIC = b"\x93NUMPY"
+# Fixed header size, with room to rewrite the length in place as a file grows
+NPY_HEADER_SIZE = 128
+
+def npy_header(dtype, length):
+    """Version 1.0 .npy header for a one-dimensional array"""
+    text = f"{{'descr': '{ENDIAN}{dtype}', 'fortran_order': False, 'shape': ({length},), }}"
+    text = text.ljust(NPY_HEADER_SIZE - 11) + "\n"
+    return NPY_MAGIC + bytes((1, 0)) + struct.pack("<H", len(text)) + text.encode("latin1")
+
+def parse_npy_header(data):
+    """(descr, length, data offset) of a one-dimensional .npy file"""
+    if data[:6] != NPY_MAGIC or data[6] != 1:
+        raise ValueError("not a version 1 .npy file")
+    size = struct.unpack_from("<H", data, 8)[0]
+    header = ast.literal_eval(bytes(data[10:10 + size]).decode("latin1"))
+    if header["fortran_order"] or len(header["shape"]) != 1:
+        raise ValueError("expected a one-dimensional array")
+    return header["descr"], header["shape"][0], 10 + size
+
+class TelemetryWriter:
+    """Logs one row per tick into a directory of .npy column files.
+
+    Rows go into preallocated column arrays, so recording a tick is a few
+    item assignments. Each full block of `block_size` rows is handed to a
+    background thread, which appends every column to its file and then
+    rewrites the file's header with the new length. Spare blocks are
+    recycled; if the thread falls `blocks` behind, recording waits for it.
+
+    Each file is a plain .npy array that numpy.load(path, mmap_mode="r")
+    can open, or TelemetryReader without NumPy.
+    """
+
+    def __init__(self, directory, block_size=4096, blocks=3):
+        self.directory = directory
+        self.block_size = block_size
+        self.lengths = [0] * len(COLUMNS)
+        os.makedirs(directory, exist_ok=True)
+        self.files = []
+        for name, _, dtype in COLUMNS:
+            file = open(os.path.join(directory, f"{name}.npy"), "wb")
+            file.write(npy_header(dtype, 0))
+            self.files.append(file)
+
+        self.free = queue.Queue()
+        for _ in range(blocks):
+            self.free.put([array(code, bytes(block_size * array(code).itemsize)) for _, code, _ in COLUMNS])
+        self.full = queue.Queue()
+        self.block = self.free.get()
+        self.row = 0
+        self.thread = threading.Thread(target=self.work, daemon=True)
+        self.thread.start()
+
+    def record(self, game, update_ms, render_ms=None):
+        """Add a row for the tick just stepped; render_ms is None if it wasn't drawn"""
+        values = (game.tick - 1, game.current_wave, len(game.enemies), len(game.projectiles),
+                  game.score, game.lives, update_ms, math.nan if render_ms is None else render_ms)
+        row = self.row
+        for column, value in zip(self.block, values):
+            column[row] = value
+        self.row = row + 1
+        if self.row == self.block_size:
+            self.hand_off()
+
+    def hand_off(self):
+        """Queue the current block for writing and start on a spare one"""
+        self.full.put((self.block, self.row))
+        self.block = self.free.get()
+        self.row = 0
+
+    def work(self):
+        while True:
+            item = self.full.get()
+            if item is None:
+                return
+            block, rows = item
+            try:
+                self.write(block, rows)
+            except OSError as error:
+                # A full disk shouldn't take the game down with it
+                logger.warning("could not write telemetry to %s: %s", self.directory, error)
+            self.free.put(block)
+
+    def write(self, block, rows):
+        """Append the first `rows` rows of a block to the column files"""
+        for index, (file, column) in enumerate(zip(self.files, block)):
+            file.write(memoryview(column)[:rows])
+            self.lengths[index] += rows
+            file.seek(0)
+            file.write(npy_header(COLUMNS[index][2], self.lengths[index]))
+            file.seek(0, os.SEEK_END)
+            file.flush()
+
+    def close(self):
+        """Write the partial last block and stop the thread"""
+        if self.row:
+            self.hand_off()
+        self.full.put(None)
+        self.thread.join()
+        for file in self.files:
+            file.close()
+
+class TelemetryReader:
+    """Memory-maps a telemetry directory, giving each column as a memoryview
+    over its file, so sessions of any length are read without loading them.
+    Drop the columns before calling close()."""
+
+    def __init__(self, directory):
+        self.maps = []
+        self.columns = {}
+        for name, code, dtype in COLUMNS:
+            with open(os.path.join(directory, f"{name}.npy"), "rb") as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.maps.append(mapping)
+            descr, length, offset = parse_npy_header(mapping)
+            if descr != ENDIAN + dtype:
+                raise ValueError(f"{name}.npy holds {descr}, expected {ENDIAN}{dtype}")
+            itemsize = array(code).itemsize
+            self.columns[name] = memoryview(mapping)[offset:offset + length * itemsize].cast(code)
+        # Columns are written one after another, so a crash can leave some a block longer
+        self.length = min(len(column) for column in self.columns.values())
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, name):
+        return self.columns[name][:self.length]
+
+    def waves(self):
+        """Per-wave summary rows: (wave, ticks, peak enemies, peak projectiles,
+        mean update ms, max update ms, mean render ms, max render ms)"""
+        rows = {}
+        columns = [self[name] for name in ("wave", "enemies", "projectiles", "update_ms", "render_ms")]
+        for wave, enemies, projectiles, update_ms, render_ms in zip(*columns):
+            stats = rows.setdefault(wave, [0, 0, 0, [], []])
+            stats[0] += 1
+            stats[1] = max(stats[1], enemies)
+            stats[2] = max(stats[2], projectiles)
+            if not math.isnan(update_ms):
+                stats[3].append(update_ms)
+            if not math.isnan(render_ms):
+                stats[4].append(render_ms)
+        return [(wave, ticks, enemies, projectiles) + spread(update) + spread(render)
+                for wave, (ticks, enemies, projectiles, update, render) in sorted(rows.items())]
+
+    def close(self):
+        self.columns = {}
+        for mapping in self.maps:
+            mapping.close()
+
+def spread(values):
+    """(mean, max) of a list of timings, NaN if empty"""
+    if not values:
+        return math.nan, math.nan
+    return sum(values) / len(values), max(values)
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise a telemetry directory written with --telemetry")
+    parser.add_argument("directory")
+    args = parser.parse_args()
+
+    reader = TelemetryReader(args.directory)
+    print(f"{len(reader)} ticks")
+    print("wave  ticks  enemies  projectiles  update ms (mean/max)  render ms (mean/max)")
+    for wave, ticks, enemies, projectiles, update_mean, update_max, render_mean, render_max in reader.waves():
+        print(f"{wave:>4} {ticks:>6} {enemies:>8} {projectiles:>12}  {update_mean:9.2f} {update_max:9.2f}"
+              f"   {render_mean:9.2f} {render_max:9.2f}")
+    reader.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
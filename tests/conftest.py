@@ -1,6 +1,9 @@
 import pytest
 import pygame
 import sys
+from audio import Audio
+from ecs import EntityView, World
+from events import EventBus
 
 # Initialize pygame for testing
 pygame.init()
@@ -30,26 +33,34 @@ def mock_pygame(monkeypatch):
     """Fixture to mock pygame functions"""
     monkeypatch.setattr(pygame, 'init', lambda: None)
     monkeypatch.setattr(pygame.display, 'set_caption', lambda x: None)
-    monkeypatch.setattr(pygame.display, 'set_mode', lambda x: pygame.Surface((800, 600)))
+    monkeypatch.setattr(pygame.display, 'set_mode', lambda size, flags=0: pygame.Surface((800, 600)))
+    monkeypatch.setattr(pygame.display, 'flip', lambda: None)
     monkeypatch.setattr(pygame.font, 'SysFont', lambda name, size: pygame.font.Font(None, size))
     return monkeypatch
 
+from enemy import Enemy
+from projectile import Projectile
+from subscribers import subscribe_all
+from systems import TIMER_HANDLERS
+from timers import TimerWheel
+
 # Mock game class for testing
 class MockGame:
     """A simplified game class for testing"""
     def __init__(self):
         self.width = 800
         self.height = 600
-        self.projectiles = []
-        self.enemies = []
+        self.world = World()
+        self.timers = TimerWheel(self, TIMER_HANDLERS)
+        self.audio = Audio(enabled=False)
+        self.events = EventBus(self)
+        subscribe_all(self.events)
+        self.projectiles = EntityView(self.world, Projectile)
+        self.enemies = EntityView(self.world, Enemy)
         self.score = 0
         self.lives = 3
         self.game_over = False
     
-    def check_collision(self, rect1, rect2):
-        """Simplified collision detection for testing"""
-        return rect1.colliderect(rect2)
-        
     def remove_enemy(self, enemy):
         """Helper method to remove an enemy properly in tests"""
         if enemy in self.enemies:
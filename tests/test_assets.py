@@ -0,0 +1,110 @@
+import io
+import threading
+import time
+import pytest
+import pygame
+from assets import AssetLoader, LoadingScreen, game_assets
+from game import Game
+
+def save_image(path, color=(10, 20, 30), size=(8, 6)):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    pygame.image.save(surface, str(path))
+
+class TestAssetLoader:
+    def test_decode_on_workers_finish_on_main_thread(self):
+        """Test that decoding runs on the pool and finishing on the calling thread"""
+        main = threading.get_ident()
+        loader = AssetLoader(workers=2)
+        loader.add("a", "data", lambda: threading.get_ident(),
+                   lambda decoded: (decoded, threading.get_ident()))
+
+        assets = loader.load()
+
+        decode_thread, finish_thread = assets["a"]
+        assert decode_thread != main
+        assert finish_thread == main
+
+    def test_images_converted_on_main_thread(self, monkeypatch, tmp_path):
+        """Test that images are decoded by workers and converted by the caller,
+        with per-pixel alpha for everything but the background"""
+        main = threading.get_ident()
+        conversions = {}
+
+        class Decoded:
+            def __init__(self, path):
+                self.name = path.rsplit("/", 1)[-1]
+            def convert(self):
+                conversions[self.name] = ("convert", threading.get_ident())
+                return self
+            def convert_alpha(self):
+                conversions[self.name] = ("convert_alpha", threading.get_ident())
+                return self
+
+        monkeypatch.setattr(pygame.image, 'load', Decoded)
+        save_image(tmp_path / "background.png")
+        save_image(tmp_path / "ship.png")
+
+        assets = game_assets(False, image_dir=str(tmp_path)).load()
+
+        assert set(assets) == {"background", "ship"}
+        assert conversions == {"background.png": ("convert", main), "ship.png": ("convert_alpha", main)}
+
+    def test_loading_screen_updates_while_waiting(self, mock_pygame):
+        """Test that progress is drawn and events pumped until slow assets arrive"""
+        game = Game()
+        draws = []
+        screen = LoadingScreen(game)
+        original = screen.draw
+        screen.draw = lambda loaded, total: draws.append((loaded, total)) or original(loaded, total)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        loader = AssetLoader()
+        loader.add("slow", "data", lambda: time.sleep(0.1) or 1)
+        loader.add("fast", "data", lambda: 2)
+
+        assets = loader.load(screen)
+
+        assert assets == {"slow": 1, "fast": 2}
+        assert len(draws) > 2  # Redrawn every frame while the slow one decodes
+        assert draws[0] == (0, 2)
+        assert game.running == False  # Closing the window is noticed
+
+    def test_decode_errors_raised(self):
+        """Test that a failing decode isn't silently dropped"""
+        loader = AssetLoader()
+        loader.image("missing", "/nonexistent/missing.png")
+
+        with pytest.raises(Exception):
+            loader.load()
+
+    def test_report_lists_each_asset(self):
+        """Test the per-asset timing report"""
+        loader = AssetLoader(workers=3)
+        loader.add("a", "data", lambda: 1)
+        loader.add("b", "data", lambda: 2)
+        loader.load()
+        output = io.StringIO()
+
+        loader.report(output)
+
+        lines = output.getvalue().splitlines()
+        assert {line.split()[0] for line in lines[:2]} == {"a", "b"}
+        assert lines[-1].startswith("2 assets")
+        assert "3 workers" in lines[-1]
+
+    def test_nothing_to_load_without_assets(self, tmp_path):
+        """Test that without a mixer or asset files nothing is queued"""
+        loader = game_assets(False, image_dir=str(tmp_path), font_dir=str(tmp_path))
+
+        assert loader.load() == {}
+        assert loader.timings == []
+
+    def test_game_draws_background_image(self, mock_pygame):
+        """Test that a loaded background replaces the plain fill"""
+        game = Game()
+        game.background = pygame.Surface((game.width, game.height))
+        game.background.fill((0, 0, 90))
+
+        game.draw(game.screen)
+
+        assert game.screen.get_at((game.width - 1, game.height - 1))[:3] == (0, 0, 90)
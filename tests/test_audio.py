@@ -0,0 +1,98 @@
+import pytest
+import pygame
+from audio import Audio
+
+# Two tiny effects keep the tests fast
+EFFECTS = {
+    "beep": (2, lambda rate: [0.5] * (rate // 10)),
+    "boom": (1, lambda rate: [0.5] * (rate // 10)),
+}
+
+@pytest.fixture
+def mixer(monkeypatch):
+    """A silent mixer, like headless runs use"""
+    if pygame.mixer.get_init() is not None:
+        yield
+        return
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init(44100, -16, 2, 512)
+    yield
+    pygame.mixer.quit()
+
+class FakeChannel:
+    """Stands in for a mixer channel that plays for as long as the test says"""
+    def __init__(self, busy=False):
+        self.busy = busy
+        self.played = []
+
+    def get_busy(self):
+        return self.busy
+
+    def play(self, sound):
+        self.played.append(sound)
+        self.busy = True
+
+class TestAudio:
+    def test_disabled_without_mixer(self):
+        """Test that audio turns itself off when it can't play anything"""
+        audio = Audio(enabled=False)
+
+        audio.play("beep")
+        audio.flush()
+
+        assert audio.enabled == False
+        assert audio.pending == []
+
+    def test_effects_preloaded_with_voice_budgets(self, mixer, tmp_path):
+        """Test that every effect is decoded up front with its own channels"""
+        audio = Audio(effects=EFFECTS, sound_dir=str(tmp_path))
+
+        assert set(audio.sounds) == {"beep", "boom"}
+        assert all(isinstance(sound, pygame.mixer.Sound) for sound in audio.sounds.values())
+        assert len(audio.channels["beep"]) == 2
+        assert len(audio.channels["boom"]) == 1
+        assert pygame.mixer.get_num_channels() == 3
+
+    def test_same_tick_triggers_coalesce(self, mixer, tmp_path):
+        """Test that an effect triggered many times in a tick plays once"""
+        audio = Audio(effects=EFFECTS, sound_dir=str(tmp_path))
+        channels = audio.channels["beep"] = [FakeChannel(), FakeChannel()]
+
+        for _ in range(5):
+            audio.play("beep")
+        audio.flush()
+
+        assert sum(len(channel.played) for channel in channels) == 1
+        assert audio.pending == []
+
+    def test_busy_effect_steals_oldest_voice(self, mixer, tmp_path):
+        """Test that a full voice budget cuts off the longest-playing sound"""
+        audio = Audio(effects=EFFECTS, sound_dir=str(tmp_path))
+        first, second = audio.channels["beep"] = [FakeChannel(), FakeChannel()]
+
+        for _ in range(3):
+            audio.play("beep")
+            audio.flush()
+
+        assert len(first.played) == 2
+        assert len(second.played) == 1
+        assert audio.channels["beep"] == [second, first]
+
+    def test_discard_drops_pending(self, mixer, tmp_path):
+        """Test that discarded triggers are never played"""
+        audio = Audio(effects=EFFECTS, sound_dir=str(tmp_path))
+        channel = audio.channels["boom"][0] = FakeChannel()
+
+        audio.play("boom")
+        audio.discard()
+        audio.flush()
+
+        assert channel.played == []
+
+    def test_uses_sounds_already_loaded(self, mixer, tmp_path):
+        """Test that sounds decoded elsewhere, e.g. by the asset loader, are used as they are"""
+        sound = pygame.mixer.Sound(buffer=bytes(400))
+        audio = Audio(effects=EFFECTS, sound_dir=str(tmp_path), sounds={"beep": sound})
+
+        assert audio.sounds["beep"] is sound
+        assert isinstance(audio.sounds["boom"], pygame.mixer.Sound)
@@ -0,0 +1,108 @@
+import random
+import pytest
+import pygame
+from autopilot import Bot, GreedyBot, RandomBot, ScriptedBot, StressBot, parse_script
+from controls import DOWN, FIRE, RESTART, UP
+from enemy import Enemy
+from game import Game
+
+def play(game, ticks):
+    for _ in range(ticks):
+        game.step(game.autopilot.controls(game))
+
+class TestAutopilot:
+    def test_handle_events_uses_the_bot(self, mock_pygame):
+        """Test that the bot's controls replace the keyboard's"""
+        game = Game()
+        game.autopilot = ScriptedBot([(10, UP | FIRE)])
+        pygame.event.clear()
+
+        controls = game.handle_events()
+
+        assert controls.mask == UP | FIRE
+
+    def test_bot_needs_a_mask(self):
+        """Test that a bot without an input strategy can't be created"""
+        class Idle(Bot):
+            pass
+
+        with pytest.raises(TypeError):
+            Idle()
+
+    def test_restarts_after_game_over(self, mock_pygame):
+        """Test that bots keep a soak test going past a game over"""
+        game = Game()
+        game.autopilot = StressBot()
+        game.game_over = True
+
+        assert game.autopilot.controls(game).mask == RESTART
+
+    def test_stops_after_tick_limit(self, mock_pygame):
+        """Test that the game stops running once the bot's tick limit is reached"""
+        game = Game()
+        game.autopilot = RandomBot(ticks=30)
+        play(game, 30)
+        assert game.running
+
+        game.autopilot.controls(game)
+        assert not game.running
+
+    def test_bot_leaves_game_random_state_alone(self, mock_pygame):
+        """Test that bots draw from their own generator, so recordings replay"""
+        game = Game()
+        game.autopilot = RandomBot(seed=3)
+        state = random.getstate()
+
+        for _ in range(50):
+            game.autopilot.controls(game)
+
+        assert random.getstate() == state
+
+    def test_stress_bot_fires_every_tick(self, mock_pygame):
+        """Test that the stress bot puts a projectile out every tick"""
+        game = Game()
+        game.autopilot = StressBot()
+
+        play(game, 20)
+
+        assert len(game.projectiles) == 20
+
+    def test_greedy_bot_dodges_close_enemy(self, mock_pygame):
+        """Test that an enemy about to hit the player is dodged"""
+        game = Game()
+        bot = GreedyBot()
+        player = game.player
+        Enemy(player.x + 60, player.y + 10, game)  # Below centre, so go up
+
+        assert bot.mask(game) == UP
+
+    def test_greedy_bot_aims_and_fires(self, mock_pygame):
+        """Test that a distant enemy is lined up with and shot at a limited rate"""
+        game = Game()
+        bot = GreedyBot(fire_interval=5)
+        player = game.player
+        Enemy(600, player.y + 100, game)
+        assert bot.mask(game) == DOWN
+
+        game.world.set(game.enemies[0].id, "y", player.y)
+        assert bot.mask(game) & FIRE
+        assert not bot.mask(game) & FIRE  # Same tick, still cooling down
+
+    def test_scripted_bot_loops_steps(self, mock_pygame):
+        """Test that scripted steps play in order and repeat"""
+        game = Game()
+        bot = ScriptedBot([(2, UP), (1, DOWN | FIRE)])
+        masks = []
+        for tick in range(6):
+            game.tick = tick
+            masks.append(bot.mask(game))
+
+        assert masks == [UP, UP, DOWN | FIRE] * 2
+
+    def test_parse_script(self):
+        """Test the TICKS:KEYS script format"""
+        assert parse_script("30:up+fire 10:none") == [(30, UP | FIRE), (10, 0)]
+        with pytest.raises(ValueError):
+            parse_script("30:jump")
+        with pytest.raises(ValueError):
+            parse_script("0:up")
@@ -0,0 +1,39 @@
+import io
+from benchmark import run_benchmark, run_fire_stress
+from game import Game
+from systems import SYSTEMS
+from weapons import WEAPONS
+
+class TestBenchmark:
+    def test_reports_every_system(self, mock_pygame):
+        """Test that the benchmark times timers, each system, events and rendering"""
+        game = Game()
+        output = io.StringIO()
+
+        results = run_benchmark(game, enemies=20, projectiles=20, ticks=5, output=output)
+
+        assert list(results) == ["timers"] + [system.__name__ for system in SYSTEMS] + ["events", "render"]
+        assert all(micros >= 0 for micros in results.values())
+        assert "collide_projectiles" in output.getvalue()
+
+    def test_keeps_world_at_requested_size(self, mock_pygame):
+        """Test that entities lost during a tick are replaced before the next"""
+        game = Game()
+
+        run_benchmark(game, enemies=30, projectiles=10, ticks=3, output=io.StringIO())
+
+        assert not game.game_over
+        assert len(game.projectiles) <= 10
+        assert len(game.enemies) >= 10
+
+    def test_fire_stress_reports_frame_times(self, mock_pygame):
+        """Test that the fire stress run times every tick at full fire rate"""
+        game = Game()
+        output = io.StringIO()
+
+        frame_ms = run_fire_stress(game, "spread", enemies=10, ticks=25, output=output)
+
+        assert len(frame_ms) == 25
+        assert len(game.projectiles) > len(WEAPONS["spread"].pattern)
+        assert "spread at full rate" in output.getvalue()
+        assert "budget" in output.getvalue()
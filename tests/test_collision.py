@@ -0,0 +1,216 @@
+import random
+import pytest
+from benchmark import top_up
+from collision import SweepAndPrune
+from enemy import Enemy
+from projectile import Projectile
+from systems import move
+from tests.conftest import MockGame
+
+class TestSweepAndPrune:
+    def test_overlapping_entities_hit(self, monkeypatch):
+        """Test that a projectile overlapping an enemy is reported as a hit"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        projectile = Projectile(400, 300, game)
+        enemy = Enemy(405, 300, game)
+
+        hits = SweepAndPrune().find_hits(game.world)
+
+        assert hits == [(projectile.id, enemy.id)]
+
+    def test_no_hit_when_vertically_apart(self, monkeypatch):
+        """Test that entities on different rows don't collide"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        projectile = Projectile(400, 100, game)
+        enemy = Enemy(405, 300, game)
+
+        assert SweepAndPrune().find_hits(game.world) == []
+
+    def test_fast_projectile_tunnels_without_swept_mode(self, monkeypatch):
+        """Test that a fast projectile skips over an enemy when only end positions are checked"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        monkeypatch.setitem(Projectile.archetype.shared, 'vx', 100)
+        projectile = Projectile(300, 300, game)
+        enemy = Enemy(360, 300, game)
+
+        move(game)
+
+        # Projectile ends up entirely past the enemy
+        assert projectile.x > enemy.x + enemy.width
+        assert SweepAndPrune(swept=False).find_hits(game.world) == []
+
+    def test_fast_projectile_hits_in_swept_mode(self, monkeypatch):
+        """Test that the swept test catches a projectile passing through an enemy"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        monkeypatch.setitem(Projectile.archetype.shared, 'vx', 100)
+        projectile = Projectile(300, 300, game)
+        enemy = Enemy(360, 300, game)
+
+        move(game)
+
+        assert SweepAndPrune().find_hits(game.world) == [(projectile.id, enemy.id)]
+
+    def test_angled_projectile_hits_in_swept_mode(self, monkeypatch):
+        """Test that vertical motion is swept too, not just checked at the end of the tick"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        monkeypatch.setitem(Projectile.archetype.shared, 'vx', 10)
+        projectile = Projectile(100, 40, game, vy=90)
+        enemy = Enemy(105, 100, game)
+
+        move(game)
+
+        # Projectile starts above the enemy and ends just below it
+        assert projectile.y >= enemy.y + enemy.height
+        assert SweepAndPrune(swept=False).find_hits(game.world) == []
+        assert SweepAndPrune().find_hits(game.world) == [(projectile.id, enemy.id)]
+
+    def test_angled_projectile_passing_a_corner_misses(self, monkeypatch):
+        """Test that the sweep follows the path, not the box around it"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        monkeypatch.setitem(Projectile.archetype.shared, 'vx', 60)
+        projectile = Projectile(60, 120, game, vy=-60)
+        enemy = Enemy(100, 100, game)
+
+        move(game)
+
+        # The box around the path covers the enemy's top left corner, but the
+        # projectile passes outside it
+        assert SweepAndPrune().find_hits(game.world) == []
+
+    def test_projectile_destroys_only_one_enemy(self, monkeypatch):
+        """Test that each projectile and enemy takes part in at most one hit"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        projectile = Projectile(400, 300, game)
+        enemies = [Enemy(395, 300, game), Enemy(405, 300, game)]
+
+        hits = SweepAndPrune().find_hits(game.world)
+
+        assert len(hits) == 1
+        assert hits[0][0] == projectile.id
+
+    def test_entries_stay_sorted_across_frames(self, monkeypatch):
+        """Test that the sweep list is re-sorted as entities move past each other"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        detector = SweepAndPrune()
+        projectile = Projectile(100, 50, game)
+        enemy = Enemy(140, 300, game)
+
+        detector.find_hits(game.world)
+        assert detector.entries == [projectile.id, enemy.id]
+
+        for _ in range(10):
+            move(game)
+            detector.find_hits(game.world)
+
+        assert detector.entries == [enemy.id, projectile.id]
+
+    def test_despawned_entities_are_dropped(self, monkeypatch):
+        """Test that despawned entities leave the sweep list"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        detector = SweepAndPrune()
+        projectile = Projectile(100, 50, game)
+        enemy = Enemy(500, 300, game)
+
+        detector.find_hits(game.world)
+        game.projectiles.remove(projectile)
+        detector.find_hits(game.world)
+
+        assert detector.entries == [enemy.id]
+
+    def test_new_entities_join_in_table_order(self, monkeypatch):
+        """Test that new entities enter the sweep list in the world's row order,
+        so level ties break the same way in every run and after a restore"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        game = MockGame()
+        enemies = [Enemy(500, 300, game) for _ in range(4)]
+        game.enemies.remove(enemies[0])  # The last row moves into its place
+        detector = SweepAndPrune()
+
+        detector.find_hits(game.world)
+
+        assert detector.entries == game.enemies.ids() == [enemies[3].id, enemies[1].id, enemies[2].id]
+
+    def test_spawned_entities_merged_into_order(self):
+        """Test that a burst of new entities is merged into the sorted sweep list"""
+        random.seed(7)
+        game = MockGame()
+        detector = SweepAndPrune()
+        top_up(game, 50, 50)
+        detector.find_hits(game.world)
+        top_up(game, 200, 200)
+
+        detector.find_hits(game.world)
+
+        boxes = {}
+        detector.gather(game.world, "enemy", True, boxes)
+        detector.gather(game.world, "projectile", False, boxes)
+        lefts = [detector.left_edge(boxes[entity]) for entity in detector.entries]
+        assert sorted(detector.entries) == sorted(boxes)
+        assert lefts == sorted(lefts)
+
+    def test_hits_match_brute_force(self):
+        """Test that the banded sweep finds every overlap an all-pairs test would"""
+        random.seed(3)
+        game = MockGame()
+        top_up(game, 300, 300)
+        move(game)
+        detector = SweepAndPrune()
+
+        hits = detector.find_hits(game.world)
+
+        boxes = {}
+        detector.gather(game.world, "enemy", True, boxes)
+        detector.gather(game.world, "projectile", False, boxes)
+        hit = {entity for pair in hits for entity in pair}
+        assert all(detector.overlaps(boxes[p], boxes[e]) for p, e in hits)
+        assert not any(detector.overlaps(boxes[p], boxes[e])
+                       for p in game.projectiles.ids() if p not in hit
+                       for e in game.enemies.ids() if e not in hit)
+
+    def test_tests_grow_linearly_at_constant_density(self):
+        """Test that four times the entities over four times the area cost
+        about four times the narrow-phase tests"""
+        def tests(count, width):
+            random.seed(5)
+            game = MockGame()
+            game.width = width
+            top_up(game, count, count)
+            detector = SweepAndPrune()
+            detector.find_hits(game.world)
+            return detector.tests
+
+        small = tests(250, 800)
+        large = tests(1000, 3200)
+
+        assert 0 < large < 5 * small
+
+    def test_tests_pruned_by_row_on_a_crowded_screen(self):
+        """Test that entities are only paired with those near their own row"""
+        random.seed(5)
+        game = MockGame()
+        top_up(game, 1000, 1000)
+        detector = SweepAndPrune()
+
+        detector.find_hits(game.world)
+
+        # Pairing everything overlapping in x alone takes about 50,000 tests
+        assert detector.tests < 10000
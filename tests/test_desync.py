@@ -0,0 +1,59 @@
+from desync import compare, diff_states, first_divergence, plain_snapshot, verify
+from game import Game
+from replay import ReplayReader, ReplayWriter
+from tests.test_replay import record_session, scripted_controls
+
+class TestDesync:
+    def test_first_divergence(self):
+        """Test that only ticks present in both streams are compared"""
+        a = {0: 1, 1: 2, 2: 3, 3: 4}
+        b = {1: 2, 2: 9, 3: 8}
+
+        assert first_divergence(a, b) == 2
+        assert first_divergence(a, a) is None
+
+    def test_diff_names_entity_and_component(self, mock_pygame):
+        """Test that differing snapshots are reported by entity and column"""
+        game = Game()
+        game.player.shoot()
+        a = plain_snapshot(game)
+        game.projectiles[0].x += 1
+        game.score = 10
+        b = plain_snapshot(game)
+
+        differences = diff_states(a, b)
+
+        projectile = game.projectiles[0]
+        assert "game.score: 0 != 10" in differences
+        assert f"entity {projectile.id} (projectile) x: {projectile.x - 1!r} != {projectile.x!r}" in differences
+
+    def test_compare_finds_where_sessions_part(self, mock_pygame, tmp_path):
+        """Test that recordings with different inputs diverge where the inputs do"""
+        record_session(tmp_path / "a.replay", 200, hashes=True)
+        game = Game()
+        game.recorder = ReplayWriter(tmp_path / "b.replay", game, seed=1234, hashes=True)
+        for _ in range(200):
+            controls = scripted_controls(game.tick)
+            if game.tick == 50:
+                controls.mask = 0
+            game.step(controls)
+        game.recorder.close()
+
+        tick, differences = compare(Game(), ReplayReader(tmp_path / "a.replay"), ReplayReader(tmp_path / "b.replay"))
+
+        assert tick == 51
+        assert differences
+
+    def test_verify_reports_mismatched_hash(self, mock_pygame, tmp_path):
+        """Test that playback against a corrupted hash reports that tick"""
+        path = tmp_path / "session.replay"
+        record_session(path, 300, keyframe_interval=100, hashes=True)
+        assert verify(Game(), ReplayReader(path)) == (None, [])
+
+        reader = ReplayReader(path)
+        reader.hashes[150] ^= 1
+
+        tick, differences = verify(Game(), reader)
+        assert tick == 150
+        # The state itself still matches at the next keyframe
+        assert differences == []
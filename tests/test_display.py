@@ -0,0 +1,36 @@
+import pytest
+import pygame
+from display import Display
+
+class TestDisplay:
+    def test_windowed_draws_at_logical_size(self, mock_pygame):
+        """Test that the game surface is the logical size in scaled mode"""
+        display = Display((800, 600))
+
+        assert display.transform == False
+        assert display.surface.get_size() == (800, 600)
+
+    def test_integer_fullscreen_uses_transform(self, monkeypatch):
+        """Test that integer scaling in fullscreen scales the logical surface into the window"""
+        window = pygame.Surface((1920, 1080))
+        monkeypatch.setattr(pygame.display, 'set_mode', lambda size, flags=0: window)
+        monkeypatch.setattr(pygame.display, 'flip', lambda: None)
+
+        display = Display((800, 600), fullscreen=True, integer_scaling=True)
+        display.surface.fill((255, 0, 0))
+        display.present()
+
+        # 1080 / 600 only fits a scale of 1, centred with black borders
+        assert display.surface.get_size() == (800, 600)
+        assert display.target.get_abs_offset() == (560, 240)
+        assert window.get_at((960, 540))[:3] == (255, 0, 0)
+        assert window.get_at((10, 10))[:3] == (0, 0, 0)
+
+    def test_target_rect_uses_largest_whole_multiple(self, mock_pygame):
+        """Test that the integer target is the biggest whole multiple that fits"""
+        display = Display((320, 180))
+
+        rect = display.target_rect((1920, 1080))
+
+        assert rect.size == (1920, 1080)
+        assert display.target_rect((1000, 700)).size == (960, 540)
@@ -0,0 +1,154 @@
+import pytest
+from ecs import Archetype, Entity, EntityView, World
+
+POINT = Archetype("test_point", ("x", "y"), tags=("test_tag",), size=4)
+LABEL = Archetype("test_label", ("x", "text"))
+
+class Point(Entity):
+    width = 3
+    height = 4
+    archetype = POINT
+    __slots__ = ()
+
+class TestWorld:
+    def test_spawn_returns_increasing_ids(self):
+        """Test that every spawned entity gets a new id and its values"""
+        world = World()
+        first = world.spawn(POINT, x=1, y=2)
+        second = world.spawn(POINT, x=3, y=4)
+
+        assert second == first + 1
+        assert world.get(first, "x") == 1
+        assert world.get(second, "y") == 4
+
+    def test_spawn_needs_every_column(self):
+        """Test that spawning with missing columns is refused"""
+        with pytest.raises(ValueError):
+            World().spawn(POINT, x=1)
+
+    def test_spawn_many_needs_equal_lengths(self):
+        """Test that columns of different lengths are refused before any row is added"""
+        world = World()
+
+        with pytest.raises(ValueError):
+            world.spawn_many(POINT, x=[1, 2, 3], y=[4, 5])
+
+        assert len(world.table(POINT)) == 0
+        assert world.next_id == 0
+
+    def test_spawn_many_adds_rows_in_order(self):
+        """Test that a bulk spawn fills the columns in one go"""
+        world = World()
+        ids = world.spawn_many(POINT, x=[1, 2, 3], y=[4, 5, 6])
+
+        table = world.table(POINT)
+        assert table.ids == ids
+        assert table.columns["x"] == [1, 2, 3]
+        assert [world.get(entity, "y") for entity in ids] == [4, 5, 6]
+
+    def test_despawn_moves_last_row_into_gap(self):
+        """Test that despawning keeps columns dense and locations correct"""
+        world = World()
+        first, second, third = world.spawn_many(POINT, x=[1, 2, 3], y=[4, 5, 6])
+
+        world.despawn(first)
+
+        table = world.table(POINT)
+        assert table.ids == [third, second]
+        assert table.columns["x"] == [3, 2]
+        assert not world.alive(first)
+        assert world.get(third, "x") == 3
+
+    def test_query_matches_columns_and_tags(self):
+        """Test that queries return only tables with all requested components"""
+        world = World()
+        world.spawn(POINT, x=0, y=0)
+        world.spawn(LABEL, x=0, text="hi")
+
+        assert [t.archetype for t in world.query("x")] == [POINT, LABEL]
+        assert [t.archetype for t in world.query("x", "test_tag")] == [POINT]
+        assert world.query("y", "text") == []
+
+    def test_query_sees_tables_created_later(self):
+        """Test that cached queries are refreshed when a new table appears"""
+        world = World()
+        world.spawn(POINT, x=0, y=0)
+        assert len(world.query("x")) == 1
+
+        world.spawn(LABEL, x=0, text="hi")
+
+        assert len(world.query("x")) == 2
+
+    def test_snapshot_restore_round_trip(self):
+        """Test that a restored world has the same entities and ids"""
+        world = World()
+        ids = world.spawn_many(POINT, x=[1, 2], y=[3, 4])
+        state = world.snapshot()
+
+        world.despawn(ids[0])
+        world.spawn(LABEL, x=0, text="later")
+        world.restore(state)
+
+        assert world.snapshot() == state
+        assert world.get(ids[0], "x") == 1
+        assert world.spawn(POINT, x=0, y=0) == ids[1] + 1
+
+class TestEntity:
+    def test_handle_reads_and_writes_columns(self):
+        """Test that handles expose columns as attributes"""
+        world = World()
+        point = Point.attach(world, world.spawn(POINT, x=1, y=2))
+
+        point.x += 5
+
+        assert world.get(point.id, "x") == 6
+        assert point.y == 2
+
+    def test_rect_uses_position_and_class_size(self):
+        """Test that every entity class gets a bounding rectangle from its size"""
+        world = World()
+        point = Point.attach(world, world.spawn(POINT, x=1, y=2))
+
+        assert point.rect == (1, 2, 3, 4)
+
+    def test_handles_compare_by_entity(self):
+        """Test that two handles to the same entity are equal"""
+        world = World()
+        entity = world.spawn(POINT, x=1, y=2)
+
+        assert Point.attach(world, entity) == Point.attach(world, entity)
+        assert len({Point.attach(world, entity), Point.attach(world, entity)}) == 1
+
+    def test_missing_component_raises_attribute_error(self):
+        """Test that unknown attributes behave like normal missing attributes"""
+        world = World()
+        point = Point.attach(world, world.spawn(POINT, x=1, y=2))
+
+        assert not hasattr(point, "speed")
+
+class TestEntityView:
+    def test_view_lists_live_entities(self):
+        """Test that a view behaves like a list of handles"""
+        world = World()
+        view = EntityView(world, Point)
+        assert len(view) == 0
+
+        ids = world.spawn_many(POINT, x=[1, 2], y=[3, 4])
+
+        assert len(view) == 2
+        assert [point.id for point in view] == ids
+        assert view[-1].x == 2
+        assert view[0] in view
+
+    def test_remove_despawns(self):
+        """Test that removing a handle from a view despawns the entity"""
+        world = World()
+        view = EntityView(world, Point)
+        point = Point.attach(world, world.spawn(POINT, x=1, y=2))
+
+        view.remove(point)
+
+        assert point not in view
+        assert not world.alive(point.id)
+        with pytest.raises(ValueError):
+            view.remove(point)
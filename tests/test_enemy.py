@@ -1,6 +1,7 @@
 import pytest
 import pygame
 from enemy import Enemy
+from systems import expire_offscreen, move
 from tests.conftest import MockGame
 
 class TestEnemy:
@@ -31,7 +32,7 @@ class TestEnemy:
         initial_x = enemy.x
         
         # Update enemy position
-        enemy.update()
+        move(game)
         
         # Enemy should move left by speed amount
         assert enemy.x == initial_x - enemy.speed
@@ -49,7 +50,6 @@ class TestEnemy:
         # Create a mock enemy to test
         game = MockGame()
         enemy = Enemy(-40, 300, game)  # Position already off-screen to left
-        game.enemies.append(enemy)
         
         # Before update
         assert len(game.enemies) == 1
@@ -70,13 +70,13 @@ class TestEnemy:
         
         # Create enemy well within the screen
         enemy = Enemy(500, 300, game)
-        game.enemies.append(enemy)
         
         # Before update
         assert len(game.enemies) == 1
         
         # Update enemy position - it should remain on screen
-        enemy.update()
+        move(game)
+        expire_offscreen(game)
         
         # Enemy should still be in the game's enemies list
         assert len(game.enemies) == 1
@@ -0,0 +1,71 @@
+from controls import Controls
+from enemy import Enemy
+from events import EnemyKilled, EventBus, PlayerHit, ShotFired
+from game import Game
+
+class TestEventBus:
+    def test_subscribers_get_their_events_in_one_batch(self):
+        """Test that each handler is called once per tick with all its events"""
+        bus = EventBus("target")
+        calls = []
+        bus.subscribe(EnemyKilled, lambda target, events: calls.append((target, events)))
+
+        bus.emit(EnemyKilled(1, 2))
+        bus.emit(ShotFired(0, 0))
+        bus.emit(EnemyKilled(3, 4))
+        assert calls == []
+        bus.dispatch()
+
+        assert calls == [("target", [EnemyKilled(1, 2), EnemyKilled(3, 4)])]
+
+    def test_handlers_called_in_subscription_order(self):
+        """Test that delivery order doesn't depend on event order"""
+        bus = EventBus(None)
+        order = []
+        bus.subscribe(PlayerHit, lambda target, events: order.append("hit"))
+        bus.subscribe(ShotFired, lambda target, events: order.append("shot"))
+
+        bus.emit(ShotFired(0, 0))
+        bus.emit(PlayerHit("enemy"))
+        bus.dispatch()
+
+        assert order == ["hit", "shot"]
+
+    def test_events_delivered_once(self):
+        """Test that dispatching again doesn't repeat events"""
+        bus = EventBus(None)
+        calls = []
+        bus.subscribe(ShotFired, lambda target, events: calls.append(len(events)))
+
+        bus.emit(ShotFired(0, 0))
+        bus.dispatch()
+        bus.dispatch()
+
+        assert calls == [1]
+
+class TestGameEvents:
+    def test_kills_scored_after_the_tick(self, mock_pygame, monkeypatch):
+        """Test that score changes when the tick's events are dispatched"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+        game = Game()
+        game.player.shoot()
+        projectile = game.projectiles[0]
+        Enemy(projectile.x + 5, projectile.y - 10, game)
+        game.events.dispatch()
+
+        game.step(Controls())
+
+        assert game.score == 10
+        assert len(game.enemies) == 0
+
+    def test_last_life_ends_game(self, mock_pygame):
+        """Test that a hit on the last life sets game over"""
+        game = Game()
+        game.lives = 1
+        Enemy(game.player.x, game.player.y, game)
+
+        game.step(Controls())
+
+        assert game.lives == 0
+        assert game.game_over
+        assert game.player.is_ghost
@@ -0,0 +1,65 @@
+import pytest
+import pygame
+from export import FrameExporter, export_replay
+from game import Game
+from replay import ReplayReader, ReplayViewer
+from tests.test_replay import record_session
+
+def solid_surface(color):
+    surface = pygame.Surface((4, 3))
+    surface.fill(color)
+    return surface
+
+class TestFrameExporter:
+    def test_png_frames_written_in_order(self, tmp_path):
+        """Test that each submitted frame becomes a numbered PNG with its pixels"""
+        exporter = FrameExporter(str(tmp_path), (4, 3), "png", workers=2, queue_size=2)
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        for color in colors:
+            exporter.submit(solid_surface(color))
+        exporter.close()
+
+        for index, color in enumerate(colors):
+            frame = pygame.image.load(str(tmp_path / f"frame_{index:06d}.png"))
+            assert frame.get_size() == (4, 3)
+            assert frame.get_at((1, 1))[:3] == color
+
+    def test_raw_stream_contains_packed_frames(self, tmp_path):
+        """Test that raw export writes RGB24 frames back to back"""
+        path = tmp_path / "frames.rgb"
+        exporter = FrameExporter(str(path), (4, 3), "raw")
+        exporter.submit(solid_surface((1, 2, 3)))
+        exporter.submit(solid_surface((4, 5, 6)))
+        exporter.close()
+
+        data = path.read_bytes()
+        assert len(data) == 2 * 4 * 3 * 3
+        assert data[:3] == bytes((1, 2, 3))
+        assert data[-3:] == bytes((4, 5, 6))
+
+    def test_worker_errors_are_raised_on_close(self, tmp_path):
+        """Test that a failing write is reported instead of silently dropped"""
+        exporter = FrameExporter(str(tmp_path), (5, 5), "png", workers=1)
+        exporter.submit(solid_surface((0, 0, 0)))  # Wrong size for the buffer
+
+        with pytest.raises(Exception):
+            exporter.close()
+
+    def test_unknown_format_rejected(self, tmp_path):
+        """Test that only png and raw formats are accepted"""
+        with pytest.raises(ValueError):
+            FrameExporter(str(tmp_path), (4, 3), "gif")
+
+    def test_export_replay_renders_every_tick(self, mock_pygame, tmp_path):
+        """Test that exporting a replay produces one frame per remaining tick"""
+        path = tmp_path / "session.replay"
+        record_session(path, 120)
+        game = Game()
+        viewer = ReplayViewer(game, ReplayReader(path))
+        output = tmp_path / "frames.rgb"
+        exporter = FrameExporter(str(output), (game.width, game.height), "raw")
+
+        export_replay(viewer, exporter, start_tick=100)
+
+        assert exporter.frame_count == 20
+        assert output.stat().st_size == 20 * game.width * game.height * 3
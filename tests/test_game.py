@@ -4,6 +4,8 @@ from game import Game
 from player import Player
 from enemy import Enemy
 from projectile import Projectile
+from systems import collide_player, collide_projectiles
+from waves import calculate_wave_enemies
 
 class TestGame:
     def test_game_initialization(self, mock_pygame):
@@ -23,28 +25,7 @@ class TestGame:
         assert game.score == 0
         assert game.lives == 3
         assert game.enemy_spawn_rate == 60
-        assert game.spawn_counter == 0
-    
-    def test_check_collision(self, mock_pygame):
-        """Test collision detection"""
-        # Mock pygame.key.get_pressed to return an empty dict
-        mock_pygame.setattr(pygame.key, 'get_pressed', lambda: {})
-        
-        game = Game()
-        
-        # Create two overlapping rectangles
-        rect1 = pygame.Rect(100, 100, 50, 50)
-        rect2 = pygame.Rect(125, 125, 50, 50)
-        
-        # Test positive collision
-        assert game.check_collision(rect1, rect2) == True
-        
-        # Create two non-overlapping rectangles
-        rect3 = pygame.Rect(100, 100, 50, 50)
-        rect4 = pygame.Rect(200, 200, 50, 50)
-        
-        # Test negative collision
-        assert game.check_collision(rect3, rect4) == False
+        assert game.timers.remaining(game.spawn_timer) == game.enemy_spawn_rate
     
     def test_enemy_spawning(self, mock_pygame, monkeypatch):
         """Test that enemies spawn correctly"""
@@ -62,19 +43,15 @@ class TestGame:
         
         game = Game()
         
-        # Set spawn counter to almost trigger spawn
-        game.spawn_counter = game.enemy_spawn_rate - 1
-        
         # Before update
         initial_enemies_count = len(game.enemies)
         
-        # Directly test enemy spawning without calling the full update
+        # Run the timers up to the first spawn without calling the full update
         # This avoids dependence on player.update()
-        game.spawn_counter += 1
-        if game.spawn_counter >= game.enemy_spawn_rate:
-            y_pos = 300  # Using our mocked value
-            game.enemies.append(Enemy(game.width, y_pos, game))
-            game.spawn_counter = 0
+        for _ in range(game.enemy_spawn_rate - 1):
+            game.timers.advance()
+        assert len(game.enemies) == initial_enemies_count
+        game.timers.advance()
         
         # Should have spawned one enemy
         assert len(game.enemies) == initial_enemies_count + 1
@@ -92,24 +69,18 @@ class TestGame:
         
         game = Game()
         
-        # Directly test collision logic without running the full update
+        # Run only the collision system, not the full update
         # Create projectile and enemy at overlapping positions
         projectile = Projectile(400, 300, game)
         enemy = Enemy(405, 300, game)  # Positioned to overlap
         
-        game.projectiles.append(projectile)
-        game.enemies.append(enemy)
-        
         # Before collision check
         assert len(game.projectiles) == 1
         assert len(game.enemies) == 1
         initial_score = game.score
         
-        # Test the collision directly
-        if game.check_collision(projectile.rect, enemy.rect):
-            game.projectiles.remove(projectile)
-            game.enemies.remove(enemy)
-            game.score += 10
+        collide_projectiles(game)
+        game.events.dispatch()
         
         # Both should be removed and score increased
         assert len(game.projectiles) == 0
@@ -121,33 +92,24 @@ class TestGame:
         # Mock random function for consistent testing
         monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)  # Fixed enemy speed
         
-        # Mock pygame.time.get_ticks to return a fixed value for ghost state timing
-        monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 1000)
-        
         # Mock pygame.key.get_pressed to return an empty dict
         mock_pygame.setattr(pygame.key, 'get_pressed', lambda: {})
         
         game = Game()
         
-        # Directly test collision logic without running the full update
+        # Run only the collision system, not the full update
         # Create enemy at a position that overlaps with the player
         player_x = game.player.x
         player_y = game.player.y
         enemy = Enemy(player_x + 10, player_y, game)  # Positioned to overlap with player
         
-        game.enemies.append(enemy)
-        
         # Before collision check
         assert len(game.enemies) == 1
         initial_lives = game.lives
         assert game.player.is_ghost == False
         
-        # Test the collision directly
-        if game.check_collision(enemy.rect, game.player.rect):
-            if not game.player.is_ghost:
-                game.enemies.remove(enemy)
-                game.lives -= 1
-                game.player.enter_ghost_state()
+        collide_player(game)
+        game.events.dispatch()
         
         # Enemy should be removed, lives decreased, player in ghost state
         assert len(game.enemies) == 0
@@ -159,9 +121,6 @@ class TestGame:
         # Mock random function for consistent testing
         monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)  # Fixed enemy speed
         
-        # Mock pygame.time.get_ticks to return a fixed value for ghost state timing
-        monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 1000)
-        
         # Mock pygame.key.get_pressed to return an empty dict
         mock_pygame.setattr(pygame.key, 'get_pressed', lambda: {})
         
@@ -175,19 +134,13 @@ class TestGame:
         player_y = game.player.y
         enemy = Enemy(player_x + 10, player_y, game)  # Positioned to overlap with player
         
-        game.enemies.append(enemy)
-        
         # Before collision check
         assert len(game.enemies) == 1
         initial_lives = game.lives
         assert game.player.is_ghost == True
         
-        # Test the collision directly
-        if game.check_collision(enemy.rect, game.player.rect):
-            if not game.player.is_ghost:
-                game.enemies.remove(enemy)
-                game.lives -= 1
-                game.player.enter_ghost_state()
+        collide_player(game)
+        game.events.dispatch()
         
         # Enemy should NOT be removed, lives should remain the same
         assert len(game.enemies) == 1
@@ -199,9 +152,6 @@ class TestGame:
         # Mock random function for consistent testing
         monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)  # Fixed enemy speed
         
-        # Mock pygame.time.get_ticks to return a fixed value for ghost state timing
-        monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 1000)
-        
         # Mock pygame.key.get_pressed to return an empty dict
         mock_pygame.setattr(pygame.key, 'get_pressed', lambda: {})
         
@@ -210,26 +160,18 @@ class TestGame:
         # Set lives to 1
         game.lives = 1
         
-        # Directly test collision logic without running the full update
+        # Run only the collision system, not the full update
         # Create enemy at a position that overlaps with the player
         player_x = game.player.x
         player_y = game.player.y
         enemy = Enemy(player_x + 10, player_y, game)  # Positioned to overlap with player
         
-        game.enemies.append(enemy)
-        
         # Before collision check
         assert game.lives == 1
         assert game.game_over == False
         
-        # Test the collision directly
-        if game.check_collision(enemy.rect, game.player.rect):
-            if not game.player.is_ghost:
-                game.enemies.remove(enemy)
-                game.lives -= 1
-                game.player.enter_ghost_state()
-                if game.lives <= 0:
-                    game.game_over = True
+        collide_player(game)
+        game.events.dispatch()
         
         # Lives should be zero and game over should be triggered
         assert game.lives == 0
@@ -249,10 +191,11 @@ class TestGame:
         game.score = 100
         game.lives = 1
         game.game_over = True
-        game.spawn_counter = 30
-        game.enemies.append(Enemy(400, 300, game))
+        for _ in range(30):
+            game.timers.advance()
+        Enemy(400, 300, game)
         game.player.enter_ghost_state()
-        game.projectiles.append(Projectile(400, 300, game))
+        Projectile(400, 300, game)
         game.current_wave = 3
         game.wave_enemies_spawned = 20
         game.wave_transition = True
@@ -264,14 +207,14 @@ class TestGame:
         assert game.score == 0
         assert game.lives == 3
         assert game.game_over == False
-        assert game.spawn_counter == 0
+        assert game.timers.remaining(game.spawn_timer) == game.enemy_spawn_rate
         assert len(game.enemies) == 0
         assert len(game.projectiles) == 0
         
         # Wave variables should be reset
         assert game.current_wave == 1
         assert game.wave_enemies_spawned == 0
-        assert game.wave_enemies_required == game.calculate_wave_enemies(1)
+        assert game.wave_enemies_required == calculate_wave_enemies(1)
         assert game.wave_transition == False
     
     def test_calculate_wave_enemies(self, mock_pygame):
@@ -282,21 +225,13 @@ class TestGame:
         game = Game()
         
         # Test wave enemy calculations
-        assert game.calculate_wave_enemies(1) == 30  # 30 enemies for wave 1
-        assert game.calculate_wave_enemies(2) == 40  # 40 enemies for wave 2
-        assert game.calculate_wave_enemies(3) == 50  # 50 enemies for wave 3
-        assert game.calculate_wave_enemies(4) == 60  # 60 enemies for wave 4
+        assert calculate_wave_enemies(1) == 30  # 30 enemies for wave 1
+        assert calculate_wave_enemies(2) == 40  # 40 enemies for wave 2
+        assert calculate_wave_enemies(3) == 50  # 50 enemies for wave 3
+        assert calculate_wave_enemies(4) == 60  # 60 enemies for wave 4
     
     def test_wave_completion(self, mock_pygame, monkeypatch):
         """Test wave completion mechanics"""
-        # Mock time for consistent testing
-        mock_time = 0
-        def mock_get_ticks():
-            nonlocal mock_time
-            return mock_time
-            
-        monkeypatch.setattr(pygame.time, 'get_ticks', mock_get_ticks)
-        
         # Mock pygame.key.get_pressed to return an empty dict
         mock_pygame.setattr(pygame.key, 'get_pressed', lambda: {})
         
@@ -312,13 +247,11 @@ class TestGame:
         # Should now be in wave transition
         assert game.wave_transition == True
         assert game.wave_completed == True
-        assert game.wave_message_timer == 0  # Our mocked time value
+        assert game.timers.remaining(game.wave_message_timer) == game.timers.ticks(game.wave_message_duration)
         
-        # Advance time beyond the message duration
-        mock_time = game.wave_message_duration + 100
-        
-        # Update should start the next wave
-        game.update()
+        # Updates until the message timer fires should start the next wave
+        for _ in range(game.timers.ticks(game.wave_message_duration)):
+            game.update()
         
         # Should now be in wave 2
         assert game.current_wave == 2
@@ -0,0 +1,55 @@
+import logging
+import pytest
+from governor import FrameGovernor
+
+def feed(governor, ticks, update_ms, render_ms):
+    """Feed the same timings for a number of ticks, skipping unrendered frames"""
+    for tick in range(ticks):
+        rendered = governor.should_render(tick)
+        governor.record(update_ms, render_ms if rendered else None)
+
+class TestFrameGovernor:
+    def test_starts_at_full_quality(self):
+        """Test that every frame is rendered with a fresh HUD by default"""
+        governor = FrameGovernor(60)
+
+        assert governor.level == 0
+        assert governor.hud_interval == 1
+        assert all(governor.should_render(tick) for tick in range(10))
+
+    def test_stays_at_full_quality_within_budget(self):
+        """Test that a loop within budget is left alone"""
+        governor = FrameGovernor(60)
+
+        feed(governor, 600, update_ms=4, render_ms=6)
+
+        assert governor.level == 0
+
+    def test_degrades_under_sustained_overrun(self):
+        """Test that the governor steps down levels while the budget is overrun"""
+        governor = FrameGovernor(60)
+
+        feed(governor, 600, update_ms=5, render_ms=25)
+
+        # Rendering every third tick brings the cost back under budget
+        assert governor.level == 3
+        assert governor.render_interval == 3
+        assert not governor.should_render(1)
+
+    def test_restores_when_headroom_returns(self):
+        """Test that quality comes back once the load drops"""
+        governor = FrameGovernor(60)
+        feed(governor, 600, update_ms=5, render_ms=25)
+
+        feed(governor, 1200, update_ms=2, render_ms=3)
+
+        assert governor.level == 0
+
+    def test_decisions_are_logged(self, caplog):
+        """Test that each level change is logged"""
+        governor = FrameGovernor(60)
+
+        with caplog.at_level(logging.INFO, logger="governor"):
+            feed(governor, 600, update_ms=5, render_ms=25)
+
+        assert any("degrading to level 1" in message for message in caplog.messages)
@@ -0,0 +1,50 @@
+import pytest
+import pygame
+from game import Game
+
+class TestHud:
+    def test_text_reused_while_values_unchanged(self, mock_pygame):
+        """Test that HUD text is only rendered again when it changes"""
+        game = Game()
+
+        game.hud.draw(game.screen)
+        surfaces = game.hud.surfaces
+        game.tick += 1
+        game.hud.draw(game.screen)
+        assert game.hud.surfaces is surfaces
+
+        game.score += 10
+        game.tick += 1
+        game.hud.draw(game.screen)
+        assert game.hud.surfaces is not surfaces
+        assert game.hud.values == (10, 3, 1)
+
+    def test_refresh_rate_follows_governor(self, mock_pygame):
+        """Test that a degraded governor delays HUD refreshes"""
+        game = Game()
+        game.governor.level = 1
+        game.hud.draw(game.screen)
+
+        game.score += 10
+        game.tick += 5
+        game.hud.draw(game.screen)
+        assert game.hud.values == (0, 3, 1)
+
+        game.tick += 5
+        game.hud.draw(game.screen)
+        assert game.hud.values == (10, 3, 1)
+
+    def test_overlays_follow_game_state(self, mock_pygame):
+        """Test that only the messages for the current static screen are drawn"""
+        game = Game()
+        game.hud.draw_overlays(game.screen)
+        assert game.hud.messages == {}
+
+        game.paused = True
+        game.hud.draw_overlays(game.screen)
+        assert list(game.hud.messages) == [("PAUSED - Press P to Resume", game.WHITE)]
+
+        game.paused = False
+        game.game_over = True
+        game.hud.draw_overlays(game.screen)
+        assert ("GAME OVER", game.RED) in game.hud.messages
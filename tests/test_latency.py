@@ -0,0 +1,133 @@
+import io
+import time
+import pytest
+import pygame
+from controls import Controls
+from game import Game
+from latency import PROBE, LatencyMonitor, LatencyProbe, percentile
+from loop import FrameLoop
+
+class TestLatencyMonitor:
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles of sorted samples"""
+        ordered = list(range(1, 101))
+        assert percentile(ordered, 50) == 50
+        assert percentile(ordered, 99) == 99
+        assert percentile(ordered, 100) == 100
+        assert percentile([], 50) == 0.0
+
+    def test_input_timed_until_presented(self, monkeypatch):
+        """Test that input is timed from its send time to the next present"""
+        now = 10.0
+        monkeypatch.setattr(time, 'perf_counter', lambda: now)
+        monitor = LatencyMonitor(io.StringIO())
+
+        monitor.polled([pygame.event.Event(PROBE, sent=9.99),
+                        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE),
+                        pygame.event.Event(pygame.MOUSEMOTION)])
+        now = 10.005
+        monitor.presented()
+
+        assert [round(ms, 3) for ms in monitor.samples] == [15.0, 5.0]
+        monitor.presented()  # Nothing new to time
+        assert len(monitor.samples) == 2
+
+    def test_close_reports_percentiles(self):
+        """Test the session summary line"""
+        output = io.StringIO()
+        monitor = LatencyMonitor(output)
+        monitor.samples.extend([5.0, 10.0, 20.0])
+
+        monitor.close()
+
+        assert output.getvalue() == (
+            "input latency over 3 inputs: p50 10.0 ms, p90 20.0 ms, p99 20.0 ms, max 20.0 ms\n")
+
+    def test_probe_posts_timestamped_events(self, mock_pygame):
+        """Test that the probe thread posts events carrying their send time"""
+        Game()
+        pygame.event.clear()
+        probe = LatencyProbe(interval=0.01)
+        time.sleep(0.1)
+        probe.close()
+
+        events = pygame.event.get(PROBE)
+        assert events
+        assert all(event.sent <= time.perf_counter() for event in events)
+
+class TestLowLatencyLoop:
+    def calls(self, game, monkeypatch, loop):
+        calls = []
+        monkeypatch.setattr(game, 'handle_events', lambda: calls.append("poll") or Controls())
+        monkeypatch.setattr(loop, 'pace', lambda: calls.append("pace"))
+        monkeypatch.setattr(loop, 'wait_to_poll', lambda: calls.append("wait"))
+        return calls
+
+    def test_sleeps_before_polling(self, mock_pygame, monkeypatch):
+        """Test that low-latency frames wait first and don't sleep after presenting"""
+        game = Game()
+        loop = FrameLoop(game, low_latency=True)
+        calls = self.calls(game, monkeypatch, loop)
+
+        loop.run_frame()
+
+        assert calls == ["pace", "wait", "poll"]
+
+    def test_default_sleeps_after_presenting(self, mock_pygame, monkeypatch):
+        """Test that the default loop polls first and paces at the end"""
+        game = Game()
+        loop = FrameLoop(game)
+        calls = self.calls(game, monkeypatch, loop)
+
+        loop.run_frame()
+
+        assert calls == ["poll", "pace"]
+
+    def test_no_wait_right_after_idle(self, mock_pygame, monkeypatch):
+        """Test that the frame after an idle wait polls straight away"""
+        game = Game()
+        loop = FrameLoop(game, low_latency=True)
+        loop.woken = True
+        calls = self.calls(game, monkeypatch, loop)
+
+        loop.run_frame()
+
+        assert calls == ["poll"]
+        assert loop.woken == False
+
+    def test_wait_leaves_time_for_expected_work(self, mock_pygame, monkeypatch):
+        """Test that the late-poll delay is the budget less the expected cost and margin"""
+        game = Game()
+        game.governor.update_ms = 3.0
+        game.governor.render_ms = 4.7
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+        FrameLoop(game, low_latency=True).wait_to_poll()
+
+        assert sleeps == [pytest.approx((1000 / 60 - 7.7 - FrameLoop.LATE_POLL_MARGIN_MS) / 1000)]
+
+    def test_busy_loop_uses_busy_tick(self, mock_pygame, monkeypatch):
+        """Test that busy_loop paces frames with tick_busy_loop"""
+        game = Game()
+        ticks = []
+        game.clock = type("Clock", (), {
+            "tick": lambda self, fps=0: ticks.append("tick"),
+            "tick_busy_loop": lambda self, fps=0: ticks.append("busy"),
+        })()
+
+        FrameLoop(game, busy_loop=True).pace()
+        FrameLoop(game).pace()
+
+        assert ticks == ["busy", "tick"]
+
+    def test_loop_reports_presented_input(self, mock_pygame):
+        """Test that a rendered frame completes the latency of polled input"""
+        game = Game()
+        game.latency = LatencyMonitor(io.StringIO())
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(PROBE, sent=time.perf_counter()))
+
+        FrameLoop(game).run_frame()
+
+        assert len(game.latency.samples) == 1
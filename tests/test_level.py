@@ -0,0 +1,134 @@
+import pytest
+from controls import Controls
+from game import Game
+from level import COLUMN, LINE, Level, generate_level, write_level
+from level_stream import LevelStream
+from player import Player
+
+COLUMNS, ROWS, TILE = 4, 30, 20  # 80 pixel chunks
+
+def open_level(tmp_path, chunks):
+    """Write chunks with the test's small chunk size and map the file"""
+    path = tmp_path / "test.lvl"
+    write_level(path, chunks, TILE, COLUMNS, ROWS)
+    return Level(path)
+
+def empty(encounters=()):
+    return bytes(COLUMNS * ROWS), list(encounters)
+
+def floor(height):
+    """Chunk with solid tiles along the bottom"""
+    column = bytes(ROWS - height) + bytes([1] * height)
+    return column * COLUMNS, []
+
+class TestLevel:
+    def test_chunks_read_back(self, tmp_path):
+        """Test that terrain and encounters are read from the right chunk"""
+        level = open_level(tmp_path, [empty(), floor(2), empty([(3, LINE, 5, 200, 45), (1, COLUMN, 2, 100, 40)])])
+
+        assert (level.chunks, level.chunk_width, level.width) == (3, 80, 240)
+        assert bytes(level.terrain(1)[:ROWS]) == bytes(ROWS - 2) + b"\x01\x01"
+        assert level.encounters(0) == []
+        assert [(e.x, e.formation, e.count) for e in level.encounters(2)] == [(180, COLUMN, 2), (220, LINE, 5)]
+        level.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the level header is refused"""
+        path = tmp_path / "bad.lvl"
+        path.write_bytes(b"not a level file at all")
+
+        with pytest.raises(ValueError):
+            Level(path)
+
+    def test_generated_level_opens(self, tmp_path):
+        """Test that the cave generator writes a readable level"""
+        path = tmp_path / "cave.lvl"
+        generate_level(path, 5)
+
+        level = Level(path)
+        assert level.chunks == 5
+        assert len(level.encounters(1)) == 1
+        level.close()
+
+class TestLevelStream:
+    def test_only_nearby_chunks_loaded(self, tmp_path):
+        """Test that chunks stream in ahead of the camera and out behind it"""
+        level = open_level(tmp_path, [empty() for _ in range(20)])
+        stream = LevelStream(level, width=160, height=600, speed=10, lookahead=80)
+
+        assert sorted(stream.chunks) == [0, 1, 2, 3]
+        for _ in range(50):
+            stream.advance()
+
+        assert stream.camera == 500
+        assert sorted(stream.chunks) == [6, 7, 8, 9]
+        stream.close()
+
+    def test_camera_stops_at_end(self, tmp_path):
+        """Test that the camera never scrolls past the last chunk"""
+        level = open_level(tmp_path, [empty() for _ in range(3)])
+        stream = LevelStream(level, width=160, height=600, speed=100)
+
+        stream.advance()
+        stream.advance()
+
+        assert stream.camera == 80
+        stream.close()
+
+    def test_encounters_reached_once(self, tmp_path):
+        """Test that an encounter is returned when the screen edge passes it"""
+        level = open_level(tmp_path, [empty(), empty(), empty([(2, LINE, 3, 200, 45)]), empty()])
+        stream = LevelStream(level, width=160, height=600, speed=10)
+
+        reached = [stream.advance() for _ in range(10)]
+
+        assert [len(r) for r in reached] == [0, 0, 0, 1, 0, 0, 0, 0, 0, 0]
+        assert reached[3][0].x == 200
+        stream.close()
+
+    def test_solid_uses_camera_position(self, tmp_path):
+        """Test that terrain lookups are in screen coordinates"""
+        level = open_level(tmp_path, [empty(), floor(2)])
+        stream = LevelStream(level, width=80, height=600, speed=40)
+
+        assert not stream.solid(50, 590)
+        stream.advance()
+
+        assert stream.solid(50, 590)
+        assert not stream.solid(50, 550)
+        stream.close()
+
+class TestLevelGame:
+    def test_level_waves_come_from_encounters(self, mock_pygame, tmp_path):
+        """Test that encounters spawn enemies into the current wave"""
+        game = Game()
+        game.load_level(open_level(tmp_path, [empty() for _ in range(10)] + [empty([(1, COLUMN, 3, 100, 40)])] + [empty()] * 10))
+        assert game.wave_enemies_required == 0
+
+        for _ in range(5):
+            game.update()
+        assert len(game.enemies) == 0
+        assert not game.wave_transition
+
+        while game.level.camera + game.width < 820:
+            game.update()
+
+        assert game.wave_enemies_required == 3
+        assert sorted(enemy.y for enemy in game.enemies) == [100, 140, 180]
+
+    def test_terrain_hits_player_and_blocks_projectiles(self, mock_pygame, tmp_path):
+        """Test that the player and projectiles collide with terrain"""
+        game = Game()
+        game.load_level(open_level(tmp_path, [floor(5)] * 20))
+        game.player.y = game.height - 140
+        game.player.shoot()
+        game.projectiles[0].y = game.height - 80
+
+        game.step(Controls())
+        assert game.lives == 3
+        game.player.y = game.height - 90
+        game.step(Controls())
+
+        assert game.lives == 2
+        assert game.player.is_ghost
+        assert len(game.projectiles) == 0
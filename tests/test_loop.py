@@ -0,0 +1,147 @@
+import pytest
+import pygame
+from game import Game
+from loop import FrameLoop
+from waves import complete_wave
+
+class TestFrameLoop:
+    def test_pause_key_stops_simulation(self, mock_pygame):
+        """Test that P pauses the game and ticks stop advancing"""
+        game = Game()
+        loop = FrameLoop(game)
+        pygame.event.clear()
+
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        loop.run_frame()
+        assert game.paused == True
+        tick = game.tick
+
+        loop.run_frame()
+        assert game.tick == tick
+
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        loop.run_frame()
+        assert game.paused == False
+        assert game.tick == tick + 1
+
+    def test_timers_stop_while_paused(self, mock_pygame):
+        """Test that timers don't run down while the game is paused"""
+        game = Game()
+        game.player.enter_ghost_state()
+        complete_wave(game)
+        loop = FrameLoop(game)
+        pygame.event.clear()
+        loop.run_frame()
+        ghost = game.timers.remaining(game.player.ghost_timer)
+        wave = game.timers.remaining(game.wave_message_timer)
+
+        game.paused = True
+        for _ in range(30):
+            loop.run_frame()
+
+        assert game.timers.remaining(game.player.ghost_timer) == ghost
+        assert game.timers.remaining(game.wave_message_timer) == wave
+        assert game.player.is_ghost == True
+
+    def test_static_screen_drawn_once_then_waits(self, mock_pygame, monkeypatch):
+        """Test that a game over screen is drawn once and the loop then blocks on input"""
+        game = Game()
+        game.game_over = True
+        loop = FrameLoop(game)
+        pygame.event.clear()
+
+        loop.run_frame()
+        assert loop.static_frame_drawn == True
+
+        timeouts = []
+        def mock_wait(timeout=0):
+            timeouts.append(timeout)
+            return pygame.event.Event(pygame.NOEVENT)
+        monkeypatch.setattr(pygame.event, 'wait', mock_wait)
+
+        loop.wait_while_idle()
+
+        # Nothing is scheduled, so it waits for input with no timeout
+        assert timeouts == [0]
+        assert loop.static_frame_drawn == False
+
+    def test_wave_transition_wait_catches_up_ticks(self, mock_pygame, monkeypatch):
+        """Test that waking from a wave transition runs the ticks missed while blocked"""
+        mock_time = 0
+        monkeypatch.setattr(pygame.time, 'get_ticks', lambda: mock_time)
+        game = Game()
+        complete_wave(game)
+        loop = FrameLoop(game)
+
+        timeouts = []
+        def mock_wait(timeout=0):
+            nonlocal mock_time
+            timeouts.append(timeout)
+            mock_time += timeout
+            return pygame.event.Event(pygame.NOEVENT)
+        monkeypatch.setattr(pygame.event, 'wait', mock_wait)
+
+        loop.wait_while_idle()
+        pygame.event.clear()
+        loop.run_frame()
+
+        assert timeouts == [game.wave_message_duration]
+        assert game.wave_transition == False
+        assert game.current_wave == 2
+
+    def test_pause_drawn_when_governor_skips_frames(self, mock_pygame, monkeypatch):
+        """Test that pausing on a tick the degraded governor would skip still
+        draws the pause screen and lets the loop go idle"""
+        game = Game()
+        game.governor.level = 2  # Render every other tick
+        game.tick = 1
+        game.paused = True
+        loop = FrameLoop(game)
+        renders = []
+        monkeypatch.setattr(game, 'render', lambda: renders.append(game.tick))
+        pygame.event.clear()
+
+        loop.run_frame()
+
+        assert renders == [1]
+        assert loop.static_frame_drawn == True
+
+    def test_static_screen_shows_current_hud(self, mock_pygame):
+        """Test that a screen drawn once before idling doesn't keep HUD text
+        the degraded governor hasn't refreshed yet"""
+        game = Game()
+        game.governor.level = 1  # Refresh HUD text every 10 ticks
+        loop = FrameLoop(game)
+        pygame.event.clear()
+        loop.run_frame()
+
+        game.score += 10
+        game.lives = 0
+        game.game_over = True
+        loop.run_frame()
+
+        assert loop.static_frame_drawn == True
+        assert game.hud.values == (10, 0, 1)
+
+    def test_pause_shows_current_hud(self, mock_pygame):
+        """Test that pausing right after a score change shows the new score"""
+        game = Game()
+        game.governor.level = 1
+        loop = FrameLoop(game)
+        pygame.event.clear()
+        loop.run_frame()
+
+        game.score += 10
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        loop.run_frame()
+
+        assert game.paused == True
+        assert game.hud.values == (10, 3, 1)
+
+    def test_messages_rendered_once(self, mock_pygame):
+        """Test that static message text is reused between frames"""
+        game = Game()
+
+        first = game.hud.message("GAME OVER", game.RED)
+
+        assert game.hud.message("GAME OVER", game.RED) is first
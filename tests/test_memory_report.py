@@ -0,0 +1,53 @@
+import io
+import tracemalloc
+import pytest
+from enemy import Enemy
+from memory_report import MemoryReport
+from tests.conftest import MockGame
+
+class TestMemoryReport:
+    def test_report_written_when_wave_changes(self, monkeypatch):
+        """Test that a line is reported for each finished wave"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        output = io.StringIO()
+        report = MemoryReport(output)
+        try:
+            game = MockGame()
+            game.current_wave = 1
+            report.sample(game)
+            game.enemies = [Enemy(400, 300, game) for _ in range(50)]
+            report.sample(game)
+
+            # Nothing is written until the wave ends
+            assert output.getvalue() == ""
+
+            game.enemies = []
+            game.current_wave = 2
+            report.sample(game)
+        finally:
+            report.close()
+
+        assert len(report.rows) == 1
+        wave, peak_entities, per_entity, end_memory = report.rows[0]
+        assert wave == 1
+        assert peak_entities == 51  # 50 enemies plus the player
+        assert per_entity > 0
+        assert output.getvalue().startswith("wave 1: peak entities 51")
+
+    def test_close_stops_tracing(self):
+        """Test that closing the report stops tracemalloc"""
+        report = MemoryReport(io.StringIO())
+        assert tracemalloc.is_tracing()
+
+        report.close()
+
+        assert not tracemalloc.is_tracing()
+
+    def test_entities_have_no_instance_dict(self, monkeypatch):
+        """Test that entities use slots instead of a per-instance __dict__"""
+        monkeypatch.setattr('random.uniform', lambda min_val, max_val: 2.0)
+
+        enemy = Enemy(400, 300, MockGame())
+
+        assert not hasattr(enemy, '__dict__')
@@ -0,0 +1,84 @@
+import json
+import pytest
+from metrics import Counter, Histogram, MetricsFlusher, Registry, REGISTRY
+from player import Player
+from tests.conftest import MockGame
+
+class TestMetrics:
+    def test_registry_reuses_metrics_by_name(self):
+        """Test that asking for the same name twice returns the same metric"""
+        registry = Registry()
+
+        counter = registry.counter("things_total", "Things")
+
+        assert registry.counter("things_total", "Things") is counter
+        assert isinstance(counter, Counter)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram samples count observations at or below each bound"""
+        histogram = Histogram("frame_ms", "Frame time", buckets=(10, 20))
+
+        for value in (5, 10, 15, 100):
+            histogram.observe(value)
+
+        sample = histogram.sample()
+        assert sample["buckets"] == {"10": 2, "20": 3, "+Inf": 4}
+        assert sample["sum"] == 130
+        assert sample["count"] == 4
+
+    def test_prometheus_text_format(self):
+        """Test that metrics render in the Prometheus exposition format"""
+        registry = Registry()
+        registry.counter("shots_total", "Shots").inc(3)
+        registry.gauge("enemies", "Enemies").set(7)
+        registry.histogram("update_ms", "Update time").observe(3)
+
+        text = registry.to_prometheus()
+
+        assert "# TYPE shots_total counter\nshots_total 3\n" in text
+        assert "enemies 7\n" in text
+        assert 'update_ms_bucket{le="4"} 1\n' in text
+        assert "update_ms_count 1\n" in text
+
+    def test_player_shoot_counted(self):
+        """Test that firing increments the global shot counter"""
+        shots = REGISTRY.counter("shots_fired_total", "Projectiles fired by the player")
+        before = shots.value
+
+        game = MockGame()
+        Player(50, 300, game).shoot()
+        assert shots.value == before
+
+        # Counted with the rest of the tick's events
+        game.events.dispatch()
+        assert shots.value == before + 1
+
+    def test_flusher_appends_json_lines(self, tmp_path):
+        """Test that the jsonl format appends a record per flush"""
+        registry = Registry()
+        counter = registry.counter("ticks_total", "Ticks")
+        path = tmp_path / "metrics.jsonl"
+        flusher = MetricsFlusher(str(path), "jsonl", interval=60, registry=registry)
+
+        counter.inc()
+        flusher.flush()
+        counter.inc()
+        flusher.close()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["ticks_total"] for record in records] == [1, 2]
+
+    def test_flusher_replaces_prometheus_file(self, tmp_path):
+        """Test that the prometheus format keeps only the latest values"""
+        registry = Registry()
+        gauge = registry.gauge("wave", "Wave")
+        path = tmp_path / "metrics.prom"
+        flusher = MetricsFlusher(str(path), interval=60, registry=registry)
+
+        gauge.set(1)
+        flusher.flush()
+        gauge.set(2)
+        flusher.close()
+
+        assert path.read_text().count("wave 2") == 1
+        assert "wave 1" not in path.read_text()
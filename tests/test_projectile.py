@@ -1,6 +1,7 @@
 import pytest
 import pygame
 from projectile import Projectile
+from systems import expire_offscreen, move
 from tests.conftest import MockGame
 
 class TestProjectile:
@@ -26,7 +27,7 @@ class TestProjectile:
         initial_x = projectile.x
         
         # Update projectile position
-        projectile.update()
+        move(game)
         
         # Projectile should move right by speed amount
         assert projectile.x == initial_x + projectile.speed
@@ -39,7 +40,6 @@ class TestProjectile:
         
         # Create projectile beyond the edge of the screen
         projectile = Projectile(game.width + 10, 200, game)  # Already off-screen to the right
-        game.projectiles.append(projectile)
         
         # Before update
         assert len(game.projectiles) == 1
@@ -57,13 +57,13 @@ class TestProjectile:
         
         # Create projectile well within the screen
         projectile = Projectile(300, 200, game)
-        game.projectiles.append(projectile)
         
         # Before update
         assert len(game.projectiles) == 1
         
         # Update projectile position - it should remain on screen
-        projectile.update()
+        move(game)
+        expire_offscreen(game)
         
         # Projectile should still be in the game's projectiles list
         assert len(game.projectiles) == 1
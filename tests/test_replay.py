@@ -0,0 +1,99 @@
+import io
+import pytest
+import pygame
+from controls import Controls, DOWN, FIRE, UP
+from game import Game
+from game_state import snapshot
+from replay import ReplayReader, ReplayViewer, ReplayWriter, read_varint, write_varint
+
+def scripted_controls(tick):
+    """Weave up and down while firing regularly"""
+    mask = UP if (tick // 40) % 2 else DOWN
+    if tick % 7 == 0:
+        mask |= FIRE
+    return Controls(mask)
+
+def record_session(path, ticks, keyframe_interval=200, hashes=False):
+    """Record a scripted session and return the game's snapshots by tick"""
+    game = Game()
+    game.recorder = ReplayWriter(path, game, seed=1234, keyframe_interval=keyframe_interval, hashes=hashes)
+    snapshots = {}
+    for _ in range(ticks):
+        snapshots[game.tick] = snapshot(game)
+        game.step(scripted_controls(game.tick))
+    game.recorder.close()
+    return snapshots
+
+class TestReplay:
+    def test_varint_roundtrip(self):
+        """Test that varints decode to the values they were written from"""
+        buffer = io.BytesIO()
+        values = [0, 1, 127, 128, 300, 2 ** 40]
+        for value in values:
+            write_varint(buffer, value)
+
+        data = buffer.getvalue()
+        pos = 0
+        decoded = []
+        for _ in values:
+            value, pos = read_varint(data, pos)
+            decoded.append(value)
+
+        assert decoded == values
+        assert pos == len(data)
+
+    def test_reader_indexes_recording(self, mock_pygame, tmp_path):
+        """Test that the reader finds every keyframe and the recording's length"""
+        path = tmp_path / "session.replay"
+        record_session(path, 450)
+
+        reader = ReplayReader(path)
+
+        assert reader.seed == 1234
+        assert reader.keyframe_ticks == [0, 200, 400]
+        assert reader.end_tick == 450
+        assert reader.controls_at(7).mask == scripted_controls(7).mask
+        assert reader.controls_at(41).mask == scripted_controls(41).mask
+
+    def test_seek_matches_recorded_state(self, mock_pygame, tmp_path):
+        """Test that seeking reproduces the exact state the game had at that tick"""
+        path = tmp_path / "session.replay"
+        snapshots = record_session(path, 1500)
+
+        game = Game()
+        viewer = ReplayViewer(game, ReplayReader(path))
+
+        for tick in (1234, 150, 1499):
+            viewer.seek(tick)
+            assert game.tick == tick
+            assert snapshot(game) == snapshots[tick]
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the replay header is refused"""
+        path = tmp_path / "not_a_replay"
+        path.write_bytes(b"hello world, this is not a replay")
+
+        with pytest.raises(ValueError):
+            ReplayReader(path)
+
+    def test_hashes_recorded_every_tick(self, mock_pygame, tmp_path):
+        """Test that a recording made with hashes has one for each tick"""
+        path = tmp_path / "session.replay"
+        record_session(path, 300, hashes=True)
+
+        reader = ReplayReader(path)
+
+        assert sorted(reader.hashes) == list(range(300))
+
+    def test_playback_matches_recorded_hashes(self, mock_pygame, tmp_path):
+        """Test that playing a recording back reproduces every state hash"""
+        path = tmp_path / "session.replay"
+        record_session(path, 600, hashes=True)
+
+        game = Game()
+        viewer = ReplayViewer(game, ReplayReader(path))
+        viewer.seek(0)
+        while game.tick < viewer.reader.end_tick:
+            viewer.step()
+
+        assert viewer.desync_tick is None
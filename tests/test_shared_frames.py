@@ -0,0 +1,135 @@
+import os
+import subprocess
+import sys
+import uuid
+from multiprocessing import shared_memory
+import pytest
+import pygame
+from enemy import Enemy
+from game import Game
+from loop import FrameLoop
+from projectile import Projectile
+from shared_frames import SEQUENCE, SharedFrameReader, SharedFrameWriter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def name():
+    return f"ssfr_test_{uuid.uuid4().hex[:8]}"
+
+@pytest.fixture
+def ring(mock_pygame, name):
+    game = Game()
+    writer = SharedFrameWriter(name, (game.width, game.height), slots=2, capacity=8)
+    reader = SharedFrameReader(name)
+    yield game, writer, reader
+    reader.close()
+    writer.close()
+
+class TestSharedFrames:
+    def test_frame_and_state_round_trip(self, ring):
+        """Test that a published frame's pixels and state can be read back"""
+        game, writer, reader = ring
+        Enemy(300, 200, game)
+        Projectile(100, 150, game)
+        game.score = 40
+        game.screen.fill((10, 20, 30))
+
+        writer.publish(game)
+        frame = reader.read()
+
+        assert frame.sequence == 1
+        assert (frame.tick, frame.score, frame.lives, frame.wave) == (game.tick, 40, 3, 1)
+        assert frame.player == (game.player.x, game.player.y, True)
+        ids, xs, ys = frame.enemies
+        assert (list(xs), list(ys)) == ([300.0], [200.0])
+        assert list(frame.projectiles[1]) == [100.0]
+        # Pixels are BGRA
+        assert bytes(frame.pixels[:4]) == bytes((30, 20, 10, 255))
+        assert reader.valid(frame)
+        del frame, ids, xs, ys
+
+    def test_nothing_to_read_before_first_frame(self, ring):
+        """Test that a fresh buffer has no latest frame"""
+        _, _, reader = ring
+        assert reader.latest() == 0
+        assert reader.read() is None
+
+    def test_overwritten_frame_is_invalid(self, ring):
+        """Test that a frame whose slot was reused is reported, not returned stale"""
+        game, writer, reader = ring
+        writer.publish(game)
+        frame = reader.read()
+        writer.publish(game)
+        assert reader.valid(frame)
+
+        writer.publish(game)  # Two slots, so this reuses the first frame's
+        assert not reader.valid(frame)
+        assert reader.read(1) is None
+        assert reader.read(3).sequence == 3
+        del frame
+
+    def test_frame_being_written_is_skipped(self, ring):
+        """Test that a slot whose sequence word is odd isn't read"""
+        game, writer, reader = ring
+        writer.publish(game)
+        SEQUENCE.pack_into(writer.buffer, writer.slot_start(1), 1)
+
+        assert reader.read() is None
+
+    def test_entities_beyond_capacity_left_out(self, ring):
+        """Test that only `capacity` enemies are packed"""
+        game, writer, reader = ring
+        for i in range(12):
+            Enemy(300 + i, 200, game)
+
+        writer.publish(game)
+        frame = reader.read()
+
+        assert len(frame.enemies[0]) == 8
+        del frame
+
+    def test_rejects_other_shared_memory(self, name):
+        """Test that attaching to a segment without the header fails"""
+        memory = shared_memory.SharedMemory(name, create=True, size=128)
+        try:
+            with pytest.raises(ValueError):
+                SharedFrameReader(name)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_read_from_another_process(self, ring, name):
+        """Test that a separate process reads the frame and leaves the segment in place"""
+        game, writer, _ = ring
+        game.score = 70
+        writer.publish(game)
+
+        script = (
+            "from shared_frames import SharedFrameReader\n"
+            f"reader = SharedFrameReader({name!r})\n"
+            "frame = reader.read()\n"
+            "print(frame.sequence, frame.score)\n"
+            "del frame\n"
+            "reader.close()\n"
+        )
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+        result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                                capture_output=True, text=True, check=True)
+
+        assert result.stdout.split() == ["1", "70"]
+        assert "leaked" not in result.stderr
+        writer.publish(game)  # Still mapped and usable
+
+    def test_loop_publishes_rendered_frames(self, ring):
+        """Test that the frame loop publishes each frame it renders"""
+        game, writer, reader = ring
+        game.publisher = writer
+        loop = FrameLoop(game)
+        pygame.event.clear()
+
+        loop.run_frame()
+        loop.run_frame()
+
+        assert reader.latest() == 2
+        assert reader.read().tick == game.tick
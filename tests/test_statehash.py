@@ -0,0 +1,61 @@
+import math
+import random
+from game_state import restore, snapshot
+from game import Game
+from enemy import Enemy
+from statehash import section_hashes, state_hash
+
+def busy_game():
+    """A game with a few enemies and projectiles on screen"""
+    random.seed(7)
+    game = Game()
+    for y in (100, 200, 300):
+        Enemy(600, y, game)
+    game.player.shoot()
+    return game
+
+class TestStateHash:
+    def test_same_state_same_hash(self, mock_pygame):
+        """Test that hashing doesn't change the state or give different answers"""
+        game = busy_game()
+
+        assert state_hash(game) == state_hash(game)
+        assert 0 <= state_hash(game) < 2 ** 64
+
+    def test_tiny_position_change_detected(self, mock_pygame):
+        """Test that a one-ulp difference in an entity position changes the hash"""
+        game = busy_game()
+        before = section_hashes(game)
+
+        enemy = game.enemies[1]
+        enemy.x = math.nextafter(enemy.x, 0)
+
+        after = section_hashes(game)
+        assert after["enemy"] != before["enemy"]
+        assert after["player"] == before["player"]
+        assert after["game"] == before["game"]
+
+    def test_game_fields_and_random_state_covered(self, mock_pygame):
+        """Test that score and RNG changes show up in their sections"""
+        game = busy_game()
+        before = section_hashes(game)
+
+        game.score += 10
+        random.random()
+
+        after = section_hashes(game)
+        assert after["game"] != before["game"]
+        assert after["random"] != before["random"]
+
+    def test_restored_state_hashes_the_same(self, mock_pygame):
+        """Test that a snapshot restored into another game hashes identically"""
+        game = busy_game()
+        for _ in range(30):
+            game.update()
+        state = snapshot(game)
+        expected = state_hash(game)
+
+        other = Game()
+        restore(other, state)
+
+        assert state_hash(other) == expected
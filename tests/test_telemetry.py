@@ -0,0 +1,124 @@
+import math
+import time
+import pytest
+import pygame
+from game import Game
+from loop import FrameLoop
+from telemetry import (COLUMNS, NPY_HEADER_SIZE, TelemetryReader, TelemetryWriter, npy_header,
+                       parse_npy_header)
+
+class FakeGame:
+    """Just the fields telemetry records"""
+    def __init__(self):
+        self.tick = 0
+        self.current_wave = 1
+        self.enemies = []
+        self.projectiles = []
+        self.score = 0
+        self.lives = 3
+
+def record_ticks(writer, game, ticks):
+    for _ in range(ticks):
+        game.tick += 1
+        game.score += 10
+        writer.record(game, 1.5, None if game.tick % 2 else 4.0)
+
+class TestTelemetry:
+    def test_npy_header_round_trip(self):
+        """Test that the fixed-size header parses back to its dtype and length"""
+        header = npy_header("i4", 12345)
+
+        assert len(header) == NPY_HEADER_SIZE
+        assert header.endswith(b"\n")
+        descr, length, offset = parse_npy_header(header)
+        assert descr.endswith("i4")
+        assert (length, offset) == (12345, NPY_HEADER_SIZE)
+
+    def test_rows_written_in_blocks_and_read_back(self, tmp_path):
+        """Test that full blocks and the partial last one all reach the files"""
+        writer = TelemetryWriter(str(tmp_path), block_size=4)
+        game = FakeGame()
+        game.enemies = [object()] * 5
+        record_ticks(writer, game, 10)
+        writer.close()
+
+        reader = TelemetryReader(str(tmp_path))
+        assert len(reader) == 10
+        assert list(reader["tick"]) == list(range(10))
+        assert list(reader["score"]) == list(range(10, 101, 10))
+        assert set(reader["enemies"]) == {5}
+        assert reader["update_ms"][0] == 1.5
+        assert math.isnan(reader["render_ms"][0])
+        assert reader["render_ms"][1] == 4.0
+        reader.close()
+
+    def test_files_are_plain_npy_arrays(self, tmp_path):
+        """Test that each column file is a header followed by packed values"""
+        writer = TelemetryWriter(str(tmp_path), block_size=3)
+        record_ticks(writer, FakeGame(), 5)
+        writer.close()
+
+        for name, _, dtype in COLUMNS:
+            data = (tmp_path / f"{name}.npy").read_bytes()
+            descr, length, offset = parse_npy_header(data)
+            assert length == 5
+            assert len(data) == offset + 5 * int(dtype[1])
+
+    def test_blocks_written_while_recording(self, tmp_path):
+        """Test that a full block is flushed by the thread before close"""
+        writer = TelemetryWriter(str(tmp_path), block_size=2)
+        record_ticks(writer, FakeGame(), 5)
+        deadline = time.monotonic() + 2
+        while writer.lengths[-1] < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        reader = TelemetryReader(str(tmp_path))
+        assert len(reader) == 4  # The fifth row waits for its block to fill
+        reader.close()
+        writer.close()
+
+    def test_reader_rejects_wrong_dtype(self, tmp_path):
+        """Test that a column written with another type isn't misread"""
+        writer = TelemetryWriter(str(tmp_path))
+        writer.close()
+        (tmp_path / "tick.npy").write_bytes(npy_header("f8", 0))
+
+        with pytest.raises(ValueError):
+            TelemetryReader(str(tmp_path))
+
+    def test_wave_summary(self, tmp_path):
+        """Test the per-wave peaks and timings used by the command line summary"""
+        writer = TelemetryWriter(str(tmp_path))
+        game = FakeGame()
+        record_ticks(writer, game, 4)
+        game.current_wave = 2
+        game.projectiles = [object()] * 7
+        record_ticks(writer, game, 2)
+        writer.close()
+
+        reader = TelemetryReader(str(tmp_path))
+        first, second = reader.waves()
+        reader.close()
+
+        assert first[:4] == (1, 4, 0, 0)
+        assert first[4:6] == (1.5, 1.5)
+        assert first[6:] == (4.0, 4.0)  # Skipped frames are left out
+        assert second[:4] == (2, 2, 0, 7)
+
+    def test_loop_records_stepped_ticks(self, mock_pygame, tmp_path):
+        """Test that the frame loop adds a row per tick, but none while paused"""
+        game = Game()
+        writer = TelemetryWriter(str(tmp_path))
+        loop = FrameLoop(game, telemetry=writer)
+        pygame.event.clear()
+
+        loop.run_frame()
+        loop.run_frame()
+        game.paused = True
+        loop.run_frame()
+        writer.close()
+
+        reader = TelemetryReader(str(tmp_path))
+        assert list(reader["tick"]) == [0, 1]
+        assert not math.isnan(reader["render_ms"][0])
+        reader.close()
@@ -0,0 +1,108 @@
+import pytest
+from timers import TimerWheel
+
+class Recorder:
+    """Timer target that records the events fired at it"""
+    def __init__(self):
+        self.fired = []
+
+def record(target, *args):
+    target.fired.append((target.wheel.now,) + args)
+
+def make_wheel(**kwargs):
+    target = Recorder()
+    target.wheel = TimerWheel(target, {"record": record}, **kwargs)
+    return target.wheel
+
+def run(wheel, ticks):
+    for _ in range(ticks):
+        wheel.advance()
+
+class TestTimerWheel:
+    def test_fires_on_due_tick(self):
+        """Test that a timer fires exactly when its delay has passed"""
+        wheel = make_wheel()
+        wheel.schedule(5, "record", "a")
+
+        run(wheel, 4)
+        assert wheel.target.fired == []
+        run(wheel, 1)
+        assert wheel.target.fired == [(5, "a")]
+
+    @pytest.mark.parametrize("delay", [63, 64, 65, 4095, 4096, 100000])
+    def test_long_delays_cascade_to_due_tick(self, delay):
+        """Test that timers in higher levels still fire on the right tick"""
+        wheel = make_wheel()
+        run(wheel, 37)  # Start part way through a turn
+        wheel.schedule(delay, "record")
+
+        run(wheel, delay)
+
+        assert wheel.target.fired == [(37 + delay,)]
+
+    def test_delay_beyond_top_level_is_kept(self):
+        """Test that a delay longer than the wheel spans still fires on time"""
+        wheel = make_wheel(bits=2, levels=2)  # Spans 15 ticks
+        wheel.schedule(40, "record")
+
+        run(wheel, 40)
+
+        assert wheel.target.fired == [(40,)]
+
+    def test_cancelled_timer_does_not_fire(self):
+        """Test that a cancelled timer is skipped and no longer pending"""
+        wheel = make_wheel()
+        timer = wheel.schedule(3, "record")
+
+        wheel.cancel(timer)
+        run(wheel, 5)
+
+        assert wheel.target.fired == []
+        assert not wheel.pending(timer)
+        assert wheel.remaining(timer) is None
+
+    def test_repeating_timer_until_cancelled(self):
+        """Test that an interval timer fires every interval until cancelled"""
+        wheel = make_wheel()
+        timer = wheel.schedule(2, "record", interval=3)
+
+        run(wheel, 8)
+        wheel.cancel(timer)
+        run(wheel, 10)
+
+        assert [tick for tick, in wheel.target.fired] == [2, 5, 8]
+
+    def test_same_tick_fires_in_scheduling_order(self):
+        """Test that timers due together fire in the order they were scheduled"""
+        wheel = make_wheel()
+        wheel.schedule(100, "record", "first")
+        run(wheel, 90)
+        wheel.schedule(10, "record", "second")
+
+        run(wheel, 10)
+
+        assert wheel.target.fired == [(100, "first"), (100, "second")]
+
+    def test_ticks_converts_milliseconds(self):
+        """Test that durations in milliseconds round to whole ticks"""
+        wheel = make_wheel(fps=60)
+
+        assert wheel.ticks(1000) == 60
+        assert wheel.ticks(100) == 6
+        assert wheel.ticks(1) == 1
+
+    def test_snapshot_restore_round_trip(self):
+        """Test that restored timers fire as they would have"""
+        wheel = make_wheel()
+        run(wheel, 10)
+        wheel.schedule(5000, "record", "far")
+        wheel.schedule(20, "record", "near", interval=30)
+        state = wheel.snapshot()
+
+        restored = make_wheel()
+        restored.restore(state)
+        run(wheel, 5000)
+        run(restored, 5000)
+
+        assert restored.snapshot() == wheel.snapshot()
+        assert restored.target.fired == wheel.target.fired
@@ -0,0 +1,100 @@
+import systems
+import weapons
+from controls import FIRE, FIRE_HELD, Controls
+from events import EnemyKilled, PowerUpCollected, ShotFired
+from game import Game
+from powerup import PowerUp
+from weapons import WEAPONS, arm, drop_powerups, spawn_volley
+
+class TestWeapons:
+    def test_blaster_fires_once_per_press(self, mock_pygame):
+        """Test that the default weapon ignores a held button"""
+        game = Game()
+
+        game.player.trigger(Controls(FIRE | FIRE_HELD))
+        game.player.trigger(Controls(FIRE_HELD))
+
+        assert len(game.projectiles) == 1
+
+    def test_automatic_weapon_fires_at_its_cooldown(self, mock_pygame):
+        """Test that a held trigger fires once every cooldown ticks"""
+        game = Game()
+        game.player.weapon = "rapid"
+        cooldown = WEAPONS["rapid"].cooldown
+        volleys = 0
+        for tick in range(3 * cooldown):
+            game.tick = tick
+            before = len(game.projectiles)
+            game.player.trigger(Controls(FIRE_HELD))
+            volleys += len(game.projectiles) > before
+
+        assert volleys == 3
+
+    def test_volley_spawned_in_one_insertion(self, mock_pygame, monkeypatch):
+        """Test that a whole spread volley goes into the world in one spawn_many"""
+        game = Game()
+        calls = []
+        spawn_many = game.world.spawn_many
+        monkeypatch.setattr(game.world, 'spawn_many',
+                            lambda archetype, **columns: calls.append(archetype) or spawn_many(archetype, **columns))
+
+        spawn_volley(game, WEAPONS["spread"], 100, 200)
+
+        pattern = WEAPONS["spread"].pattern
+        assert len(calls) == 1
+        assert len(game.projectiles) == len(pattern)
+        assert sorted(p.vy for p in game.projectiles) == sorted(vy for _, _, vy in pattern)
+        assert [type(e) for e in game.events.pending] == [ShotFired] * len(pattern)
+
+    def test_angled_shots_move_and_expire_vertically(self, mock_pygame):
+        """Test that spread shots climb and are removed once off the top"""
+        game = Game()
+        spawn_volley(game, weapons.Weapon("up", 0, False, ((0, 0, -5),)), 100, 8)
+        projectile = game.projectiles[0]
+
+        systems.move(game)
+        assert projectile.y == 3
+
+        for _ in range(3):
+            systems.move(game)
+        systems.expire_offscreen(game)
+        assert len(game.projectiles) == 0
+
+class TestPowerUps:
+    def test_pickup_arms_weapon(self, mock_pygame):
+        """Test that touching a power-up switches weapon and reports it"""
+        game = Game()
+        player = game.player
+        PowerUp(player.x + 5, player.y + 5, "spread", game)
+
+        systems.collect_powerups(game)
+
+        assert player.weapon == "spread"
+        assert game.world.tables[PowerUp.archetype].ids == []
+        assert PowerUpCollected("spread") in game.events.pending
+
+    def test_weapon_reverts_when_time_is_up(self, mock_pygame):
+        """Test that the power-up timer puts the default weapon back"""
+        game = Game()
+        arm(game, "laser")
+        arm(game, "rapid")  # A second pickup restarts the clock
+
+        for _ in range(game.timers.ticks(weapons.POWERUP_DURATION) - 1):
+            game.timers.advance()
+        assert game.player.weapon == "rapid"
+
+        game.timers.advance()
+        assert game.player.weapon == "blaster"
+        assert game.player.powerup_timer is None
+
+    def test_kills_sometimes_drop_powerups(self, mock_pygame, monkeypatch):
+        """Test that a destroyed enemy drops a power-up when the dice say so"""
+        game = Game()
+        rolls = iter([0.01, 0.99])
+        monkeypatch.setattr(weapons.random, 'random', lambda: next(rolls))
+
+        drop_powerups(game, [EnemyKilled(300, 200), EnemyKilled(400, 250)])
+
+        table = game.world.tables[PowerUp.archetype]
+        assert table.columns["x"] == [300]
+        assert table.columns["weapon"][0] in weapons.POWERUP_WEAPONS
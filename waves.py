@@ -0,0 +1,50 @@
+from events import WaveCompleted
+
+def calculate_wave_enemies(wave_number):
+    """Calculate number of enemies for a given wave"""
+    return 30 + (wave_number - 1) * 10
+
+def reset_waves(game):
+    """Go back to the first wave"""
+    game.current_wave = 1
+    game.wave_completed = False
+    game.wave_transition = False
+    game.wave_message_timer = None
+    game.spawn_timer = None
+    start_wave(game)
+
+def start_wave(game):
+    """Set up the current wave's enemies.
+
+    Without a level they spawn one every enemy_spawn_rate ticks. In a
+    level the wave is made up of whatever encounters the camera reaches.
+    """
+    game.wave_enemies_spawned = 0
+    game.timers.cancel(game.spawn_timer)
+    if game.level:
+        game.wave_enemies_required = 0
+        return
+    game.wave_enemies_required = calculate_wave_enemies(game.current_wave)
+    game.spawn_timer = game.timers.schedule(
+        game.enemy_spawn_rate, "spawn_enemy", interval=game.enemy_spawn_rate)
+
+def wave_cleared(game):
+    """Whether every enemy of the wave has spawned and been dealt with
+    (level waves start empty until an encounter)"""
+    return (game.wave_enemies_required and game.wave_enemies_spawned >= game.wave_enemies_required
+            and len(game.enemies) == 0)
+
+def complete_wave(game):
+    """Handle wave completion"""
+    game.wave_completed = True
+    game.wave_transition = True
+    game.events.emit(WaveCompleted(game.current_wave))
+    game.wave_message_timer = game.timers.schedule(
+        game.timers.ticks(game.wave_message_duration), "next_wave")
+
+def start_next_wave(game):
+    """Start the next wave"""
+    game.current_wave += 1
+    game.wave_completed = False
+    game.wave_transition = False
+    start_wave(game)
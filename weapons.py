@@ -0,0 +1,47 @@
+import random
+from collections import namedtuple
+from events import ShotFired
+from powerup import PowerUp
+from projectile import Projectile
+
+# cooldown: ticks from one volley until the next can fire
+# automatic: keeps firing while the button is held, not just when pressed
+# pattern: (x offset, y offset, vertical speed) of each projectile in a volley
+Weapon = namedtuple("Weapon", "name cooldown automatic pattern")
+
+WEAPONS = {
+    "blaster": Weapon("blaster", 0, False, ((0, 0, 0),)),
+    "rapid": Weapon("rapid", 4, True, ((0, -6, 0), (0, 6, 0))),
+    "spread": Weapon("spread", 10, True, tuple((0, 0, vy) for vy in (-2, -1.2, -0.5, 0, 0.5, 1.2, 2))),
+    # A solid beam: three rows each tick, each shot overlapping the last
+    "laser": Weapon("laser", 1, True, ((0, -4, 0), (0, 0, 0), (0, 4, 0))),
+}
+DEFAULT_WEAPON = "blaster"
+POWERUP_WEAPONS = ("rapid", "spread", "laser")
+POWERUP_CHANCE = 0.05  # Chance a destroyed enemy drops a power-up
+POWERUP_DURATION = 10000  # Milliseconds a power-up weapon lasts
+
+def spawn_volley(game, weapon, x, y):
+    """Spawn all of a weapon's projectiles for one shot in a single insertion"""
+    pattern = weapon.pattern
+    xs = [x + dx for dx, _, _ in pattern]
+    ys = [y + dy for _, dy, _ in pattern]
+    game.world.spawn_many(Projectile.archetype, x=xs, prev_x=list(xs), y=ys, prev_y=list(ys),
+                          vy=[vy for _, _, vy in pattern])
+    for shot in zip(xs, ys):
+        game.events.emit(ShotFired(*shot))
+
+def arm(game, weapon):
+    """Give the player a power-up weapon until its time runs out"""
+    player = game.player
+    timers = game.timers
+    timers.cancel(player.powerup_timer)
+    player.weapon = weapon
+    player.next_shot = game.tick
+    player.powerup_timer = timers.schedule(timers.ticks(POWERUP_DURATION), "end_powerup", player.id)
+
+def drop_powerups(game, events):
+    """Now and then leave a power-up where an enemy was destroyed"""
+    for event in events:
+        if random.random() < POWERUP_CHANCE:
+            PowerUp(event.x, event.y, random.choice(POWERUP_WEAPONS), game)